@@ -0,0 +1,181 @@
+import os
+import time
+import hashlib
+import tempfile
+import argparse
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+
+from formato_binario import DTYPE_CODIGOS, salvar_binario, carregar_binario
+from mergesort_python import MOTORES, MOTORES_NUMPY, ler_vetor_do_arquivo
+
+# Orçamento padrão da memória usada pelos resultados guardados (bytes)
+ORCAMENTO_PADRAO = 256 * 1024 * 1024
+
+# Bytes passados ao hash por vez (o vetor pode ser um memmap maior que a memória)
+BYTES_BLOCO_HASH = 1 << 24
+
+# Sufixo dos arquivos temporários das gravações no disco
+SUFIXO_TEMPORARIO = '.tmp'
+
+# Tipos aceitos: os inteiros do formato binário, em que os resultados vão para o disco
+DTYPES_ACEITOS = {dtype for dtype in DTYPE_CODIGOS if dtype.kind == 'i'}
+
+# Hash do conteúdo de um vetor: tipo, quantidade e bytes brutos, lidos em blocos
+def hash_vetor(vetor):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f'{vetor.dtype.str}|{len(vetor)}|'.encode())
+    with memoryview(vetor).cast('B') as bruto:
+        for inicio in range(0, len(bruto), BYTES_BLOCO_HASH):
+            h.update(bruto[inicio:inicio + BYTES_BLOCO_HASH])
+    return h.hexdigest()
+
+# Front end memoizado de ordenação: o resultado ordenado de cada vetor é guardado
+# pelo hash do conteúdo em um LRU com orçamento de bytes; os resultados
+# despejados vão para arquivos .bin em diretorio (se houver) e voltam à memória
+# quando pedidos de novo. O benchmark não passa por aqui: medir_tempo_execucao
+# chama os motores diretamente
+class CacheOrdenacao:
+    def __init__(self, motor=None, orcamento_bytes=ORCAMENTO_PADRAO, diretorio=None):
+        if motor is None:
+            motor = 'c' if 'c' in MOTORES else 'numpy'
+        self.motor = motor
+        self.orcamento_bytes = orcamento_bytes
+        self.diretorio = diretorio
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+        # hash -> ndarray ordenado e somente leitura, do menos ao mais recente
+        self.memoria = OrderedDict()
+        self.bytes_memoria = 0
+        self.ativo = True
+        self.contadores = {'acertos': 0, 'acertos_disco': 0, 'faltas': 0,
+                           'despejos': 0, 'gravacoes_disco': 0, 'ignorados': 0}
+
+    # Contadores e ocupação atual
+    def estatisticas(self):
+        return dict(self.contadores, bytes_memoria=self.bytes_memoria,
+                    entradas_memoria=len(self.memoria))
+
+    # Desliga o cache temporariamente (as chamadas ordenam sempre, sem consultar nem guardar)
+    @contextmanager
+    def desativado(self):
+        anterior, self.ativo = self.ativo, False
+        try:
+            yield self
+        finally:
+            self.ativo = anterior
+
+    def _caminho(self, chave):
+        return os.path.join(self.diretorio, f'{chave}.bin')
+
+    # Ordena uma cópia do vetor com o motor configurado
+    def _ordenar(self, vetor):
+        if self.motor in MOTORES_NUMPY:
+            resultado = np.array(vetor)
+            MOTORES[self.motor](resultado)
+            return resultado
+        lista = vetor.tolist()
+        MOTORES[self.motor](lista)
+        return np.array(lista, dtype=vetor.dtype)
+
+    # Guarda o resultado na memória e despeja os menos recentes acima do orçamento
+    def _guardar(self, chave, resultado):
+        resultado.flags.writeable = False
+        self.memoria[chave] = resultado
+        self.bytes_memoria += resultado.nbytes
+        while self.bytes_memoria > self.orcamento_bytes and self.memoria:
+            antiga, despejado = self.memoria.popitem(last=False)
+            self.bytes_memoria -= despejado.nbytes
+            self.contadores['despejos'] += 1
+            if self.diretorio and not os.path.exists(self._caminho(antiga)):
+                self._gravar(antiga, despejado)
+
+    # Grava o resultado em um arquivo temporário de nome único e renomeia, para
+    # que processos que compartilham o diretório não escrevam no mesmo arquivo
+    def _gravar(self, chave, resultado):
+        with tempfile.NamedTemporaryFile(dir=self.diretorio, prefix=f'{chave}.', suffix=SUFIXO_TEMPORARIO,
+                                         delete=False) as f:
+            temporario = f.name
+        try:
+            salvar_binario(resultado, temporario, ordenado=True)
+            os.replace(temporario, self._caminho(chave))
+        except BaseException:
+            os.remove(temporario)
+            raise
+        self.contadores['gravacoes_disco'] += 1
+
+    # Retorna o vetor ordenado. Com copia=False, o acerto devolve o próprio
+    # resultado guardado, somente leitura, sem cópia
+    def ordenar(self, vetor, copia=True):
+        vetor = np.ascontiguousarray(vetor if isinstance(vetor, np.ndarray)
+                                     else np.asarray(vetor, dtype=np.int64))
+        if vetor.dtype not in DTYPES_ACEITOS:
+            raise TypeError(f"Tipo {vetor.dtype} não suportado; use int32 ou int64")
+
+        if not self.ativo:
+            self.contadores['ignorados'] += 1
+            return self._ordenar(vetor)
+
+        chave = hash_vetor(vetor)
+        resultado = self.memoria.get(chave)
+        if resultado is not None:
+            self.memoria.move_to_end(chave)
+            self.contadores['acertos'] += 1
+        elif self.diretorio and os.path.exists(self._caminho(chave)):
+            # Volta do disco para a memória
+            resultado = np.array(carregar_binario(self._caminho(chave)), dtype=vetor.dtype)
+            self._guardar(chave, resultado)
+            self.contadores['acertos_disco'] += 1
+        else:
+            resultado = self._ordenar(vetor)
+            self._guardar(chave, resultado)
+            self.contadores['faltas'] += 1
+        return resultado.copy() if copia else resultado
+
+    # Remove da memória e do disco todos os resultados guardados, inclusive os
+    # arquivos temporários deixados por gravações interrompidas
+    def limpar(self):
+        self.memoria.clear()
+        self.bytes_memoria = 0
+        if self.diretorio:
+            for nome in os.listdir(self.diretorio):
+                if nome.endswith(('.bin', SUFIXO_TEMPORARIO)):
+                    try:
+                        os.remove(os.path.join(self.diretorio, nome))
+                    except FileNotFoundError:
+                        # Outro processo acabou de renomear ou remover o arquivo
+                        pass
+
+def main():
+    parser = argparse.ArgumentParser(description='Mede o cache de resultados ordenados (faltas, acertos e despejos).')
+    parser.add_argument('arquivos', nargs='+', help='Arquivos de entrada (texto ou .bin)')
+    parser.add_argument('--motor', choices=list(MOTORES), default=None,
+                        help='Motor usado nas faltas (padrão: c, se compilado, senão numpy)')
+    parser.add_argument('--orcamento-mb', type=float, default=ORCAMENTO_PADRAO / 2 ** 20,
+                        help='Orçamento de memória do cache em MiB')
+    parser.add_argument('--diretorio', default=None,
+                        help='Diretório dos resultados despejados para o disco')
+    parser.add_argument('--rodadas', type=int, default=3,
+                        help='Vezes que cada arquivo é ordenado')
+    args = parser.parse_args()
+
+    cache = CacheOrdenacao(args.motor, int(args.orcamento_mb * 2 ** 20), args.diretorio)
+    vetores = [np.asarray(ler_vetor_do_arquivo(arquivo), dtype=np.int64) for arquivo in args.arquivos]
+    for rodada in range(args.rodadas):
+        inicio = time.perf_counter()
+        for vetor in vetores:
+            cache.ordenar(vetor, copia=False)
+        print(f"Rodada {rodada + 1}: {time.perf_counter() - inicio:.4f} s")
+
+    with cache.desativado():
+        inicio = time.perf_counter()
+        for vetor in vetores:
+            cache.ordenar(vetor)
+        print(f"Sem cache: {time.perf_counter() - inicio:.4f} s")
+
+    print("Estatísticas:", cache.estatisticas())
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+import os
+import sys
+import json
+import time
+import types
+import hashlib
+import inspect
+import platform
+
+import pandas as pd
+
+# Armazém de resultados do benchmark, endereçado pelo conteúdo:
+# chave = hash(conteúdo da entrada, motor, código do motor, execuções,
+#              configuração da medição, máquina)
+ARQUIVO_CACHE = 'cache_resultados.json'
+
+# Hashes de arquivos já calculados nesta execução: caminho -> (mtime, tamanho, hash)
+_hashes_arquivos = {}
+
+# SHA-256 do conteúdo de um arquivo, lido em blocos
+def hash_arquivo(caminho):
+    info = os.stat(caminho)
+    memo = _hashes_arquivos.get(caminho)
+    if memo and memo[:2] == (info.st_mtime_ns, info.st_size):
+        return memo[2]
+
+    h = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(1 << 20), b''):
+            h.update(bloco)
+    _hashes_arquivos[caminho] = (info.st_mtime_ns, info.st_size, h.hexdigest())
+    return h.hexdigest()
+
+# Coleta o código-fonte de uma função e, recursivamente, das funções globais que
+# ela usa; assim só mudanças que afetam o motor invalidam seus resultados
+def _coletar_fontes(funcao, fontes):
+    if funcao in fontes or not isinstance(funcao, types.FunctionType):
+        return
+    try:
+        fontes[funcao] = inspect.getsource(funcao)
+    except (OSError, TypeError):
+        fontes[funcao] = funcao.__qualname__
+
+    codigos = [funcao.__code__]
+    while codigos:
+        codigo = codigos.pop()
+        for nome in codigo.co_names:
+            valor = funcao.__globals__.get(nome)
+            if isinstance(valor, types.FunctionType):
+                _coletar_fontes(valor, fontes)
+            elif isinstance(valor, dict) and all(
+                    isinstance(v, (int, float, str, bytes, tuple)) for v in valor.values()):
+                # Tabelas de constantes entram pelo repr
+                fontes[(funcao, nome)] = f'{nome}={sorted(map(repr, valor.items()))}'
+            elif isinstance(valor, (int, float, str, bytes, tuple)):
+                fontes[(funcao, nome)] = f'{nome}={valor!r}'
+        codigos.extend(c for c in codigo.co_consts if isinstance(c, types.CodeType))
+
+# Hash do código de um motor (função ou lambda) e de tudo que ele chama; as
+# demais funções (o código que mede e resume os tempos) entram no mesmo hash
+def hash_codigo(*funcoes):
+    fontes = {}
+    for funcao in funcoes:
+        _coletar_fontes(funcao, fontes)
+    h = hashlib.sha256()
+    for fonte in sorted(fontes.values()):
+        h.update(fonte.encode())
+    return h.hexdigest()
+
+# Impressão digital da máquina: resultados de outras máquinas não são reaproveitados
+def impressao_maquina():
+    partes = [platform.node(), platform.machine(), platform.processor(),
+              platform.system(), platform.python_version(), str(os.cpu_count())]
+    return hashlib.sha256('|'.join(partes).encode()).hexdigest()[:16]
+
+# Monta a chave de um resultado
+def chave_resultado(hash_entrada, motor, hash_motor, num_execucoes, configuracao=None):
+    partes = {
+        'entrada': hash_entrada,
+        'motor': motor,
+        'codigo': hash_motor,
+        'execucoes': num_execucoes,
+        'configuracao': configuracao or {},
+        'maquina': impressao_maquina()
+    }
+    return hashlib.sha256(json.dumps(partes, sort_keys=True).encode()).hexdigest()
+
+def carregar_cache(caminho=ARQUIVO_CACHE):
+    try:
+        with open(caminho) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+# Grava em arquivo temporário e renomeia, para não corromper o armazém
+def salvar_cache(cache, caminho=ARQUIVO_CACHE):
+    temporario = caminho + '.tmp'
+    with open(temporario, 'w') as f:
+        json.dump(cache, f)
+    os.replace(temporario, caminho)
+
+# Registra um resultado (linha do CSV detalhado + tempos individuais)
+def registrar(cache, chave, linguagem, resultado, tempos):
+    cache[chave] = {
+        'linguagem': linguagem,
+        'maquina': impressao_maquina(),
+        'criado_em': time.time(),
+        'resultado': resultado,
+        'tempos': tempos
+    }
+
+# Importa os CSVs gerados pelo programa em C para o armazém
+def importar_resultados_c(arquivo_detalhado='resultados_mergesort_c_detalhado.csv',
+                          arquivo_tempos='tempos_individuais_mergesort_c.csv',
+                          codigo_c='mergesort_c.c', caminho=ARQUIVO_CACHE):
+    df = pd.read_csv(arquivo_detalhado)
+    df_tempos = pd.read_csv(arquivo_tempos).set_index('Arquivo')
+    hash_c = hash_arquivo(codigo_c)
+    cache = carregar_cache(caminho)
+
+    importados = 0
+    for resultado in df.to_dict('records'):
+        arquivo = resultado['Arquivo']
+        if resultado['Tipo'] == 'erro_leitura' or not os.path.exists(arquivo):
+            continue
+        tempos = df_tempos.loc[arquivo].filter(like='Execucao_').dropna().tolist()
+        chave = chave_resultado(hash_arquivo(arquivo), 'c', hash_c, len(tempos))
+        registrar(cache, chave, 'c', resultado, tempos)
+        importados += 1
+
+    salvar_cache(cache, caminho)
+    print(f"{importados} resultado(s) do C importado(s) para {caminho}")
+
+def main():
+    # Uso: python cache_resultados.py importar-c
+    if sys.argv[1:] == ['importar-c']:
+        importar_resultados_c()
+    else:
+        print("Uso: python cache_resultados.py importar-c")
+
+if __name__ == '__main__':
+    main()
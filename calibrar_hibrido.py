@@ -0,0 +1,55 @@
+import time
+import argparse
+import statistics
+
+from gerar_entradas import (gerar_entrada_aleatoria, gerar_entrada_ordenada,
+                            gerar_entrada_quase_ordenada, gerar_entrada_com_duplicatas,
+                            gerar_lista)
+from mergesort_python import mergesort_hibrido, salvar_perfil, ARQUIVO_PERFIL
+
+# Limiares testados por padrão (0 equivale ao MergeSort recursivo puro)
+LIMIARES_PADRAO = [0, 4, 8, 12, 16, 24, 32, 48, 64, 96, 128]
+
+# Mede a mediana do tempo total para ordenar todas as entradas com um limiar
+def medir_limiar(entradas, limiar, num_execucoes):
+    tempos = []
+    for _ in range(num_execucoes):
+        total = 0.0
+        for entrada in entradas:
+            copia = entrada.copy()
+            inicio = time.perf_counter()
+            mergesort_hibrido(copia, 0, len(copia) - 1, limiar)
+            total += time.perf_counter() - inicio
+        tempos.append(total)
+    return statistics.median(tempos)
+
+def main():
+    parser = argparse.ArgumentParser(description='Calibra o limiar de inserção binária do MergeSort híbrido nesta máquina.')
+    parser.add_argument('--tamanho', type=int, default=20000,
+                        help='Tamanho de cada entrada de calibração')
+    parser.add_argument('--limiares', type=int, nargs='+', default=LIMIARES_PADRAO,
+                        help='Limiares a testar')
+    parser.add_argument('--execucoes', type=int, default=5,
+                        help='Execuções por limiar (usa a mediana)')
+    args = parser.parse_args()
+
+    # Mesmas famílias de entrada do benchmark, geradas em memória
+    entradas = [gerar_lista(pedacos) for pedacos in [
+        gerar_entrada_aleatoria(args.tamanho),
+        gerar_entrada_ordenada(args.tamanho, 'crescente'),
+        gerar_entrada_ordenada(args.tamanho, 'decrescente'),
+        gerar_entrada_quase_ordenada(args.tamanho),
+        gerar_entrada_com_duplicatas(args.tamanho)
+    ]]
+
+    resultados = {}
+    for limiar in args.limiares:
+        resultados[limiar] = medir_limiar(entradas, limiar, args.execucoes)
+        print(f"Limiar {limiar:4d}: {resultados[limiar]:.5f} s")
+
+    melhor = min(resultados, key=resultados.get)
+    salvar_perfil({'limiar_insercao': melhor})
+    print(f"\nMelhor limiar: {melhor} (salvo em {ARQUIVO_PERFIL})")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+import time
+import random
+import argparse
+from bisect import bisect_left
+
+from mergesort_python import merge_para, mergesort_natural
+from intercalacao_kway import intercalar_kway
+
+# Capacidade do nível 0; o nível i guarda até TAMANHO_LOTE_BASE * 2^i elementos
+TAMANHO_LOTE_BASE = 1024
+
+# Intercala as listas ordenadas a e b (a primeiro nos empates) com merge_para
+def intercalar_listas(a, b):
+    juntas = a + b
+    destino = [None] * len(juntas)
+    merge_para(juntas, destino, 0, len(a), len(juntas))
+    return destino
+
+# Coleção ordenada incremental em níveis, no estilo de uma LSM tree: cada lote
+# novo é ordenado e intercalado com os níveis menores que estiverem ocupados,
+# como um contador binário, o que custa O(log n) amortizado por elemento.
+# Consultas percorrem os níveis com a intercalação k-way; valores iguais saem
+# na ordem de inserção
+class ColecaoOrdenada:
+    def __init__(self, valores=None, ordenados=False, tamanho_lote_base=TAMANHO_LOTE_BASE):
+        self.tamanho_lote_base = tamanho_lote_base
+        # niveis[0] é o mais novo; níveis vazios são listas vazias
+        self.niveis = []
+        self.tamanho = 0
+        if valores:
+            self.inserir_lote(valores, ordenados)
+
+    def capacidade(self, nivel):
+        return self.tamanho_lote_base << nivel
+
+    # Ordena o lote (a menos que já venha ordenado) e o leva ao primeiro nível
+    # livre com capacidade, absorvendo os níveis ocupados no caminho
+    def inserir_lote(self, valores, ordenados=False):
+        run = list(valores)
+        if not run:
+            return
+        if not ordenados:
+            mergesort_natural(run)
+        self.tamanho += len(run)
+
+        nivel = 0
+        while True:
+            if nivel == len(self.niveis):
+                self.niveis.append([])
+            if self.niveis[nivel]:
+                # Dados do nível são mais antigos que o run: vão à esquerda
+                run = intercalar_listas(self.niveis[nivel], run)
+                self.niveis[nivel] = []
+            elif len(run) <= self.capacidade(nivel):
+                self.niveis[nivel] = run
+                return
+            nivel += 1
+
+    def inserir(self, valor):
+        self.inserir_lote([valor], ordenados=True)
+
+    # Níveis ocupados do mais antigo para o mais novo (ordem de desempate)
+    def _niveis_por_idade(self):
+        return [nivel for nivel in reversed(self.niveis) if nivel]
+
+    def __len__(self):
+        return self.tamanho
+
+    def __iter__(self):
+        return intercalar_kway(*self._niveis_por_idade())
+
+    def __contains__(self, valor):
+        for nivel in self.niveis:
+            pos = bisect_left(nivel, valor)
+            if pos < len(nivel) and not (valor < nivel[pos]):
+                return True
+        return False
+
+    # Elementos em [inicio, fim) em ordem, sem materializar os níveis
+    # (None deixa o lado correspondente aberto)
+    def intervalo(self, inicio=None, fim=None):
+        trechos = []
+        for nivel in self._niveis_por_idade():
+            a = 0 if inicio is None else bisect_left(nivel, inicio)
+            b = len(nivel) if fim is None else bisect_left(nivel, fim)
+            trechos.append(map(nivel.__getitem__, range(a, b)))
+        return intercalar_kway(*trechos)
+
+    # Quantidade de elementos em [inicio, fim), o mesmo trecho de intervalo(),
+    # com buscas binárias por nível (None deixa o lado correspondente aberto)
+    def contar(self, inicio=None, fim=None):
+        total = 0
+        for nivel in self.niveis:
+            a = 0 if inicio is None else bisect_left(nivel, inicio)
+            b = len(nivel) if fim is None else bisect_left(nivel, fim)
+            total += max(0, b - a)
+        return total
+
+    # Compactação explícita: junta todos os níveis em um só
+    def compactar(self):
+        if sum(1 for nivel in self.niveis if nivel) <= 1:
+            return
+        todos = list(iter(self))
+        self.niveis = []
+        nivel = 0
+        while self.capacidade(nivel) < len(todos):
+            self.niveis.append([])
+            nivel += 1
+        self.niveis.append(todos)
+
+def main():
+    parser = argparse.ArgumentParser(description='Compara a coleção ordenada em níveis com reordenar tudo a cada lote.')
+    parser.add_argument('--tamanho', type=int, default=1_000_000,
+                        help='Elementos iniciais (já ordenados)')
+    parser.add_argument('--lote', type=int, default=10_000,
+                        help='Elementos por lote inserido')
+    parser.add_argument('--lotes', type=int, default=20,
+                        help='Número de lotes inseridos')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    base = sorted(rng.randrange(10 ** 9) for _ in range(args.tamanho))
+    lotes = [[rng.randrange(10 ** 9) for _ in range(args.lote)] for _ in range(args.lotes)]
+
+    colecao = ColecaoOrdenada(base, ordenados=True)
+    inicio = time.perf_counter()
+    for lote in lotes:
+        colecao.inserir_lote(lote)
+    tempo_colecao = time.perf_counter() - inicio
+
+    vetor = list(base)
+    inicio = time.perf_counter()
+    for lote in lotes:
+        vetor.extend(lote)
+        mergesort_natural(vetor)
+    tempo_reordenar = time.perf_counter() - inicio
+
+    print(f"Coleção em níveis: {tempo_colecao:.3f} s ({tempo_colecao / args.lotes * 1000:.1f} ms por lote)")
+    print(f"Reordenar tudo (natural): {tempo_reordenar:.3f} s ({tempo_reordenar / args.lotes * 1000:.1f} ms por lote)")
+
+    inicio = time.perf_counter()
+    colecao.compactar()
+    print(f"Compactação: {time.perf_counter() - inicio:.3f} s")
+
+if __name__ == "__main__":
+    main()
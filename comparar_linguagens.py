@@ -2,12 +2,36 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 
+import resultados_colunares
+
 # Função para carregar dados dos resultados
 def carregar_dados(arquivo_c='resultados_mergesort_c_detalhado.csv', 
                    arquivo_python='resultados_mergesort_python_detalhado.csv'):
     try:
-        df_c = pd.read_csv(arquivo_c)
-        df_python = pd.read_csv(arquivo_python)
+        # Usa o armazém colunar quando houver dados (só as partições dos motores
+        # comparados); senão, os CSVs
+        df_python = resultados_colunares.carregar_resumo('python', motores=['recursivo', 'c'])
+        if df_python is None:
+            df_python = pd.read_csv(arquivo_python)
+        
+        if 'Motor' in df_python.columns and (df_python['Motor'] == 'c').any():
+            # O motor 'c' medido no mesmo harness (mesmo processo e cronômetro)
+            # tem prioridade sobre o executável em C
+            df_c = df_python[df_python['Motor'] == 'c']
+        else:
+            df_c = resultados_colunares.carregar_resumo('c')
+            if df_c is None:
+                df_c = pd.read_csv(arquivo_c)
+        
+        # Compara C apenas com o motor recursivo, equivalente ao código em C
+        if 'Motor' in df_python.columns:
+            df_python = df_python[df_python['Motor'] == 'recursivo']
+        
+        # Mantém apenas as entradas (tipo e tamanho) medidas nas duas linguagens
+        comuns = df_c[['Tipo', 'Tamanho']].drop_duplicates().merge(
+            df_python[['Tipo', 'Tamanho']].drop_duplicates())
+        df_c = df_c.merge(comuns)
+        df_python = df_python.merge(comuns)
         return df_c, df_python
     except Exception as e:
         print(f"Erro ao carregar arquivos: {e}")
@@ -0,0 +1,119 @@
+// Extensão opcional que conta as alocações feitas pelo alocador do Python
+// (domínios MEM e OBJ): número de chamadas e total de bytes pedidos.
+// O domínio RAW não é contado porque o pymalloc repassa a ele os blocos
+// grandes, o que contaria essas alocações duas vezes.
+//
+// Compilação:
+//   gcc -O2 -shared -fPIC $(python3-config --includes) contador_alocacoes.c -o contador_alocacoes$(python3-config --extension-suffix)
+//
+// Buffers de dados do NumPy usam o alocador próprio do NumPy e não passam
+// por aqui; eles aparecem apenas no pico do tracemalloc.
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdatomic.h>
+
+static atomic_ullong alocacoes;
+static atomic_ullong bytes_alocados;
+static int instalado = 0;
+
+static PyMemAllocatorEx original_mem, original_obj;
+
+static void registrar(size_t tamanho) {
+    atomic_fetch_add_explicit(&alocacoes, 1, memory_order_relaxed);
+    atomic_fetch_add_explicit(&bytes_alocados, tamanho, memory_order_relaxed);
+}
+
+static void* contar_malloc(void* ctx, size_t tamanho) {
+    PyMemAllocatorEx* original = (PyMemAllocatorEx*)ctx;
+    registrar(tamanho);
+    return original->malloc(original->ctx, tamanho);
+}
+
+static void* contar_calloc(void* ctx, size_t nelem, size_t tamanho_elem) {
+    PyMemAllocatorEx* original = (PyMemAllocatorEx*)ctx;
+    registrar(nelem * tamanho_elem);
+    return original->calloc(original->ctx, nelem, tamanho_elem);
+}
+
+static void* contar_realloc(void* ctx, void* ptr, size_t novo_tamanho) {
+    PyMemAllocatorEx* original = (PyMemAllocatorEx*)ctx;
+    registrar(novo_tamanho);
+    return original->realloc(original->ctx, ptr, novo_tamanho);
+}
+
+static void repassar_free(void* ctx, void* ptr) {
+    PyMemAllocatorEx* original = (PyMemAllocatorEx*)ctx;
+    original->free(original->ctx, ptr);
+}
+
+static void instalar_dominio(PyMemAllocatorDomain dominio, PyMemAllocatorEx* original) {
+    PyMemAllocatorEx contador;
+    PyMem_GetAllocator(dominio, original);
+    contador.ctx = original;
+    contador.malloc = contar_malloc;
+    contador.calloc = contar_calloc;
+    contador.realloc = contar_realloc;
+    contador.free = repassar_free;
+    PyMem_SetAllocator(dominio, &contador);
+}
+
+// Instala os contadores (uma única vez até o próximo desinstalar())
+static PyObject* instalar(PyObject* self, PyObject* args) {
+    if (!instalado) {
+        instalar_dominio(PYMEM_DOMAIN_MEM, &original_mem);
+        instalar_dominio(PYMEM_DOMAIN_OBJ, &original_obj);
+        instalado = 1;
+    }
+    Py_RETURN_NONE;
+}
+
+// Restaura os alocadores originais, para que as execuções seguintes não paguem
+// pelos contadores. Só é possível com os contadores no topo da cadeia: quem se
+// instalou depois (como o tracemalloc) precisa ser removido antes
+static PyObject* desinstalar(PyObject* self, PyObject* args) {
+    PyMemAllocatorEx atual_mem, atual_obj;
+    if (!instalado) {
+        Py_RETURN_NONE;
+    }
+    PyMem_GetAllocator(PYMEM_DOMAIN_MEM, &atual_mem);
+    PyMem_GetAllocator(PYMEM_DOMAIN_OBJ, &atual_obj);
+    if (atual_mem.malloc != contar_malloc || atual_obj.malloc != contar_malloc) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "outro alocador foi instalado sobre os contadores; remova-o antes");
+        return NULL;
+    }
+    PyMem_SetAllocator(PYMEM_DOMAIN_MEM, &original_mem);
+    PyMem_SetAllocator(PYMEM_DOMAIN_OBJ, &original_obj);
+    instalado = 0;
+    Py_RETURN_NONE;
+}
+
+static PyObject* zerar(PyObject* self, PyObject* args) {
+    atomic_store(&alocacoes, 0);
+    atomic_store(&bytes_alocados, 0);
+    Py_RETURN_NONE;
+}
+
+// Retorna (número de alocações, bytes alocados) desde o último zerar()
+static PyObject* ler(PyObject* self, PyObject* args) {
+    unsigned long long n = atomic_load(&alocacoes);
+    unsigned long long b = atomic_load(&bytes_alocados);
+    return Py_BuildValue("(KK)", n, b);
+}
+
+static PyMethodDef metodos[] = {
+    {"instalar", instalar, METH_NOARGS, "Instala os contadores no alocador do Python."},
+    {"desinstalar", desinstalar, METH_NOARGS, "Restaura os alocadores originais do Python."},
+    {"zerar", zerar, METH_NOARGS, "Zera os contadores."},
+    {"ler", ler, METH_NOARGS, "Retorna (alocacoes, bytes_alocados)."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef modulo = {
+    PyModuleDef_HEAD_INIT, "contador_alocacoes",
+    "Contadores de alocações do alocador do Python.", -1, metodos
+};
+
+PyMODINIT_FUNC PyInit_contador_alocacoes(void) {
+    return PyModule_Create(&modulo);
+}
@@ -0,0 +1,204 @@
+import io
+import os
+import sys
+import struct
+
+import numpy as np
+
+# Formato binário dos vetores (.bin), little-endian:
+#   cabeçalho de 16 bytes: magic 'MSRT', versão (u8), tipo (u8), flags (u8),
+#   1 byte de preenchimento e quantidade de elementos (u64)
+#   seguido dos elementos brutos, alinhados em 16 bytes para o memmap
+MAGIC = b'MSRT'
+VERSAO = 1
+FORMATO_CABECALHO = '<4sBBBxQ'
+TAMANHO_CABECALHO = struct.calcsize(FORMATO_CABECALHO)
+
+# Códigos de tipo gravados no cabeçalho
+CODIGOS_DTYPE = {
+    1: np.dtype('<i4'),
+    2: np.dtype('<i8'),
+    3: np.dtype('<f8'),
+}
+DTYPE_CODIGOS = {dtype: codigo for codigo, dtype in CODIGOS_DTYPE.items()}
+
+# Bit de flag indicando que o vetor está em ordem não decrescente
+FLAG_ORDENADO = 1
+
+# Indica se o nome de arquivo usa o formato binário
+def eh_binario(nome_arquivo):
+    return nome_arquivo.endswith('.bin')
+
+# Converte texto (um número por linha) em vetor; um token inválido gera
+# ValueError em vez de encerrar a conversão em silêncio
+def converter_texto(dados, dtype=np.int64):
+    if not dados.strip():
+        return np.empty(0, dtype=dtype)
+    return np.loadtxt(io.BytesIO(dados), dtype=dtype, comments=None, ndmin=1).reshape(-1)
+
+# Lê o arquivo texto (um inteiro por linha) em pedaços de até bytes_leitura
+# bytes, sem quebrar números entre pedaços
+def ler_pedacos_texto(nome_arquivo, bytes_leitura, dtype=np.int64):
+    with open(nome_arquivo, 'rb') as f:
+        sobra = b''
+        while True:
+            dados = f.read(bytes_leitura)
+            if not dados:
+                break
+            dados = sobra + dados
+            corte = dados.rfind(b'\n') + 1
+            if corte == 0:
+                sobra = dados
+                continue
+            sobra = dados[corte:]
+            dados = dados[:corte]
+            # Libera o texto antes de entregar o pedaço convertido
+            pedaco = converter_texto(dados, dtype)
+            del dados
+            yield pedaco
+        if sobra.strip():
+            yield converter_texto(sobra, dtype)
+
+def ler_cabecalho(nome_arquivo):
+    """
+    Lê o cabeçalho de um arquivo binário de vetor.
+
+    :param nome_arquivo: Caminho do arquivo .bin
+    :return: Dicionário com 'dtype', 'quantidade' e 'ordenado'
+    """
+    with open(nome_arquivo, 'rb') as f:
+        dados = f.read(TAMANHO_CABECALHO)
+    if len(dados) < TAMANHO_CABECALHO:
+        raise ValueError(f"Arquivo {nome_arquivo} é curto demais para o formato binário")
+
+    magic, versao, codigo, flags, quantidade = struct.unpack(FORMATO_CABECALHO, dados)
+    if magic != MAGIC:
+        raise ValueError(f"Arquivo {nome_arquivo} não está no formato binário de vetores")
+    if versao != VERSAO:
+        raise ValueError(f"Versão {versao} do formato binário não suportada")
+    if codigo not in CODIGOS_DTYPE:
+        raise ValueError(f"Código de tipo {codigo} desconhecido em {nome_arquivo}")
+
+    return {
+        'dtype': CODIGOS_DTYPE[codigo],
+        'quantidade': quantidade,
+        'ordenado': bool(flags & FLAG_ORDENADO)
+    }
+
+def escrever_cabecalho(f, dtype, quantidade, ordenado):
+    """
+    Escreve o cabeçalho na posição atual do arquivo.
+
+    :param f: Arquivo aberto em modo binário
+    :param dtype: Tipo dos elementos (int32, int64 ou float64)
+    :param quantidade: Número de elementos
+    :param ordenado: Se o vetor está em ordem não decrescente
+    """
+    dtype = np.dtype(dtype).newbyteorder('<')
+    if dtype not in DTYPE_CODIGOS:
+        raise TypeError(f"Tipo {dtype} não suportado; use int32, int64 ou float64")
+    flags = FLAG_ORDENADO if ordenado else 0
+    f.write(struct.pack(FORMATO_CABECALHO, MAGIC, VERSAO, DTYPE_CODIGOS[dtype], flags, quantidade))
+
+def salvar_binario(vetor, nome_arquivo, dtype=np.int64, ordenado=None):
+    """
+    Salva um vetor no formato binário (usado também para a saída ordenada).
+
+    :param vetor: Lista ou numpy.ndarray a ser salvo
+    :param nome_arquivo: Nome do arquivo de saída
+    :param dtype: Tipo usado quando vetor não é um ndarray
+    :param ordenado: Flag de ordenação; se None, é verificada no próprio vetor
+    """
+    if not isinstance(vetor, np.ndarray):
+        vetor = np.asarray(vetor, dtype=dtype)
+    vetor = vetor.astype(vetor.dtype.newbyteorder('<'), copy=False)
+    if ordenado is None:
+        ordenado = bool(np.all(vetor[:-1] <= vetor[1:]))
+
+    with open(nome_arquivo, 'wb') as f:
+        escrever_cabecalho(f, vetor.dtype, len(vetor), ordenado)
+        vetor.tofile(f)
+
+def carregar_binario(nome_arquivo, modo='r'):
+    """
+    Mapeia o arquivo binário em memória, sem copiar os dados.
+
+    :param nome_arquivo: Caminho do arquivo .bin
+    :param modo: Modo do memmap ('r' somente leitura, 'r+' leitura e escrita, 'c' cópia na escrita)
+    :return: numpy.memmap com os elementos
+    """
+    cabecalho = ler_cabecalho(nome_arquivo)
+    if cabecalho['quantidade'] == 0:
+        # memmap não aceita regiões vazias
+        return np.empty(0, dtype=cabecalho['dtype'])
+    return np.memmap(nome_arquivo, dtype=cabecalho['dtype'], mode=modo,
+                     offset=TAMANHO_CABECALHO, shape=(cabecalho['quantidade'],))
+
+def escrever_pedaco_texto(f, pedaco):
+    """
+    Escreve um pedaço de inteiros em texto, um por linha, com uma única escrita.
+
+    :param f: Arquivo aberto em modo binário
+    :param pedaco: numpy.ndarray de inteiros
+    """
+    if len(pedaco):
+        f.write('\n'.join(map(str, pedaco.tolist())).encode())
+        f.write(b'\n')
+
+def salvar_binario_em_pedacos(pedacos, nome_arquivo, dtype=np.int64):
+    """
+    Salva no formato binário um vetor produzido em pedaços, sem mantê-lo inteiro na memória.
+
+    :param pedacos: Iterável de numpy.ndarray, na ordem do vetor
+    :param nome_arquivo: Nome do arquivo de saída
+    :param dtype: Tipo dos elementos no arquivo binário
+    :return: Quantidade de elementos gravados
+    """
+    quantidade = 0
+    ordenado = True
+    ultimo = None
+    with open(nome_arquivo, 'wb') as f:
+        # Cabeçalho provisório; quantidade e flag só são conhecidas no fim
+        escrever_cabecalho(f, dtype, 0, False)
+        for pedaco in pedacos:
+            pedaco = pedaco.astype(np.dtype(dtype).newbyteorder('<'), copy=False)
+            if len(pedaco):
+                if ordenado and ((ultimo is not None and pedaco[0] < ultimo) or
+                                 not np.all(pedaco[:-1] <= pedaco[1:])):
+                    ordenado = False
+                ultimo = pedaco[-1]
+            pedaco.tofile(f)
+            quantidade += len(pedaco)
+        f.seek(0)
+        escrever_cabecalho(f, dtype, quantidade, ordenado)
+    return quantidade
+
+def converter_texto_para_binario(arquivo_texto, arquivo_binario=None, dtype=np.int64,
+                                 bytes_leitura=64 * 1024 * 1024):
+    """
+    Converte um arquivo texto (um número por linha) para o formato binário, em fluxo.
+
+    :param arquivo_texto: Arquivo .txt de entrada
+    :param arquivo_binario: Arquivo .bin de saída (padrão: mesmo nome com .bin)
+    :param dtype: Tipo dos elementos no arquivo binário
+    :param bytes_leitura: Tamanho de cada pedaço lido do texto
+    :return: Nome do arquivo binário gerado
+    """
+    if arquivo_binario is None:
+        arquivo_binario = os.path.splitext(arquivo_texto)[0] + '.bin'
+
+    salvar_binario_em_pedacos(ler_pedacos_texto(arquivo_texto, bytes_leitura, dtype),
+                              arquivo_binario, dtype)
+    return arquivo_binario
+
+def main():
+    # Converte os arquivos texto passados na linha de comando
+    # (ou todos os entrada_*.txt do diretório atual)
+    arquivos = sys.argv[1:] or sorted(a for a in os.listdir('.')
+                                      if a.startswith('entrada_') and a.endswith('.txt'))
+    for arquivo in arquivos:
+        destino = converter_texto_para_binario(arquivo)
+        print(f"{arquivo} -> {destino}")
+
+if __name__ == '__main__':
+    main()
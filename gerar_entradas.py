@@ -1,117 +1,558 @@
-import random
 import numpy as np
 import matplotlib.pyplot as plt
 import os
+import re
+import math
+import zlib
 import time
+import json
+import argparse
+from formato_binario import eh_binario, salvar_binario_em_pedacos, escrever_pedaco_texto
+from cache_resultados import hash_arquivo
 
-def gerar_entrada_aleatoria(tamanho, limite_inferior=0, limite_superior=1000000):
+# Parâmetros e hash do conteúdo das entradas geradas, para detectar arquivos
+# alterados, truncados ou gerados com outros parâmetros
+ARQUIVO_MANIFESTO = 'manifesto_entradas.json'
+
+# Versão dos geradores; deve mudar sempre que a mesma semente passar a produzir
+# outro conteúdo, para que os arquivos antigos sejam gerados novamente
+VERSAO_GERADOR = 2
+
+# Elementos produzidos por pedaço; o conteúdo gerado depende da semente e deste valor
+TAMANHO_BLOCO = 1 << 20
+
+# Semente padrão das entradas, para que os conjuntos sejam iguais em qualquer máquina
+SEMENTE_PADRAO = 0
+
+# Percentuais usados nas varreduras de desordem e de duplicatas
+PERCENTUAIS_DESORDEM = [1, 5, 25, 50]
+PERCENTUAIS_DUPLICATAS = [50, 90, 99]
+
+def limites_blocos(tamanho, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Percorre os intervalos [inicio, fim) de cada pedaço.
+    
+    :param tamanho: Número total de elementos
+    :param tamanho_bloco: Número de elementos por pedaço
     """
-    Gera uma lista de números inteiros aleatórios.
+    for inicio in range(0, tamanho, tamanho_bloco):
+        yield inicio, min(inicio + tamanho_bloco, tamanho)
+
+def gerar_entrada_aleatoria(tamanho, limite_inferior=0, limite_superior=1000000,
+                            semente=SEMENTE_PADRAO, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Gera, em pedaços, números inteiros aleatórios.
     
-    :param tamanho: Número de elementos na lista
+    :param tamanho: Número de elementos
     :param limite_inferior: Menor valor possível
     :param limite_superior: Maior valor possível
-    :return: Lista de números aleatórios
+    :param semente: Semente (inteiro ou sequência de inteiros) do gerador
+    :param tamanho_bloco: Número de elementos por pedaço
+    :return: Gerador de numpy.ndarray com os pedaços
     """
     print(f"Gerando lista aleatória com {tamanho} elementos...")
-    return [random.randint(limite_inferior, limite_superior) for _ in range(tamanho)]
+    rng = np.random.default_rng(semente)
+    for inicio, fim in limites_blocos(tamanho, tamanho_bloco):
+        yield rng.integers(limite_inferior, limite_superior, fim - inicio,
+                           dtype=np.int64, endpoint=True)
 
-def gerar_entrada_ordenada(tamanho, ordem='crescente'):
+def gerar_entrada_ordenada(tamanho, ordem='crescente', tamanho_bloco=TAMANHO_BLOCO):
     """
-    Gera uma lista ordenada (crescente ou decrescente).
+    Gera, em pedaços, uma sequência ordenada (crescente ou decrescente).
     
-    :param tamanho: Número de elementos na lista
+    :param tamanho: Número de elementos
     :param ordem: 'crescente' ou 'decrescente'
-    :return: Lista ordenada
+    :param tamanho_bloco: Número de elementos por pedaço
+    :return: Gerador de numpy.ndarray com os pedaços
     """
     print(f"Gerando lista {ordem} com {tamanho} elementos...")
-    lista = list(range(tamanho))
-    return lista if ordem == 'crescente' else list(reversed(lista))
+    for inicio, fim in limites_blocos(tamanho, tamanho_bloco):
+        if ordem == 'crescente':
+            yield np.arange(inicio, fim, dtype=np.int64)
+        else:
+            yield np.arange(tamanho - 1 - inicio, tamanho - 1 - fim, -1, dtype=np.int64)
 
-def gerar_entrada_quase_ordenada(tamanho, percentual_desordem=10):
+def gerar_entrada_quase_ordenada(tamanho, percentual_desordem=10, semente=SEMENTE_PADRAO,
+                                 tamanho_bloco=TAMANHO_BLOCO):
     """
-    Gera uma lista quase ordenada com uma porcentagem de elementos fora de ordem.
+    Gera, em pedaços, uma sequência quase ordenada com uma porcentagem de elementos fora de ordem.
+    Os elementos embaralhados trocam de posição dentro do próprio pedaço.
     
-    :param tamanho: Número de elementos na lista
+    :param tamanho: Número de elementos
     :param percentual_desordem: Porcentagem de elementos que serão embaralhados
-    :return: Lista quase ordenada
+    :param semente: Semente (inteiro ou sequência de inteiros) do gerador
+    :param tamanho_bloco: Número de elementos por pedaço
+    :return: Gerador de numpy.ndarray com os pedaços
     """
     print(f"Gerando lista quase ordenada com {tamanho} elementos ({percentual_desordem}% em desordem)...")
-    lista = list(range(tamanho))
-    num_desordenados = int(tamanho * percentual_desordem / 100)
+    rng = np.random.default_rng(semente)
+    for inicio, fim in limites_blocos(tamanho, tamanho_bloco):
+        pedaco = np.arange(inicio, fim, dtype=np.int64)
+        num_desordenados = int((fim - inicio) * percentual_desordem / 100)
+        
+        # Embaralha uma porção dos elementos
+        indices_desordenados = rng.choice(fim - inicio, num_desordenados, replace=False)
+        pedaco[indices_desordenados] = pedaco[rng.permutation(indices_desordenados)]
+        yield pedaco
+
+def gerar_entrada_com_duplicatas(tamanho, pct_duplicatas=20, semente=SEMENTE_PADRAO,
+                                 tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Gera, em pedaços, uma sequência com duplicatas: cada um dos valores únicos aparece
+    uma vez e o restante são repetições deles.
     
-    # Embaralha uma porção dos elementos
-    indices_desordenados = random.sample(range(tamanho), num_desordenados)
-    valores_desordenados = [lista[i] for i in indices_desordenados]
-    random.shuffle(valores_desordenados)
+    :param tamanho: Número de elementos
+    :param pct_duplicatas: Porcentagem de elementos que serão duplicados
+    :param semente: Semente (inteiro ou sequência de inteiros) do gerador
+    :param tamanho_bloco: Número de elementos por pedaço
+    :return: Gerador de numpy.ndarray com os pedaços
+    """
+    print(f"Gerando lista com {tamanho} elementos ({pct_duplicatas}% duplicatas)...")
+    rng = np.random.default_rng(semente)
+    num_valores_unicos = max(1, int(tamanho * (1 - pct_duplicatas/100)))
     
-    for i, indice in enumerate(indices_desordenados):
-        lista[indice] = valores_desordenados[i]
+    # Permutação afim dos valores únicos (i -> (a*i + b) mod u), calculável por
+    # pedaço, para espalhá-los por todo o vetor sem um embaralhamento global
+    a = int(rng.integers(1, num_valores_unicos + 1))
+    while math.gcd(a, num_valores_unicos) != 1:
+        a += 1
+    b = int(rng.integers(0, num_valores_unicos))
     
-    return lista
+    for inicio, fim in limites_blocos(tamanho, tamanho_bloco):
+        # Cada pedaço recebe sua parte proporcional dos valores únicos
+        primeiro = inicio * num_valores_unicos // tamanho
+        ultimo = fim * num_valores_unicos // tamanho
+        unicos = (np.arange(primeiro, ultimo, dtype=np.int64) * a + b) % num_valores_unicos
+        
+        # Completa o restante com duplicatas
+        duplicatas = rng.integers(0, num_valores_unicos, (fim - inicio) - len(unicos), dtype=np.int64)
+        pedaco = np.concatenate([unicos, duplicatas])
+        rng.shuffle(pedaco)
+        yield pedaco
 
-def gerar_entrada_com_duplicatas(tamanho, pct_duplicatas=20):
+def gerar_entrada_zipf(tamanho, expoente=1.2, semente=SEMENTE_PADRAO, tamanho_bloco=TAMANHO_BLOCO):
     """
-    Gera uma lista com duplicatas.
+    Gera, em pedaços, chaves com distribuição de Zipf (poucas chaves muito frequentes
+    e uma cauda longa de chaves raras).
     
-    :param tamanho: Número de elementos na lista
-    :param pct_duplicatas: Porcentagem de elementos que serão duplicados
-    :return: Lista com duplicatas
+    :param tamanho: Número de elementos
+    :param expoente: Expoente da distribuição (maior que 1; quanto maior, mais concentrada)
+    :param semente: Semente (inteiro ou sequência de inteiros) do gerador
+    :param tamanho_bloco: Número de elementos por pedaço
+    :return: Gerador de numpy.ndarray com os pedaços
     """
-    print(f"Gerando lista com {tamanho} elementos ({pct_duplicatas}% duplicatas)...")
-    num_valores_unicos = int(tamanho * (1 - pct_duplicatas/100))
-    lista_base = list(range(num_valores_unicos))
+    print(f"Gerando lista Zipf com {tamanho} elementos (expoente {expoente})...")
+    rng = np.random.default_rng(semente)
+    for inicio, fim in limites_blocos(tamanho, tamanho_bloco):
+        yield rng.zipf(expoente, fim - inicio).astype(np.int64, copy=False)
+
+def gerar_entrada_poucos_distintos(tamanho, num_distintos=16, semente=SEMENTE_PADRAO,
+                                   tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Gera, em pedaços, uma sequência aleatória com poucos valores distintos.
     
-    # Completa o restante com duplicatas
-    duplicatas = [random.choice(lista_base) for _ in range(tamanho - num_valores_unicos)]
-    lista_final = lista_base + duplicatas
-    random.shuffle(lista_final)
+    :param tamanho: Número de elementos
+    :param num_distintos: Quantidade de valores distintos
+    :param semente: Semente (inteiro ou sequência de inteiros) do gerador
+    :param tamanho_bloco: Número de elementos por pedaço
+    :return: Gerador de numpy.ndarray com os pedaços
+    """
+    print(f"Gerando lista com {tamanho} elementos e {num_distintos} valores distintos...")
+    rng = np.random.default_rng(semente)
+    for inicio, fim in limites_blocos(tamanho, tamanho_bloco):
+        yield rng.integers(0, num_distintos, fim - inicio, dtype=np.int64)
+
+def gerar_entrada_organ_pipe(tamanho, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Gera, em pedaços, uma sequência "tubos de órgão": crescente até o meio e
+    decrescente depois (0, 1, ..., m, ..., 1, 0).
     
-    return lista_final
+    :param tamanho: Número de elementos
+    :param tamanho_bloco: Número de elementos por pedaço
+    :return: Gerador de numpy.ndarray com os pedaços
+    """
+    print(f"Gerando lista organ-pipe com {tamanho} elementos...")
+    for inicio, fim in limites_blocos(tamanho, tamanho_bloco):
+        posicoes = np.arange(inicio, fim, dtype=np.int64)
+        yield np.minimum(posicoes, tamanho - 1 - posicoes)
+
+def gerar_entrada_serrilhada(tamanho, num_runs=16, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Gera, em pedaços, uma sequência "dente de serra" com num_runs trechos crescentes
+    que recomeçam do zero.
+    
+    :param tamanho: Número de elementos
+    :param num_runs: Número de trechos crescentes
+    :param tamanho_bloco: Número de elementos por pedaço
+    :return: Gerador de numpy.ndarray com os pedaços
+    """
+    print(f"Gerando lista serrilhada com {tamanho} elementos ({num_runs} runs)...")
+    tamanho_run = max(1, -(-tamanho // num_runs))
+    for inicio, fim in limites_blocos(tamanho, tamanho_bloco):
+        yield np.arange(inicio, fim, dtype=np.int64) % tamanho_run
 
-def salvar_entrada(lista, nome_arquivo):
+def gerar_entrada_cauda_aleatoria(tamanho, pct_cauda=5, semente=SEMENTE_PADRAO,
+                                  tamanho_bloco=TAMANHO_BLOCO):
     """
-    Salva a lista em um arquivo de texto.
+    Gera, em pedaços, uma sequência ordenada seguida de uma cauda aleatória,
+    como um arquivo ordenado que recebeu novos registros no fim.
     
-    :param lista: Lista a ser salva
+    :param tamanho: Número de elementos
+    :param pct_cauda: Porcentagem de elementos aleatórios no fim
+    :param semente: Semente (inteiro ou sequência de inteiros) do gerador
+    :param tamanho_bloco: Número de elementos por pedaço
+    :return: Gerador de numpy.ndarray com os pedaços
+    """
+    print(f"Gerando lista ordenada com cauda aleatória com {tamanho} elementos ({pct_cauda}% na cauda)...")
+    rng = np.random.default_rng(semente)
+    inicio_cauda = tamanho - int(tamanho * pct_cauda / 100)
+    for inicio, fim in limites_blocos(tamanho, tamanho_bloco):
+        # Parte ordenada do pedaço seguida da parte que cai na cauda
+        corte = min(max(inicio, inicio_cauda), fim)
+        yield np.concatenate([np.arange(inicio, corte, dtype=np.int64),
+                              rng.integers(0, tamanho, fim - corte, dtype=np.int64)])
+
+def gerar_entrada_intercalada(tamanho, num_fluxos=8, semente=SEMENTE_PADRAO,
+                              tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Gera, em pedaços, num_fluxos sequências crescentes intercaladas elemento a elemento,
+    como registros com carimbo de tempo vindos de várias fontes.
+    
+    :param tamanho: Número de elementos
+    :param num_fluxos: Número de sequências intercaladas
+    :param semente: Semente (inteiro ou sequência de inteiros) do gerador
+    :param tamanho_bloco: Número de elementos por pedaço
+    :return: Gerador de numpy.ndarray com os pedaços
+    """
+    print(f"Gerando lista com {num_fluxos} fluxos ordenados intercalados e {tamanho} elementos...")
+    rng = np.random.default_rng(semente)
+    ultimos = np.zeros(num_fluxos, dtype=np.int64)
+    for inicio, fim in limites_blocos(tamanho, tamanho_bloco):
+        pedaco = np.empty(fim - inicio, dtype=np.int64)
+        fluxos = np.arange(inicio, fim) % num_fluxos
+        for fluxo in range(num_fluxos):
+            posicoes = np.flatnonzero(fluxos == fluxo)
+            # Cada fluxo avança com intervalos aleatórios de mesma média
+            valores = ultimos[fluxo] + np.cumsum(rng.integers(1, 2 * num_fluxos, len(posicoes)))
+            pedaco[posicoes] = valores
+            if len(valores):
+                ultimos[fluxo] = valores[-1]
+        yield pedaco
+
+# Sílabas usadas para montar nomes de domínios, diretórios e arquivos
+SILABAS = ['ba', 'ca', 'da', 'fe', 'ga', 'li', 'ma', 'no', 'pe', 'ra', 'sa', 'ta', 'vi', 'xo', 'ze']
+
+def gerar_palavras(rng, quantidade, min_silabas=2, max_silabas=4):
+    """
+    Gera um vocabulário de palavras distintas formadas por sílabas.
+    
+    :param rng: numpy.random.Generator
+    :param quantidade: Número de palavras
+    :param min_silabas: Menor número de sílabas por palavra
+    :param max_silabas: Maior número de sílabas por palavra
+    :return: Lista de palavras
+    """
+    palavras = set()
+    while len(palavras) < quantidade:
+        silabas = rng.integers(0, len(SILABAS), rng.integers(min_silabas, max_silabas + 1))
+        palavras.add(''.join(SILABAS[i] for i in silabas))
+    return sorted(palavras)
+
+def gerar_entrada_urls(tamanho, num_dominios=50, semente=SEMENTE_PADRAO, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Gera, em pedaços, URLs realistas: poucos domínios (com frequência Zipf), caminhos
+    de um vocabulário pequeno e um identificador numérico; muitas compartilham prefixos longos.
+    
+    :param tamanho: Número de elementos
+    :param num_dominios: Número de domínios distintos
+    :param semente: Semente (inteiro ou sequência de inteiros) do gerador
+    :param tamanho_bloco: Número de elementos por pedaço
+    :return: Gerador de listas de str com os pedaços
+    """
+    print(f"Gerando lista de URLs com {tamanho} elementos...")
+    rng = np.random.default_rng(semente)
+    dominios = [f'https://www.{p}.com.br/' for p in gerar_palavras(rng, num_dominios)]
+    secoes = gerar_palavras(rng, 20)
+    paginas = gerar_palavras(rng, 200)
+    for inicio, fim in limites_blocos(tamanho, tamanho_bloco):
+        n = fim - inicio
+        d = np.minimum(rng.zipf(1.5, n), num_dominios) - 1
+        s = rng.integers(0, len(secoes), n)
+        p = rng.integers(0, len(paginas), n)
+        ids = rng.integers(0, 10 ** 6, n)
+        yield [f'{dominios[d[i]]}{secoes[s[i]]}/{paginas[p[i]]}?id={ids[i]}' for i in range(n)]
+
+def gerar_entrada_caminhos(tamanho, num_usuarios=20, semente=SEMENTE_PADRAO, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Gera, em pedaços, caminhos de arquivos de uma árvore de projetos
+    (/home/<usuario>/projetos/<projeto>/<diretorio>/.../<arquivo>.<extensao>).
+    
+    :param tamanho: Número de elementos
+    :param num_usuarios: Número de diretórios de usuário
+    :param semente: Semente (inteiro ou sequência de inteiros) do gerador
+    :param tamanho_bloco: Número de elementos por pedaço
+    :return: Gerador de listas de str com os pedaços
+    """
+    print(f"Gerando lista de caminhos com {tamanho} elementos...")
+    rng = np.random.default_rng(semente)
+    usuarios = gerar_palavras(rng, num_usuarios)
+    projetos = gerar_palavras(rng, 30)
+    diretorios = ['src', 'tests', 'docs', 'lib', 'build'] + gerar_palavras(rng, 15)
+    arquivos = gerar_palavras(rng, 500)
+    extensoes = ['py', 'c', 'h', 'md', 'txt', 'json']
+    for inicio, fim in limites_blocos(tamanho, tamanho_bloco):
+        pedaco = []
+        for _ in range(fim - inicio):
+            profundidade = rng.integers(1, 5)
+            partes = [diretorios[i] for i in rng.integers(0, len(diretorios), profundidade)]
+            pedaco.append(f'/home/{usuarios[rng.integers(len(usuarios))]}/projetos/'
+                          f'{projetos[rng.integers(len(projetos))]}/{"/".join(partes)}/'
+                          f'{arquivos[rng.integers(len(arquivos))]}.{extensoes[rng.integers(len(extensoes))]}')
+        yield pedaco
+
+# Famílias de entrada agrupadas; cada item é (tipo, gerador(tamanho, semente)).
+# Parâmetros ficam no fim do tipo, como letra e número (por exemplo _p25, _k16)
+GRUPOS_ENTRADAS = {
+    'classicas': [
+        ('aleatoria', lambda t, s: gerar_entrada_aleatoria(t, semente=s)),
+        ('ordenada_crescente', lambda t, s: gerar_entrada_ordenada(t, 'crescente')),
+        ('ordenada_decrescente', lambda t, s: gerar_entrada_ordenada(t, 'decrescente')),
+        ('quase_ordenada', lambda t, s: gerar_entrada_quase_ordenada(t, semente=s)),
+        ('com_duplicatas', lambda t, s: gerar_entrada_com_duplicatas(t, semente=s))
+    ],
+    'adversariais': [
+        ('zipf_s1.2', lambda t, s: gerar_entrada_zipf(t, 1.2, semente=s)),
+        ('poucos_distintos_k16', lambda t, s: gerar_entrada_poucos_distintos(t, 16, semente=s)),
+        ('organ_pipe', lambda t, s: gerar_entrada_organ_pipe(t)),
+        ('serrilhada_k16', lambda t, s: gerar_entrada_serrilhada(t, 16)),
+        ('cauda_aleatoria_p5', lambda t, s: gerar_entrada_cauda_aleatoria(t, 5, semente=s)),
+        ('intercalada_k8', lambda t, s: gerar_entrada_intercalada(t, 8, semente=s))
+    ],
+    'varreduras': [
+        (f'quase_ordenada_p{pct}', lambda t, s, pct=pct: gerar_entrada_quase_ordenada(t, pct, semente=s))
+        for pct in PERCENTUAIS_DESORDEM
+    ] + [
+        (f'com_duplicatas_p{pct}', lambda t, s, pct=pct: gerar_entrada_com_duplicatas(t, pct, semente=s))
+        for pct in PERCENTUAIS_DUPLICATAS
+    ]
+}
+
+# Famílias de strings (um texto por linha, sempre em .txt); ficam fora de
+# GRUPOS_ENTRADAS porque os motores do benchmark ordenam inteiros
+GRUPOS_STRINGS = {
+    'strings': [
+        ('urls', lambda t, s: gerar_entrada_urls(t, semente=s)),
+        ('caminhos', lambda t, s: gerar_entrada_caminhos(t, semente=s))
+    ]
+}
+
+def semente_arquivo(semente, tamanho, tipo):
+    """
+    Monta a semente de uma entrada: cada tipo e tamanho recebe a sua, estável entre versões.
+    
+    :param semente: Semente base (--semente)
+    :param tamanho: Número de elementos
+    :param tipo: Tipo da entrada (com parâmetros, se houver)
+    :return: Sequência de inteiros aceita por numpy.random.default_rng
+    """
+    return [semente, tamanho, zlib.crc32(tipo.encode())]
+
+def nome_entrada(tipo, tamanho, formato='txt'):
+    """
+    Monta o nome do arquivo de uma entrada.
+    
+    :param tipo: Tipo da entrada (com parâmetros, se houver)
+    :param tamanho: Número de elementos
+    :param formato: 'txt' ou 'bin'
+    :return: Nome do arquivo
+    """
+    return f'entrada_{tipo}_{tamanho}.{formato}'
+
+def arquivos_entradas(grupos, tamanhos, formato='txt'):
+    """
+    Lista os arquivos de entrada dos grupos pedidos.
+    
+    :param grupos: Nomes de grupos de GRUPOS_ENTRADAS
+    :param tamanhos: Tamanhos das entradas
+    :param formato: 'txt' ou 'bin'
+    :return: Lista de nomes de arquivo, agrupados por tipo
+    """
+    return [nome_entrada(tipo, tamanho, formato)
+            for grupo in grupos for tipo, _ in GRUPOS_ENTRADAS[grupo] for tamanho in tamanhos]
+
+def tipo_do_arquivo(nome_arquivo):
+    """
+    Extrai o tipo da entrada do nome do arquivo (entrada_<tipo>_<tamanho>.<formato>).
+    
+    :param nome_arquivo: Nome ou caminho do arquivo
+    :return: Tipo da entrada ou '' se o nome não seguir o padrão
+    """
+    encontrado = re.match(r'entrada_(.+)_\d+\.\w+$', os.path.basename(nome_arquivo))
+    return encontrado.group(1) if encontrado else ''
+
+def familia_do_tipo(tipo):
+    """
+    Remove do tipo o parâmetro final, se houver (quase_ordenada_p25 -> quase_ordenada).
+    
+    :param tipo: Tipo da entrada
+    :return: Família da entrada
+    """
+    return re.sub(r'_[a-z][\d.]+$', '', tipo)
+
+def parametro_do_tipo(tipo):
+    """
+    Extrai o valor numérico do parâmetro final do tipo, se houver.
+    
+    :param tipo: Tipo da entrada
+    :return: Valor do parâmetro ou None
+    """
+    encontrado = re.search(r'_[a-z]([\d.]+)$', tipo)
+    return float(encontrado.group(1)) if encontrado else None
+
+def gerar_lista(pedacos):
+    """
+    Junta os pedaços produzidos por um gerador em uma lista Python.
+    
+    :param pedacos: Iterável de numpy.ndarray
+    :return: Lista com todos os elementos
+    """
+    return [x for pedaco in pedacos for x in pedaco.tolist()]
+
+def salvar_entrada(pedacos, nome_arquivo):
+    """
+    Salva os pedaços em um arquivo de texto ou, se o nome terminar em .bin, no formato binário,
+    com uma escrita por pedaço.
+    
+    :param pedacos: Iterável de numpy.ndarray (ou uma lista, gravada como um único pedaço)
     :param nome_arquivo: Nome do arquivo de saída
     """
     print(f"Salvando arquivo: {nome_arquivo}")
-    with open(nome_arquivo, 'w') as f:
-        for num in lista:
-            f.write(f"{num}\n")
+    if isinstance(pedacos, (list, np.ndarray)):
+        pedacos = [np.asarray(pedacos, dtype=np.int64)]
+    if eh_binario(nome_arquivo):
+        salvar_binario_em_pedacos(pedacos, nome_arquivo)
+    else:
+        with open(nome_arquivo, 'wb') as f:
+            for pedaco in pedacos:
+                escrever_pedaco_texto(f, pedaco)
     print(f"Arquivo {nome_arquivo} salvo com sucesso!")
 
+def salvar_entrada_strings(pedacos, nome_arquivo):
+    """
+    Salva pedaços de strings em um arquivo de texto UTF-8, uma string por linha.
+    
+    :param pedacos: Iterável de listas de str
+    :param nome_arquivo: Nome do arquivo de saída
+    """
+    print(f"Salvando arquivo: {nome_arquivo}")
+    with open(nome_arquivo, 'w', encoding='utf-8', newline='\n') as f:
+        for pedaco in pedacos:
+            f.write('\n'.join(pedaco))
+            f.write('\n')
+    print(f"Arquivo {nome_arquivo} salvo com sucesso!")
+
+def ler_strings(nome_arquivo):
+    """
+    Lê um arquivo de strings gerado por salvar_entrada_strings.
+    
+    :param nome_arquivo: Caminho do arquivo
+    :return: Lista de str
+    """
+    with open(nome_arquivo, encoding='utf-8', newline='\n') as f:
+        return f.read().splitlines()
+
+def entrada_manifesto(semente, tamanho, tipo):
+    """
+    Monta os parâmetros de uma entrada registrados no manifesto (sem o hash).
+    
+    :param semente: Semente base (--semente)
+    :param tamanho: Número de elementos
+    :param tipo: Tipo da entrada (com parâmetros, se houver)
+    :return: Dicionário com semente, tamanho, tipo, versao_gerador e tamanho_bloco
+    """
+    return {
+        'semente': semente,
+        'tamanho': tamanho,
+        'tipo': tipo,
+        'versao_gerador': VERSAO_GERADOR,
+        'tamanho_bloco': TAMANHO_BLOCO
+    }
+
+def carregar_manifesto():
+    """
+    Carrega o manifesto das entradas geradas.
+    
+    :return: Dicionário nome do arquivo -> parâmetros da entrada e 'sha256' do conteúdo
+    """
+    try:
+        with open(ARQUIVO_MANIFESTO) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def salvar_manifesto(manifesto):
+    """
+    Salva o manifesto das entradas geradas.
+    
+    :param manifesto: Dicionário nome do arquivo -> parâmetros da entrada e 'sha256' do conteúdo
+    """
+    with open(ARQUIVO_MANIFESTO, 'w') as f:
+        json.dump(manifesto, f, indent=2, sort_keys=True)
+
 def main():
-    # Tamanhos de entrada para teste - modificados para 10000, 50000, 100000
-    tamanhos = [10000, 50000, 100000]
+    # Configurar argumentos de linha de comando
+    parser = argparse.ArgumentParser(description='Gera as entradas de teste do MergeSort.')
+    parser.add_argument('--formato', choices=['txt', 'bin'], default='txt',
+                        help='Formato dos arquivos gerados (texto ou binário)')
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[10000, 50000, 100000],
+                        help='Tamanhos das entradas a gerar')
+    parser.add_argument('--semente', type=int, default=SEMENTE_PADRAO,
+                        help='Semente base; cada arquivo usa (semente, tamanho, tipo)')
+    parser.add_argument('--grupos', nargs='+', choices=list(GRUPOS_ENTRADAS) + list(GRUPOS_STRINGS),
+                        default=['classicas'],
+                        help='Grupos de famílias de entrada a gerar')
+    args = parser.parse_args()
+    
+    tamanhos = args.tamanhos
     
     # Gera diferentes tipos de entradas
-    tipos_entradas = [
-        ('aleatoria', gerar_entrada_aleatoria),
-        ('ordenada_crescente', lambda t: gerar_entrada_ordenada(t, 'crescente')),
-        ('ordenada_decrescente', lambda t: gerar_entrada_ordenada(t, 'decrescente')),
-        ('quase_ordenada', gerar_entrada_quase_ordenada),
-        ('com_duplicatas', gerar_entrada_com_duplicatas)
-    ]
+    # Cada item é (tipo, gerador, formato, função de gravação); strings são sempre gravadas em texto
+    tipos_entradas = [(nome, gerador, args.formato, salvar_entrada)
+                      for grupo in args.grupos if grupo in GRUPOS_ENTRADAS
+                      for nome, gerador in GRUPOS_ENTRADAS[grupo]]
+    tipos_entradas += [(nome, gerador, 'txt', salvar_entrada_strings)
+                       for grupo in args.grupos if grupo in GRUPOS_STRINGS
+                       for nome, gerador in GRUPOS_STRINGS[grupo]]
+    
+    manifesto = carregar_manifesto()
     
     # Gera e salva entradas
     for tamanho in tamanhos:
-        for nome, gerador in tipos_entradas:
-            nome_arquivo = f'entrada_{nome}_{tamanho}.txt'
+        for nome, gerador, formato, salvar in tipos_entradas:
+            nome_arquivo = nome_entrada(nome, tamanho, formato)
+            esperado = entrada_manifesto(args.semente, tamanho, nome)
             
-            # Verifica se o arquivo já existe para evitar regeneração
+            # Só pula arquivos existentes gerados com os mesmos parâmetros e
+            # cujo conteúdo confere com o manifesto; arquivos fora do manifesto
+            # (ou de versões anteriores dele) são gerados novamente
             if os.path.exists(nome_arquivo):
-                print(f"Arquivo {nome_arquivo} já existe, pulando...")
-                continue
+                registro = manifesto.get(nome_arquivo)
+                if (isinstance(registro, dict)
+                        and {c: registro.get(c) for c in esperado} == esperado
+                        and registro.get('sha256') == hash_arquivo(nome_arquivo)):
+                    print(f"Arquivo {nome_arquivo} já existe, pulando...")
+                    continue
+                print(f"Arquivo {nome_arquivo} não confere com o manifesto, gerando novamente...")
             
             # Gera entrada
             try:
                 inicio = time.time()
-                entrada = gerador(tamanho)
+                pedacos = gerador(tamanho, semente_arquivo(args.semente, tamanho, nome))
                 
-                # Salva entrada em arquivo
-                salvar_entrada(entrada, nome_arquivo)
+                # Gera e salva a entrada pedaço a pedaço
+                salvar(pedacos, nome_arquivo)
+                manifesto[nome_arquivo] = dict(esperado, sha256=hash_arquivo(nome_arquivo))
+                salvar_manifesto(manifesto)
                 
                 fim = time.time()
                 print(f"Tempo para gerar e salvar {nome_arquivo}: {fim - inicio:.2f} segundos")
@@ -3,8 +3,12 @@ import matplotlib.pyplot as plt
 import numpy as np
 import argparse
 
+import resultados_colunares
+from gerar_entradas import familia_do_tipo, parametro_do_tipo
+from varredura_escala import ajustar_complexidade, avaliar_ajuste
+
 # Função para carregar dados e gerar gráficos
-def gerar_graficos(linguagem="c"):
+def gerar_graficos(linguagem="c", motor="recursivo"):
     # Determina os nomes dos arquivos baseado na linguagem
     if linguagem.lower() == "c":
         arquivo_csv = 'resultados_mergesort_c_detalhado.csv'
@@ -18,12 +22,27 @@ def gerar_graficos(linguagem="c"):
         print(f"Linguagem '{linguagem}' não reconhecida. Use 'c' ou 'python'.")
         return
 
-    # Carrega os dados do CSV
-    try:
-        df = pd.read_csv(arquivo_csv)
-    except Exception as e:
-        print(f"Erro ao carregar o arquivo {arquivo_csv}: {e}")
-        return None
+    # Carrega o resumo do armazém colunar (só as colunas de tempo) ou, se vazio, o CSV
+    df = resultados_colunares.carregar_resumo(linguagem.lower())
+    do_armazem = df is not None
+    if df is None:
+        try:
+            df = pd.read_csv(arquivo_csv)
+        except Exception as e:
+            print(f"Erro ao carregar o arquivo {arquivo_csv}: {e}")
+            return None
+
+    # Guarda todos os motores para os gráficos comparativos entre motores
+    df_todos = df
+    sufixo_base = sufixo_saida
+    titulo_base = titulo_linguagem
+    
+    # Resultados com vários motores: mantém apenas o motor pedido
+    if 'Motor' in df.columns:
+        df = df[df['Motor'] == motor]
+        titulo_linguagem = f'{titulo_linguagem[:-1]} - {motor})'
+        if motor != 'recursivo':
+            sufixo_saida = f'{sufixo_saida}_{motor}'
 
     # Cria gráfico de barras comparando tempos médios para diferentes tipos de entrada
     def grafico_barras_tipos():
@@ -38,7 +57,7 @@ def gerar_graficos(linguagem="c"):
         tipos_unicos = df['Tipo'].unique()
         
         # Configurar gráfico com tamanho maior
-        fig, axs = plt.subplots(1, len(tamanhos_unicos), figsize=(20, 6), sharey=True)
+        fig, axs = plt.subplots(1, len(tamanhos_unicos), figsize=(20, 6), sharey=True, squeeze=False)
         
         # Posições e largura das barras
         width = 0.7  # Barras mais largas
@@ -53,6 +72,7 @@ def gerar_graficos(linguagem="c"):
         }
         
         for i, tamanho in enumerate(sorted(tamanhos_unicos)):
+            ax = axs[0][i]
             dados_tamanho = df_agrupado[df_agrupado['Tamanho'] == tamanho]
             
             # Ordenar por tipo para manter a mesma ordem em todos os gráficos
@@ -62,24 +82,24 @@ def gerar_graficos(linguagem="c"):
             nomes_curtos = [nomes_tipos.get(tipo, tipo) for tipo in dados_tamanho['Tipo']]
             
             # Criar barras com tempos médios
-            barras = axs[i].bar(nomes_curtos, dados_tamanho['Media_Tempo(s)'], width)
+            barras = ax.bar(nomes_curtos, dados_tamanho['Media_Tempo(s)'], width)
             
             # Adicionar rótulos de valor nas barras COM desvio padrão
             for j, barra in enumerate(barras):
                 altura = barra.get_height()
                 desvio = dados_tamanho['Desvio_Padrao(s)'].iloc[j]
-                axs[i].text(barra.get_x() + barra.get_width()/2., altura + 0.0005,
+                ax.text(barra.get_x() + barra.get_width()/2., altura + 0.0005,
                            f'{altura:.5f}\n±{desvio:.5f}',
                            ha='center', va='bottom', fontsize=8, rotation=0)
             
-            axs[i].set_title(f'Tamanho: {tamanho}')
-            axs[i].set_ylabel('Tempo (s)')
+            ax.set_title(f'Tamanho: {tamanho}')
+            ax.set_ylabel('Tempo (s)')
             
             # Melhorar posicionamento dos rótulos do eixo x
-            plt.setp(axs[i].get_xticklabels(), rotation=45, ha='right')
+            plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
             
             # Adicionar grade para melhor visualização
-            axs[i].grid(axis='y', linestyle='--', alpha=0.7)
+            ax.grid(axis='y', linestyle='--', alpha=0.7)
         
         # Adicionar título principal
         fig.suptitle(f'Comparação de Tempos para Diferentes Tipos de Entrada{titulo_linguagem}', 
@@ -92,39 +112,54 @@ def gerar_graficos(linguagem="c"):
         plt.savefig(f'comparacao_tipos_entrada{sufixo_saida}.png', bbox_inches='tight', dpi=300)
         plt.close()
 
-    # Cria gráfico de linha comparando crescimento do tempo vs. complexidade teórica
+    # Cria gráfico do tempo medido com o ajuste a·n·log2 n + b·n + c; usa a
+    # varredura de escala (varredura_escala.py) do motor, se houver, e senão os
+    # tamanhos do benchmark (média entre os tipos de entrada)
     def grafico_complexidade():
-        # Agrupar por tamanho, calculando as médias
-        df_por_tamanho = df.groupby('Tamanho').agg({
-            'Media_Tempo(s)': 'mean',
-            'Complexidade_Teorica': 'mean'
-        }).reset_index()
+        pontos = None
+        try:
+            varredura = pd.read_csv(f'varredura_escala{sufixo_base}.csv')
+            pontos = varredura[varredura['Motor'] == motor].groupby('Tamanho')['Mediana_Tempo(s)'].mean()
+        except OSError:
+            pass
+        if pontos is None or pontos.empty:
+            pontos = df.groupby('Tamanho')['Media_Tempo(s)'].mean()
+        if pontos.empty:
+            return
         
-        # Ordenar por tamanho
-        df_por_tamanho = df_por_tamanho.sort_values('Tamanho')
+        tamanhos = pontos.index.to_numpy(dtype=float)
+        tempos = pontos.to_numpy()
+        ajuste = ajustar_complexidade(tamanhos, tempos)
+        grade = np.geomspace(tamanhos.min(), tamanhos.max(), 200)
         
         # Criar gráfico
         plt.figure(figsize=(10, 6))
         
-        # Plotar tempos medidos
-        plt.plot(df_por_tamanho['Tamanho'], df_por_tamanho['Media_Tempo(s)'], 
-                'o-', label='Tempo Medido', linewidth=2, markersize=8)
-        
-        # Plotar complexidade teórica (n log n)
-        plt.plot(df_por_tamanho['Tamanho'], df_por_tamanho['Complexidade_Teorica'], 
-                's--', label='Complexidade Teórica (n log n)', linewidth=2, markersize=8)
+        # Plotar tempos medidos e o ajuste
+        plt.plot(tamanhos, tempos, 'o', label='Tempo Medido', markersize=8)
+        plt.plot(grade, avaliar_ajuste(ajuste, grade), '--', linewidth=2,
+                 label=f"Ajuste: {ajuste['a'] * 1e9:.2f}·n·log2 n + {ajuste['b'] * 1e9:.2f}·n "
+                       f"+ {ajuste['c'] * 1e9:.0f} (ns)")
         
-        # Adicionar rótulos para cada ponto de dados
-        for i, row in df_por_tamanho.iterrows():
-            plt.annotate(f'{row["Media_Tempo(s)"]:.5f}s', 
-                        (row['Tamanho'], row['Media_Tempo(s)']),
+        # Rótulo de cada ponto com o resíduo relativo do ajuste, quando há
+        # mais pontos que termos (senão o ajuste passa exatamente por eles)
+        residuos = ajuste['residuos']
+        for i, (tamanho, tempo) in enumerate(zip(tamanhos, tempos)):
+            rotulo = f'{tempo:.5f}s' if residuos is None else f'{tempo:.5f}s ({residuos[i]:+.1%})'
+            plt.annotate(rotulo,
+                        (tamanho, tempo),
                         textcoords="offset points", 
                         xytext=(0,10), 
                         ha='center')
         
+        # Escala logarítmica quando os tamanhos cobrem mais de uma década
+        if tamanhos.max() / tamanhos.min() > 10:
+            plt.xscale('log')
+            plt.yscale('log')
+        
         plt.xlabel('Tamanho da Entrada (n)', fontsize=12)
         plt.ylabel('Tempo (s)', fontsize=12)
-        plt.title(f'Tempo de Execução vs. Complexidade Teórica{titulo_linguagem}', fontsize=14)
+        plt.title(f'Tempo de Execução vs. Ajuste a·n·log2 n + b·n + c{titulo_linguagem}', fontsize=14)
         plt.legend(fontsize=12)
         plt.grid(True, linestyle='--', alpha=0.7)
         
@@ -148,7 +183,7 @@ def gerar_graficos(linguagem="c"):
         }
         
         # Criar gráfico para cada tipo
-        plt.figure(figsize=(12, 10))
+        plt.figure(figsize=(12, max(10, 2 * len(tipos_unicos))))
         
         for i, tipo in enumerate(tipos_unicos):
             df_tipo = df[df['Tipo'] == tipo]
@@ -172,20 +207,138 @@ def gerar_graficos(linguagem="c"):
             
             plt.xticks(fontsize=10)
             
-            # Adicionar uma linha de tendência suave
-            x_num = np.arange(len(df_tipo))
-            z = np.polyfit(x_num, df_tipo['Media_Tempo(s)'], 2)
-            p = np.poly1d(z)
-            plt.plot(df_tipo['Tamanho'].astype(str), p(x_num), "r--", alpha=0.7)
+            # Adicionar uma linha de tendência suave (a parábola precisa de três tamanhos)
+            if len(df_tipo) >= 3:
+                x_num = np.arange(len(df_tipo))
+                z = np.polyfit(x_num, df_tipo['Media_Tempo(s)'], 2)
+                p = np.poly1d(z)
+                plt.plot(df_tipo['Tamanho'].astype(str), p(x_num), "r--", alpha=0.7)
         
         plt.tight_layout()
         plt.savefig(f'tamanhos_por_tipo{sufixo_saida}.png', dpi=300)
         plt.close()
 
+    # Cria gráficos de memória por motor (colunas geradas com --memoria)
+    def grafico_memoria():
+        metricas = [
+            ('Pico_Memoria(bytes)', 'Pico de memória rastreada (MB)', 1024 * 1024),
+            ('Bytes_Alocados', 'Total alocado durante a ordenação (MB)', 1024 * 1024),
+            ('Alocacoes', 'Número de alocações (milhões)', 1e6),
+            ('Pico_RSS(bytes)', 'Pico de RSS do processo (MB)', 1024 * 1024)
+        ]
+        # No armazém colunar, lê só as colunas de memória
+        df_mem = df_todos
+        if do_armazem:
+            df_mem = resultados_colunares.carregar_resumo(linguagem.lower(), metricas=[m[0] for m in metricas])
+        metricas = [m for m in metricas if m[0] in df_mem.columns and df_mem[m[0]].notna().any()]
+        if not metricas:
+            return
+        
+        df_mem = df_mem.copy()
+        if 'Motor' not in df_mem.columns:
+            df_mem['Motor'] = 'recursivo'
+        
+        # Média entre os tipos de entrada, por motor e tamanho
+        df_agrupado = df_mem.groupby(['Motor', 'Tamanho'])[[m[0] for m in metricas]].mean().reset_index()
+        motores = sorted(df_agrupado['Motor'].unique())
+        tamanhos = sorted(df_agrupado['Tamanho'].unique())
+        
+        fig, axs = plt.subplots(len(metricas), 1, figsize=(12, 4 * len(metricas)), squeeze=False)
+        largura = 0.8 / len(motores)
+        x = np.arange(len(tamanhos))
+        
+        for i, (coluna, titulo, escala) in enumerate(metricas):
+            ax = axs[i][0]
+            for j, motor in enumerate(motores):
+                dados = df_agrupado[df_agrupado['Motor'] == motor].set_index('Tamanho')
+                valores = [dados[coluna].get(t, np.nan) / escala for t in tamanhos]
+                ax.bar(x + j * largura, valores, largura, label=motor)
+            ax.set_title(titulo)
+            ax.set_xticks(x + largura * (len(motores) - 1) / 2)
+            ax.set_xticklabels(tamanhos)
+            ax.set_xlabel('Tamanho da Entrada')
+            ax.grid(axis='y', linestyle='--', alpha=0.7)
+            ax.legend()
+        
+        fig.suptitle(f'Uso de Memória por Motor{titulo_base}', fontsize=16)
+        plt.tight_layout()
+        plt.savefig(f'memoria_por_motor{sufixo_base}.png', dpi=300)
+        plt.close()
+
+    # Vazão (milhões de elementos por segundo) por motor, no maior tamanho de cada tipo
+    def calcular_vazao():
+        df_vazao = df_todos.copy()
+        if 'Motor' not in df_vazao.columns:
+            df_vazao['Motor'] = 'recursivo'
+        coluna_tempo = 'Mediana_Tempo(s)' if 'Mediana_Tempo(s)' in df_vazao.columns else 'Media_Tempo(s)'
+        df_vazao = df_vazao[df_vazao['Tamanho'] == df_vazao.groupby('Tipo')['Tamanho'].transform('max')]
+        df_vazao['Vazao'] = df_vazao['Tamanho'] / df_vazao[coluna_tempo] / 1e6
+        df_vazao['Familia'] = df_vazao['Tipo'].map(familia_do_tipo)
+        return df_vazao
+    
+    # Cria gráfico de vazão por família de entrada e motor
+    def grafico_vazao_familias():
+        df_vazao = calcular_vazao()
+        df_agrupado = df_vazao.groupby(['Familia', 'Motor'])['Vazao'].mean().reset_index()
+        familias = sorted(df_agrupado['Familia'].unique())
+        motores = sorted(df_agrupado['Motor'].unique())
+        
+        fig, ax = plt.subplots(figsize=(max(12, 1.5 * len(familias)), 7))
+        largura = 0.8 / len(motores)
+        x = np.arange(len(familias))
+        for j, motor in enumerate(motores):
+            dados = df_agrupado[df_agrupado['Motor'] == motor].set_index('Familia')['Vazao']
+            ax.bar(x + j * largura, [dados.get(f, np.nan) for f in familias], largura, label=motor)
+        
+        ax.set_xticks(x + largura * (len(motores) - 1) / 2)
+        ax.set_xticklabels(familias, rotation=30, ha='right')
+        ax.set_ylabel('Vazão (milhões de elementos/s)')
+        ax.set_title(f'Vazão por Família de Entrada e Motor{titulo_base}', fontsize=16)
+        ax.grid(axis='y', linestyle='--', alpha=0.7)
+        ax.legend()
+        plt.tight_layout()
+        plt.savefig(f'vazao_por_familia{sufixo_base}.png', dpi=300)
+        plt.close()
+    
+    # Cria gráfico das varreduras de desordem e de duplicatas (entradas com _p<percentual>)
+    def grafico_varreduras():
+        df_vazao = calcular_vazao()
+        # As entradas clássicas correspondem a 10% de desordem e 20% de duplicatas
+        percentuais_classicos = {'quase_ordenada': 10, 'com_duplicatas': 20}
+        df_vazao['Percentual'] = [percentuais_classicos.get(tipo) if parametro_do_tipo(tipo) is None
+                                  else parametro_do_tipo(tipo) for tipo in df_vazao['Tipo']]
+        varreduras = [('quase_ordenada', '% de elementos em desordem'),
+                      ('com_duplicatas', '% de duplicatas')]
+        varreduras = [v for v in varreduras
+                      if df_vazao[df_vazao['Familia'] == v[0]]['Percentual'].nunique() > 1]
+        if not varreduras:
+            return
+        
+        fig, axs = plt.subplots(1, len(varreduras), figsize=(7 * len(varreduras), 6), squeeze=False)
+        for i, (familia, rotulo) in enumerate(varreduras):
+            ax = axs[0][i]
+            dados = df_vazao[df_vazao['Familia'] == familia].dropna(subset=['Percentual'])
+            for motor, dados_motor in dados.groupby('Motor'):
+                dados_motor = dados_motor.sort_values('Percentual')
+                ax.plot(dados_motor['Percentual'], dados_motor['Vazao'], 'o-', label=motor)
+            ax.set_xlabel(rotulo)
+            ax.set_ylabel('Vazão (milhões de elementos/s)')
+            ax.set_title(familia)
+            ax.grid(True, linestyle='--', alpha=0.7)
+            ax.legend()
+        
+        fig.suptitle(f'Varreduras de Desordem e Duplicatas{titulo_base}', fontsize=16)
+        plt.tight_layout()
+        plt.savefig(f'varreduras{sufixo_base}.png', dpi=300)
+        plt.close()
+
     # Gerar todos os gráficos
     grafico_barras_tipos()
     grafico_complexidade()
     grafico_tamanhos_por_tipo()
+    grafico_memoria()
+    grafico_vazao_familias()
+    grafico_varreduras()
     
     print(f"Gráficos para {linguagem.upper()} gerados com sucesso!")
 
@@ -195,15 +348,17 @@ def main():
     parser.add_argument('linguagem', type=str, choices=['c', 'python', 'both'], 
                       default='both', nargs='?',
                       help='Linguagem para gerar gráficos (c, python ou both)')
+    parser.add_argument('--motor', type=str, default='recursivo',
+                      help='Motor de ordenação a plotar quando o CSV tiver a coluna Motor')
     
     args = parser.parse_args()
     
     # Gerar gráficos com base na linguagem especificada
     if args.linguagem == 'both':
-        gerar_graficos('c')
-        gerar_graficos('python')
+        gerar_graficos('c', args.motor)
+        gerar_graficos('python', args.motor)
     else:
-        gerar_graficos(args.linguagem)
+        gerar_graficos(args.linguagem, args.motor)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,149 @@
+import os
+import time
+import heapq
+import random
+import argparse
+
+from formato_binario import eh_binario, ler_pedacos_texto, carregar_binario
+from mergesort_python import merge_para, mergesort_bottom_up
+
+# Elementos lidos por vez de cada arquivo de entrada
+ELEMENTOS_BLOCO = 4096
+
+# Lê um arquivo ordenado (texto ou .bin) elemento a elemento, mantendo em
+# memória no máximo um bloco de elementos_bloco elementos
+def ler_arquivo_ordenado(nome_arquivo, elementos_bloco=ELEMENTOS_BLOCO):
+    if eh_binario(nome_arquivo):
+        vetor = carregar_binario(nome_arquivo)
+        for inicio in range(0, len(vetor), elementos_bloco):
+            yield from vetor[inicio:inicio + elementos_bloco].tolist()
+    else:
+        # ~8 bytes por número em texto
+        for pedaco in ler_pedacos_texto(nome_arquivo, elementos_bloco * 8):
+            yield from pedaco.tolist()
+
+# Intercalação k-way preguiçosa com árvore de perdedores: cada entrada é um
+# iterável já ordenado (ou o caminho de um arquivo ordenado) e cada elemento
+# emitido custa O(log k) comparações. Empates saem na ordem das entradas
+# (estável), também com reverse=True (entradas em ordem decrescente)
+def intercalar_kway(*entradas, key=None, reverse=False, elementos_bloco=ELEMENTOS_BLOCO):
+    iteradores = [iter(ler_arquivo_ordenado(e, elementos_bloco)
+                       if isinstance(e, (str, os.PathLike)) else e) for e in entradas]
+    k = len(iteradores)
+    if k == 0:
+        return
+
+    # Elemento atual e sua chave em cada entrada; esgotado marca entradas terminadas
+    valores = [None] * k
+    chaves = [None] * k
+    esgotado = [False] * k
+
+    def avancar(i):
+        for valor in iteradores[i]:
+            valores[i] = valor
+            chaves[i] = valor if key is None else key(valor)
+            return
+        esgotado[i] = True
+
+    # Indica se a entrada i deve sair antes da entrada j (usada na montagem da árvore)
+    def antes(i, j):
+        if esgotado[i]:
+            return False
+        if esgotado[j]:
+            return True
+        a, b = chaves[i], chaves[j]
+        if reverse:
+            a, b = b, a
+        if a < b:
+            return True
+        if b < a:
+            return False
+        return i < j
+
+    for i in range(k):
+        avancar(i)
+
+    # arvore[1:k] guarda o perdedor de cada nó interno e arvore[0] o vencedor;
+    # as folhas são os índices k..2k-1 (entrada = folha - k)
+    arvore = [0] * k
+    vencedores = [0] * (2 * k)
+    for folha in range(k, 2 * k):
+        vencedores[folha] = folha - k
+    for no in range(k - 1, 0, -1):
+        esquerda, direita = vencedores[2 * no], vencedores[2 * no + 1]
+        if antes(esquerda, direita):
+            vencedores[no], arvore[no] = esquerda, direita
+        else:
+            vencedores[no], arvore[no] = direita, esquerda
+    arvore[0] = vencedores[1] if k > 1 else 0
+    vencedores = None
+
+    # Laço principal com as comparações de antes() escritas em linha
+    fim = object()
+    while True:
+        vencedor = arvore[0]
+        if esgotado[vencedor]:
+            return
+        yield valores[vencedor]
+
+        valor = next(iteradores[vencedor], fim)
+        if valor is fim:
+            esgotado[vencedor] = True
+        else:
+            valores[vencedor] = valor
+            chaves[vencedor] = valor if key is None else key(valor)
+
+        # Repete os jogos no caminho da folha do vencedor até a raiz
+        no = (vencedor + k) // 2
+        while no:
+            desafiante = arvore[no]
+            if not esgotado[desafiante]:
+                if esgotado[vencedor]:
+                    arvore[no], vencedor = vencedor, desafiante
+                else:
+                    a, b = chaves[desafiante], chaves[vencedor]
+                    if reverse:
+                        a, b = b, a
+                    if a < b or (desafiante < vencedor and not b < a):
+                        arvore[no], vencedor = vencedor, desafiante
+            no //= 2
+        arvore[0] = vencedor
+
+# Intercala as entradas duas a duas, em rodadas, com listas completas (referência)
+def intercalar_aos_pares(listas):
+    listas = [list(l) for l in listas]
+    while len(listas) > 1:
+        novas = []
+        for p in range(0, len(listas) - 1, 2):
+            juntas = listas[p] + listas[p + 1]
+            destino = [None] * len(juntas)
+            merge_para(juntas, destino, 0, len(listas[p]), len(juntas))
+            novas.append(destino)
+        if len(listas) % 2:
+            novas.append(listas[-1])
+        listas = novas
+    return listas[0] if listas else []
+
+def main():
+    parser = argparse.ArgumentParser(description='Compara a intercalação k-way com intercalações aos pares e com reordenar tudo.')
+    parser.add_argument('--shards', type=int, default=1000,
+                        help='Número de entradas ordenadas')
+    parser.add_argument('--tamanho', type=int, default=1000,
+                        help='Elementos por entrada')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    shards = [sorted(rng.randrange(10 ** 9) for _ in range(args.tamanho)) for _ in range(args.shards)]
+    metodos = [
+        ('arvore de perdedores (k-way)', lambda: list(intercalar_kway(*shards))),
+        ('heapq.merge', lambda: list(heapq.merge(*shards))),
+        ('intercalacoes aos pares', lambda: intercalar_aos_pares(shards)),
+        ('reordenar tudo (bottom_up)', lambda: mergesort_bottom_up([x for s in shards for x in s])),
+    ]
+    for nome, metodo in metodos:
+        inicio = time.perf_counter()
+        metodo()
+        print(f"{nome}: {time.perf_counter() - inicio:.3f} s")
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,29 @@
+#ifndef _WIN32
+#define _POSIX_C_SOURCE 199309L  // Para clock_gettime
+#endif
 #include <stdio.h>
 #include <stdlib.h>
 #include <time.h>
 #include <string.h>
 #include <math.h>  // Para cálculo do desvio padrão
+#include <stdint.h>
+#ifdef _WIN32
+#include <windows.h>
+#endif
+
+// Cabeçalho do formato binário (.bin): magic "MSRT", versão, tipo, flags,
+// 1 byte de preenchimento e quantidade (u64), tudo little-endian
+#define TAMANHO_CABECALHO 16
+#define TIPO_INT32 1
+#define TIPO_INT64 2
+
+// Compilado com -DMERGESORT_BIBLIOTECA, gera a biblioteca compartilhada usada
+// por mergesort_nativo.py (sem main)
+#ifdef _WIN32
+#define EXPORTAR __declspec(dllexport)
+#else
+#define EXPORTAR
+#endif
 
 // Função de intercalação
 void intercalar(int inicio, int meio, int fim, int v[]) {
@@ -44,8 +65,121 @@ void mergesort(int inicio, int fim, int v[]) {
     }
 }
 
-// Função para ler vetor de arquivo
+// Intercalação para vetores de 64 bits (mesmo algoritmo de intercalar)
+void intercalar_int64(int inicio, int meio, int fim, int64_t v[]) {
+    int inicio_v01 = inicio;
+    int inicio_v02 = meio + 1;
+    int posLivre = 0;
+    int64_t* aux = malloc((fim - inicio + 1) * sizeof(int64_t));
+
+    while (inicio_v01 <= meio && inicio_v02 <= fim) {
+        if (v[inicio_v01] <= v[inicio_v02]) {
+            aux[posLivre++] = v[inicio_v01++];
+        } else {
+            aux[posLivre++] = v[inicio_v02++];
+        }
+    }
+
+    while (inicio_v01 <= meio) {
+        aux[posLivre++] = v[inicio_v01++];
+    }
+
+    while (inicio_v02 <= fim) {
+        aux[posLivre++] = v[inicio_v02++];
+    }
+
+    for (int i = 0; i < posLivre; i++) {
+        v[inicio + i] = aux[i];
+    }
+
+    free(aux);
+}
+
+// Merge sort para vetores de 64 bits
+void mergesort_int64(int inicio, int fim, int64_t v[]) {
+    if (inicio < fim) {
+        int meio = inicio + (fim - inicio) / 2;
+        mergesort_int64(inicio, meio, v);
+        mergesort_int64(meio + 1, fim, v);
+        intercalar_int64(inicio, meio, fim, v);
+    }
+}
+
+// Pontos de entrada da biblioteca: ordenam in-place um buffer de n elementos
+EXPORTAR void ordenar_int32(int32_t* v, int n) {
+    mergesort(0, n - 1, v);
+}
+
+EXPORTAR void ordenar_int64(int64_t* v, int n) {
+    mergesort_int64(0, n - 1, v);
+}
+
+#ifndef MERGESORT_BIBLIOTECA
+// Lê um vetor no formato binário (int32 ou int64) com uma única leitura em bloco
+int* ler_vetor_binario(const char* nome_arquivo, int* tamanho) {
+    FILE* arquivo = fopen(nome_arquivo, "rb");
+    if (arquivo == NULL) {
+        printf("Erro ao abrir o arquivo %s\n", nome_arquivo);
+        return NULL;
+    }
+
+    unsigned char cabecalho[TAMANHO_CABECALHO];
+    if (fread(cabecalho, 1, TAMANHO_CABECALHO, arquivo) != TAMANHO_CABECALHO ||
+        memcmp(cabecalho, "MSRT", 4) != 0 || cabecalho[4] != 1) {
+        printf("Arquivo %s nao esta no formato binario\n", nome_arquivo);
+        fclose(arquivo);
+        return NULL;
+    }
+
+    int tipo = cabecalho[5];
+    uint64_t quantidade = 0;
+    for (int b = 7; b >= 0; b--) {
+        quantidade = (quantidade << 8) | cabecalho[8 + b];
+    }
+    *tamanho = (int)quantidade;
+
+    int* vetor = malloc((*tamanho > 0 ? *tamanho : 1) * sizeof(int));
+    if (vetor == NULL) {
+        printf("Erro de alocacao de memoria\n");
+        fclose(arquivo);
+        return NULL;
+    }
+
+    int ok = 0;
+    if (tipo == TIPO_INT32) {
+        ok = fread(vetor, sizeof(int32_t), *tamanho, arquivo) == (size_t)*tamanho;
+    } else if (tipo == TIPO_INT64) {
+        // Converte de int64 para int em blocos para não duplicar a memória
+        int64_t bloco[4096];
+        int lidos = 0;
+        ok = 1;
+        while (ok && lidos < *tamanho) {
+            int qtd = *tamanho - lidos < 4096 ? *tamanho - lidos : 4096;
+            ok = fread(bloco, sizeof(int64_t), qtd, arquivo) == (size_t)qtd;
+            for (int i = 0; ok && i < qtd; i++) {
+                vetor[lidos + i] = (int)bloco[i];
+            }
+            lidos += qtd;
+        }
+    } else {
+        printf("Tipo %d nao suportado em %s\n", tipo, nome_arquivo);
+    }
+
+    fclose(arquivo);
+    if (!ok) {
+        free(vetor);
+        return NULL;
+    }
+    return vetor;
+}
+
+// Função para ler vetor de arquivo (texto, um inteiro por linha, ou .bin)
 int* ler_vetor_do_arquivo(const char* nome_arquivo, int* tamanho) {
+    size_t comprimento = strlen(nome_arquivo);
+    if (comprimento > 4 && strcmp(nome_arquivo + comprimento - 4, ".bin") == 0) {
+        return ler_vetor_binario(nome_arquivo, tamanho);
+    }
+
     FILE* arquivo = fopen(nome_arquivo, "r");
     if (arquivo == NULL) {
         printf("Erro ao abrir o arquivo %s\n", nome_arquivo);
@@ -79,6 +213,24 @@ int* ler_vetor_do_arquivo(const char* nome_arquivo, int* tamanho) {
     return vetor;
 }
 
+// Relógio monotônico de alta resolução, em segundos
+// (clock() tem resolução de milissegundos e mede tempo de CPU)
+double tempo_atual(void) {
+#ifdef _WIN32
+    static LARGE_INTEGER frequencia;
+    LARGE_INTEGER contador;
+    if (frequencia.QuadPart == 0) {
+        QueryPerformanceFrequency(&frequencia);
+    }
+    QueryPerformanceCounter(&contador);
+    return (double)contador.QuadPart / (double)frequencia.QuadPart;
+#else
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec + ts.tv_nsec / 1e9;
+#endif
+}
+
 // Estrutura para armazenar estatísticas
 typedef struct {
     double media;
@@ -97,11 +249,11 @@ Estatisticas medir_tempo_execucao(int* vetor, int tamanho, int num_execucoes) {
         int* copia = malloc(tamanho * sizeof(int));
         memcpy(copia, vetor, tamanho * sizeof(int));
         
-        clock_t inicio = clock();
+        double inicio = tempo_atual();
         mergesort(0, tamanho - 1, copia);
-        clock_t fim = clock();
+        double fim = tempo_atual();
         
-        stats.tempos[r] = ((double)(fim - inicio)) / CLOCKS_PER_SEC;
+        stats.tempos[r] = fim - inicio;
         soma += stats.tempos[r];
         free(copia);
     }
@@ -120,7 +272,8 @@ Estatisticas medir_tempo_execucao(int* vetor, int tamanho, int num_execucoes) {
 }
 
 // Função principal
-int main() {
+// Uso: ./mergesort_c [bin] -- com "bin" lê as entradas no formato binário
+int main(int argc, char* argv[]) {
     // Lista de arquivos de entrada para testar
     const char* arquivos[] = {
         // Tamanhos de entrada: 10.000, 50.000 e 100.000
@@ -142,6 +295,7 @@ int main() {
     };
     
     int num_arquivos = sizeof(arquivos) / sizeof(arquivos[0]);
+    int usar_binario = argc > 1 && strcmp(argv[1], "bin") == 0;
     int num_execucoes = 30;  // Número de execuções: 30
 
     // Cria arquivo CSV para resultados detalhados
@@ -160,7 +314,7 @@ int main() {
     }
     
     // Cabeçalho do CSV principal
-    fprintf(resultado_csv, "Arquivo,Tipo,Tamanho,Media_Tempo(s),Desvio_Padrao(s),Complexidade_Teorica\n");
+    fprintf(resultado_csv, "Arquivo,Tipo,Tamanho,Media_Tempo(s),Desvio_Padrao(s)\n");
     
     // Cabeçalho do CSV de tempos individuais
     fprintf(tempos_individuais_csv, "Arquivo,Tipo,Tamanho");
@@ -172,15 +326,20 @@ int main() {
     // Testa cada arquivo
     for (int i = 0; i < num_arquivos; i++) {
         int tamanho;
-        printf("\nCarregando arquivo: %s\n", arquivos[i]);
-        int* vetor = ler_vetor_do_arquivo(arquivos[i], &tamanho);
+        char nome_arquivo[256];
+        strcpy(nome_arquivo, arquivos[i]);
+        if (usar_binario) {
+            strcpy(strrchr(nome_arquivo, '.'), ".bin");
+        }
+        printf("\nCarregando arquivo: %s\n", nome_arquivo);
+        int* vetor = ler_vetor_do_arquivo(nome_arquivo, &tamanho);
         
         if (vetor == NULL) {
-            fprintf(resultado_csv, "%s,erro_leitura,0,0,0,0\n", arquivos[i]);
+            fprintf(resultado_csv, "%s,erro_leitura,0,0,0\n", nome_arquivo);
             continue;
         }
 
-        printf("Analisando arquivo: %s\n", arquivos[i]);
+        printf("Analisando arquivo: %s\n", nome_arquivo);
         printf("Tamanho do vetor: %d\n", tamanho);
 
         // Extrai o tipo de entrada do nome do arquivo
@@ -202,20 +361,14 @@ int main() {
         printf("Tempo médio de execução (%d execuções): %f segundos\n", num_execucoes, stats.media);
         printf("Desvio padrão: %f segundos\n", stats.desvio_padrao);
         
-        // Calcula a complexidade teórica (n log n para MergeSort)
-        double complexidade_teorica = tamanho * log2(tamanho);
-        // Normaliza a complexidade teórica para comparação com tempos medidos
-        double fator_escala = stats.media / complexidade_teorica;
-        
         // Salva resultados no CSV principal
-        fprintf(resultado_csv, "%s,%s,%d,%f,%f,%f\n", 
-                arquivos[i], tipo, tamanho, stats.media, stats.desvio_padrao, 
-                complexidade_teorica * fator_escala);  // Complexidade teórica escalada
+        fprintf(resultado_csv, "%s,%s,%d,%.9f,%.9f\n", 
+                nome_arquivo, tipo, tamanho, stats.media, stats.desvio_padrao);
         
         // Salva tempos individuais no CSV de tempos
-        fprintf(tempos_individuais_csv, "%s,%s,%d", arquivos[i], tipo, tamanho);
+        fprintf(tempos_individuais_csv, "%s,%s,%d", nome_arquivo, tipo, tamanho);
         for (int r = 0; r < num_execucoes; r++) {
-            fprintf(tempos_individuais_csv, ",%f", stats.tempos[r]);
+            fprintf(tempos_individuais_csv, ",%.9f", stats.tempos[r]);
         }
         fprintf(tempos_individuais_csv, "\n");
 
@@ -229,4 +382,5 @@ int main() {
     printf("Tempos individuais salvos em tempos_individuais_mergesort_c.csv\n");  // NOME MODIFICADO
 
     return 0;
-}
\ No newline at end of file
+}
+#endif
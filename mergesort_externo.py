@@ -0,0 +1,172 @@
+import os
+import time
+import tempfile
+import argparse
+
+import numpy as np
+
+from mergesort_numpy import mergesort_numpy, intercalar_vetores
+from formato_binario import (eh_binario, ler_pedacos_texto, carregar_binario,
+                             escrever_cabecalho, escrever_pedaco_texto, TAMANHO_CABECALHO)
+
+# Orçamento padrão de memória (bytes) e número máximo de runs por intercalação
+MEMORIA_PADRAO = 256 * 1024 * 1024
+FAN_IN_PADRAO = 64
+
+# Tipo usado nos runs temporários
+DTYPE_RUN = np.int64
+
+# Bytes por elemento no pico da ordenação de um pedaço: o pedaço, os blocos
+# ordenados e o buffer das passadas do mergesort_numpy, mais os temporários do
+# searchsorted na última intercalação e o texto lido (medido com tracemalloc)
+BYTES_ELEMENTO_RUN = 5 * np.dtype(DTYPE_RUN).itemsize
+
+# Menor tamanho de um elemento em texto (um dígito e a quebra de linha): um
+# pedaço de texto de 2·n bytes nunca tem mais que n elementos
+BYTES_MINIMOS_TEXTO = 2
+
+# Lê a entrada (texto ou .bin) em pedaços de até elementos elementos
+def ler_pedacos(nome_arquivo, elementos):
+    if not eh_binario(nome_arquivo):
+        yield from ler_pedacos_texto(nome_arquivo, elementos * BYTES_MINIMOS_TEXTO, DTYPE_RUN)
+        return
+    vetor = carregar_binario(nome_arquivo)
+    for inicio in range(0, len(vetor), elementos):
+        yield np.array(vetor[inicio:inicio + elementos], dtype=DTYPE_RUN)
+
+# Lê um run binário em blocos de até elementos_bloco elementos
+def ler_run(caminho, elementos_bloco):
+    with open(caminho, 'rb') as f:
+        while True:
+            bloco = np.fromfile(f, dtype=DTYPE_RUN, count=elementos_bloco)
+            if len(bloco) == 0:
+                return
+            yield bloco
+
+# Intercala vetores já ordenados dois a dois, em rodadas, sem reordená-los;
+# empates saem na ordem das partes
+def intercalar_partes(partes):
+    partes = [p for p in partes if len(p)]
+    if not partes:
+        return np.empty(0, dtype=DTYPE_RUN)
+    while len(partes) > 1:
+        novas = []
+        for p in range(0, len(partes) - 1, 2):
+            a, b = partes[p], partes[p + 1]
+            saida = np.empty(len(a) + len(b), dtype=a.dtype)
+            intercalar_vetores(a, b, saida)
+            novas.append(saida)
+        if len(partes) % 2:
+            novas.append(partes[-1])
+        partes = novas
+    return partes[0]
+
+# Intercalação k-way em fluxo: a cada rodada, todos os elementos menores ou
+# iguais ao menor "último elemento" dos blocos atuais podem ser emitidos,
+# pois nenhum bloco ainda não lido pode conter valores menores
+def intercalar_runs(caminhos, escrever, elementos_bloco):
+    leitores = [ler_run(c, elementos_bloco) for c in caminhos]
+    blocos = []
+    ativos = []
+    for leitor in leitores:
+        bloco = next(leitor, None)
+        if bloco is not None:
+            blocos.append(bloco)
+            ativos.append(leitor)
+
+    while ativos:
+        limite = min(bloco[-1] for bloco in blocos)
+        partes = []
+        for i in range(len(blocos)):
+            corte = np.searchsorted(blocos[i], limite, side='right')
+            partes.append(blocos[i][:corte])
+            blocos[i] = blocos[i][corte:]
+
+        escrever(intercalar_partes(partes))
+
+        # Recarrega os blocos esgotados e descarta os runs terminados
+        for i in reversed(range(len(blocos))):
+            if len(blocos[i]) == 0:
+                bloco = next(ativos[i], None)
+                if bloco is None:
+                    del blocos[i]
+                    del ativos[i]
+                else:
+                    blocos[i] = bloco
+
+# MergeSort externo: ordena um arquivo (texto ou .bin) maior que a memória disponível
+def ordenar_arquivo_externo(arquivo_entrada, arquivo_saida, memoria_max=MEMORIA_PADRAO,
+                            fan_in=FAN_IN_PADRAO, dir_temp=None):
+    if fan_in < 2:
+        raise ValueError("fan_in deve ser pelo menos 2")
+
+    # Fase de runs: o orçamento é dividido pelo pico por elemento da ordenação
+    elementos_run = max(1, memoria_max // BYTES_ELEMENTO_RUN)
+    # Fase de intercalação: um bloco por run de entrada e um de saída; a cada
+    # rodada, os trechos emitidos (até todos os blocos) são intercalados dois a
+    # dois, o que fica dentro do mesmo pico por elemento da fase de runs
+    elementos_bloco = max(1, memoria_max // ((BYTES_ELEMENTO_RUN + np.dtype(DTYPE_RUN).itemsize)
+                                             * (fan_in + 1)))
+
+    with tempfile.TemporaryDirectory(dir=dir_temp) as pasta:
+        # Gera runs ordenados em arquivos binários temporários
+        runs = []
+        for pedaco in ler_pedacos(arquivo_entrada, elementos_run):
+            caminho = os.path.join(pasta, f'run_0_{len(runs)}.bin')
+            mergesort_numpy(pedaco).tofile(caminho)
+            runs.append(caminho)
+        print(f"{len(runs)} run(s) inicial(is) gerado(s)")
+
+        # Intercalações intermediárias enquanto houver mais runs que o fan-in
+        passada = 0
+        while len(runs) > fan_in:
+            passada += 1
+            novos_runs = []
+            for g in range(0, len(runs), fan_in):
+                caminho = os.path.join(pasta, f'run_{passada}_{len(novos_runs)}.bin')
+                with open(caminho, 'wb') as f:
+                    intercalar_runs(runs[g:g + fan_in], lambda bloco: bloco.tofile(f),
+                                    elementos_bloco)
+                novos_runs.append(caminho)
+            for caminho in runs:
+                os.remove(caminho)
+            runs = novos_runs
+            print(f"Passada {passada}: {len(runs)} run(s)")
+
+        # Intercalação final direto para o arquivo de saída
+        with open(arquivo_saida, 'wb') as f:
+            if eh_binario(arquivo_saida):
+                # Quantidade só é conhecida no fim; o cabeçalho é reescrito depois
+                escrever_cabecalho(f, DTYPE_RUN, 0, True)
+                intercalar_runs(runs, lambda bloco: bloco.tofile(f), elementos_bloco)
+                quantidade = (f.tell() - TAMANHO_CABECALHO) // np.dtype(DTYPE_RUN).itemsize
+                f.seek(0)
+                escrever_cabecalho(f, DTYPE_RUN, quantidade, True)
+            else:
+                # A conversão para texto cria objetos do Python por elemento:
+                # escreve a saída de cada rodada em fatias de um bloco
+                def escrever_texto(bloco):
+                    for inicio in range(0, len(bloco), elementos_bloco):
+                        escrever_pedaco_texto(f, bloco[inicio:inicio + elementos_bloco])
+                intercalar_runs(runs, escrever_texto, elementos_bloco)
+
+def main():
+    parser = argparse.ArgumentParser(description='Ordena um arquivo de inteiros maior que a memória (MergeSort externo).')
+    parser.add_argument('entrada', help='Arquivo texto com um inteiro por linha ou .bin')
+    parser.add_argument('saida', help='Arquivo ordenado a ser gerado (.bin para o formato binário)')
+    parser.add_argument('--memoria', type=int, default=MEMORIA_PADRAO // (1024 * 1024),
+                        help='Orçamento de memória em MB')
+    parser.add_argument('--fan-in', type=int, default=FAN_IN_PADRAO,
+                        help='Número máximo de runs intercalados por vez')
+    parser.add_argument('--dir-temp', default=None,
+                        help='Diretório para os runs temporários')
+    args = parser.parse_args()
+
+    inicio = time.time()
+    ordenar_arquivo_externo(args.entrada, args.saida, args.memoria * 1024 * 1024,
+                            args.fan_in, args.dir_temp)
+    fim = time.time()
+    print(f"Arquivo {args.saida} gerado em {fim - inicio:.2f} segundos")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import os
+import sys
+import ctypes
+
+# Motor em C (mergesort_c.c) chamado dentro do processo via ctypes.
+# Compilação da biblioteca:
+#   gcc -O2 -shared -fPIC -DMERGESORT_BIBLIOTECA mergesort_c.c -o libmergesort.so
+# (no Windows, -o mergesort.dll; no macOS, -o libmergesort.dylib)
+if sys.platform == 'win32':
+    NOME_BIBLIOTECA = 'mergesort.dll'
+elif sys.platform == 'darwin':
+    NOME_BIBLIOTECA = 'libmergesort.dylib'
+else:
+    NOME_BIBLIOTECA = 'libmergesort.so'
+
+# Fonte do motor, usado também para invalidar resultados guardados
+ARQUIVO_FONTE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mergesort_c.c')
+
+# O código C usa índices int: (inicio + fim) não pode estourar
+TAMANHO_MAXIMO = 2 ** 30
+
+# Formatos do protocolo de buffer aceitos, por tamanho do elemento
+FORMATOS_INTEIROS = {'i', 'l', 'q'}
+
+# Carrega a biblioteca compartilhada; retorna None se ela não foi compilada
+def carregar_biblioteca(caminho=None):
+    if caminho is None:
+        caminho = os.path.join(os.path.dirname(os.path.abspath(__file__)), NOME_BIBLIOTECA)
+    try:
+        biblioteca = ctypes.CDLL(caminho)
+    except OSError:
+        return None
+    # Funções chamadas via CDLL liberam o GIL durante a execução
+    for nome, tipo in (('ordenar_int32', ctypes.c_int32), ('ordenar_int64', ctypes.c_int64)):
+        funcao = getattr(biblioteca, nome)
+        funcao.argtypes = [ctypes.POINTER(tipo), ctypes.c_int]
+        funcao.restype = None
+    return biblioteca
+
+_biblioteca = carregar_biblioteca()
+
+# Indica se o motor em C está disponível
+def disponivel():
+    return _biblioteca is not None
+
+# Ordena in-place, sem cópia, qualquer objeto com protocolo de buffer gravável e
+# contíguo de inteiros com sinal de 32 ou 64 bits (numpy.ndarray, array.array('i'/'q'), ...)
+def mergesort_c(buffer):
+    if _biblioteca is None:
+        raise RuntimeError(f"Biblioteca {NOME_BIBLIOTECA} não encontrada; compile mergesort_c.c "
+                           "com -shared -fPIC -DMERGESORT_BIBLIOTECA")
+
+    with memoryview(buffer) as visao:
+        formato = visao.format.lstrip('@=<')
+        if visao.readonly:
+            raise TypeError("O buffer precisa ser gravável")
+        if not visao.c_contiguous or visao.ndim != 1:
+            raise TypeError("O buffer precisa ser unidimensional e contíguo")
+        if formato not in FORMATOS_INTEIROS or visao.itemsize not in (4, 8):
+            raise TypeError(f"Formato '{visao.format}' não suportado; use inteiros de 32 ou 64 bits")
+        if visao.format[0] == '<' and sys.byteorder != 'little':
+            raise TypeError("O buffer precisa estar na ordem de bytes nativa")
+        n = len(visao)
+        if n > TAMANHO_MAXIMO:
+            raise ValueError(f"O motor em C aceita até {TAMANHO_MAXIMO} elementos")
+        if n < 2:
+            return
+
+        if visao.itemsize == 4:
+            tipo, funcao = ctypes.c_int32, _biblioteca.ordenar_int32
+        else:
+            tipo, funcao = ctypes.c_int64, _biblioteca.ordenar_int64
+        # from_buffer aponta para a memória do próprio objeto (sem cópia)
+        dados = (tipo * n).from_buffer(buffer)
+        try:
+            funcao(dados, n)
+        finally:
+            del dados
@@ -0,0 +1,106 @@
+import numpy as np
+
+# Tipos aceitos pelo motor vetorizado
+DTYPES_SUPORTADOS = (np.int32, np.int64, np.float64)
+
+# Tamanho dos blocos ordenados diretamente antes das passadas de intercalação;
+# pequeno para que o trabalho seja feito pelas intercalações (as entradas do
+# benchmark passam por 6 a 9 níveis), não pela ordenação do NumPy
+TAMANHO_BLOCO = 256
+
+# Intercala os vetores ordenados a e b em saida (len(a) + len(b)) de uma vez:
+# a posição final de cada elemento de b é o seu índice somado ao seu posto em a,
+# obtido com searchsorted (merge path); os elementos de a ocupam, em ordem,
+# as posições que sobram
+def intercalar_vetores(a, b, saida, idx_a=None, idx_b=None, idx_saida=None):
+    # Vetores que já estão em ordem entre si são apenas copiados
+    if len(a) == 0 or len(b) == 0 or a[-1] <= b[0]:
+        saida[:len(a)] = a
+        saida[len(a):] = b
+        if idx_saida is not None:
+            idx_saida[:len(a)] = idx_a
+            idx_saida[len(a):] = idx_b
+        return
+
+    # Empates: elementos de b vão depois dos iguais de a ('right'),
+    # o que mantém a intercalação estável
+    pos_b = np.searchsorted(a, b, side='right')
+    pos_b += np.arange(len(b))
+    livres_a = np.ones(len(saida), dtype=bool)
+    livres_a[pos_b] = False
+
+    saida[livres_a] = a
+    saida[pos_b] = b
+    if idx_saida is not None:
+        idx_saida[livres_a] = idx_a
+        idx_saida[pos_b] = idx_b
+
+# Intercala origem[inicio:meio] e origem[meio:fim] em destino[inicio:fim]
+def merge_vetorizado(origem, destino, inicio, meio, fim, idx_origem=None, idx_destino=None):
+    if idx_origem is None:
+        intercalar_vetores(origem[inicio:meio], origem[meio:fim], destino[inicio:fim])
+    else:
+        intercalar_vetores(origem[inicio:meio], origem[meio:fim], destino[inicio:fim],
+                           idx_origem[inicio:meio], idx_origem[meio:fim],
+                           idx_destino[inicio:fim])
+
+# Ordena cada bloco de tamanho_bloco de uma vez com primitivas do NumPy
+def ordenar_blocos(arr, tamanho_bloco, argsort):
+    n = len(arr)
+    completos = n // tamanho_bloco * tamanho_bloco
+    chaves = np.empty_like(arr)
+    indices = np.empty(n, dtype=np.int64) if argsort else None
+
+    # Inteiros iguais são indistinguíveis, então só a ordenação das chaves
+    # pode usar o quicksort do NumPy; floats mantêm a ordem (-0.0/0.0, NaN)
+    metodo = 'quicksort' if np.issubdtype(arr.dtype, np.integer) else 'stable'
+
+    if completos:
+        blocos = arr[:completos].reshape(-1, tamanho_bloco)
+        if argsort:
+            ordem = np.argsort(blocos, axis=1, kind='stable')
+            chaves[:completos] = np.take_along_axis(blocos, ordem, axis=1).ravel()
+            ordem += np.arange(0, completos, tamanho_bloco)[:, None]
+            indices[:completos] = ordem.ravel()
+        else:
+            chaves[:completos] = np.sort(blocos, axis=1, kind=metodo).ravel()
+
+    # Último bloco incompleto
+    if completos < n:
+        resto = arr[completos:]
+        if argsort:
+            ordem = np.argsort(resto, kind='stable')
+            chaves[completos:] = resto[ordem]
+            indices[completos:] = ordem + completos
+        else:
+            chaves[completos:] = np.sort(resto, kind=metodo)
+
+    return chaves, indices
+
+# MergeSort vetorizado para numpy.ndarray (int32, int64 ou float64);
+# retorna o vetor ordenado ou, com argsort=True, a permutação estável
+def mergesort_numpy(arr, argsort=False, tamanho_bloco=TAMANHO_BLOCO):
+    arr = np.asarray(arr)
+    if arr.ndim != 1:
+        raise ValueError("mergesort_numpy ordena apenas vetores unidimensionais")
+    if arr.dtype not in DTYPES_SUPORTADOS:
+        raise TypeError(f"Tipo {arr.dtype} não suportado; use int32, int64 ou float64")
+
+    n = len(arr)
+    origem, idx_origem = ordenar_blocos(arr, tamanho_bloco, argsort)
+
+    # Passadas bottom-up alternando entre dois buffers
+    destino = np.empty_like(origem)
+    idx_destino = np.empty_like(idx_origem) if argsort else None
+
+    largura = tamanho_bloco
+    while largura < n:
+        for inicio in range(0, n, 2 * largura):
+            meio = min(inicio + largura, n)
+            fim = min(inicio + 2 * largura, n)
+            merge_vetorizado(origem, destino, inicio, meio, fim, idx_origem, idx_destino)
+        origem, destino = destino, origem
+        idx_origem, idx_destino = idx_destino, idx_origem
+        largura *= 2
+
+    return idx_origem if argsort else origem
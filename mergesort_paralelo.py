@@ -0,0 +1,182 @@
+import os
+import time
+import statistics
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from mergesort_numpy import mergesort_numpy, intercalar_vetores
+
+# Abaixo deste tamanho o custo de criar processos supera o ganho
+LIMIAR_PARALELO = 500_000
+
+# Buffers compartilhados anexados em cada processo trabalhador
+_buffers = {}
+
+# Inicializa o trabalhador anexando os blocos de memória compartilhada
+def _iniciar_trabalhador(nomes, tamanho, dtype):
+    for chave, nome in nomes.items():
+        shm = shared_memory.SharedMemory(name=nome)
+        _buffers[chave] = (shm, np.ndarray(tamanho, dtype=dtype, buffer=shm.buf))
+
+# Fase 1: ordena o trecho [inicio, fim) do buffer in-place
+def _ordenar_trecho(chave, inicio, fim):
+    vetor = _buffers[chave][1]
+    vetor[inicio:fim] = mergesort_numpy(vetor[inicio:fim])
+
+# Fase 2: intercala origem[a_ini:a_fim] e origem[b_ini:b_fim] a partir de destino[saida]
+def _intercalar_trecho(chave_origem, chave_destino, a_ini, a_fim, b_ini, b_fim, saida):
+    origem = _buffers[chave_origem][1]
+    destino = _buffers[chave_destino][1]
+    tamanho = (a_fim - a_ini) + (b_fim - b_ini)
+    intercalar_vetores(origem[a_ini:a_fim], origem[b_ini:b_fim],
+                       destino[saida:saida + tamanho])
+
+# Co-rank (merge path): quantos elementos de a entram nas k primeiras
+# posições da intercalação estável de a e b
+def co_rank(k, a, b):
+    baixo = max(0, k - len(b))
+    alto = min(k, len(a))
+    while baixo < alto:
+        i = (baixo + alto) // 2
+        j = k - i
+        # a[i] deveria entrar antes de b[j - 1]: é preciso pegar mais de a
+        if j > 0 and i < len(a) and a[i] <= b[j - 1]:
+            baixo = i + 1
+        else:
+            alto = i
+    return baixo
+
+# Divide a intercalação de runs[lo_a:hi_a] e [lo_b:hi_b] em partes
+# de saída disjuntas, uma por tarefa
+def dividir_intercalacao(vetor, lo_a, hi_a, lo_b, hi_b, partes):
+    a = vetor[lo_a:hi_a]
+    b = vetor[lo_b:hi_b]
+    total = len(a) + len(b)
+    cortes = [co_rank(total * p // partes, a, b) for p in range(partes + 1)]
+
+    tarefas = []
+    for p in range(partes):
+        k0 = total * p // partes
+        k1 = total * (p + 1) // partes
+        i0, i1 = cortes[p], cortes[p + 1]
+        j0, j1 = k0 - i0, k1 - i1
+        if k1 > k0:
+            tarefas.append((lo_a + i0, lo_a + i1, lo_b + j0, lo_b + j1, lo_a + k0))
+    return tarefas
+
+# MergeSort paralelo: cada trabalhador ordena um pedaço da entrada em memória
+# compartilhada e depois as intercalações são repartidas via co-rank
+def mergesort_paralelo(arr, num_trabalhadores=None, limiar=LIMIAR_PARALELO):
+    arr = np.asarray(arr)
+    n = len(arr)
+    if num_trabalhadores is None:
+        num_trabalhadores = os.cpu_count() or 1
+
+    # Entradas pequenas ou um único trabalhador usam o motor serial
+    if num_trabalhadores <= 1 or n < max(limiar, num_trabalhadores):
+        return mergesort_numpy(arr)
+
+    shm_a = shared_memory.SharedMemory(create=True, size=arr.nbytes)
+    shm_b = shared_memory.SharedMemory(create=True, size=arr.nbytes)
+    try:
+        buffers = {
+            'a': np.ndarray(n, dtype=arr.dtype, buffer=shm_a.buf),
+            'b': np.ndarray(n, dtype=arr.dtype, buffer=shm_b.buf),
+        }
+        buffers['a'][:] = arr
+        nomes = {'a': shm_a.name, 'b': shm_b.name}
+
+        with ProcessPoolExecutor(max_workers=num_trabalhadores,
+                                 initializer=_iniciar_trabalhador,
+                                 initargs=(nomes, n, arr.dtype)) as pool:
+            # Fase 1: um pedaço contíguo por trabalhador
+            limites = [n * t // num_trabalhadores for t in range(num_trabalhadores + 1)]
+            runs = [(limites[t], limites[t + 1]) for t in range(num_trabalhadores)]
+            list(pool.map(_ordenar_trecho, ['a'] * len(runs),
+                          [r[0] for r in runs], [r[1] for r in runs]))
+
+            # Fase 2: rodadas de intercalação par a par alternando os buffers
+            origem, destino = 'a', 'b'
+            while len(runs) > 1:
+                tarefas = []
+                novos_runs = []
+                for p in range(0, len(runs), 2):
+                    if p + 1 == len(runs):
+                        # Run sem par: apenas copiado para o outro buffer
+                        lo, hi = runs[p]
+                        tarefas.append((lo, hi, hi, hi, lo))
+                        novos_runs.append((lo, hi))
+                        continue
+                    (lo_a, hi_a), (lo_b, hi_b) = runs[p], runs[p + 1]
+                    # Cada intercalação recebe trabalhadores proporcionais ao seu tamanho
+                    partes = max(1, round(num_trabalhadores * (hi_b - lo_a) / n))
+                    tarefas.extend(dividir_intercalacao(buffers[origem], lo_a, hi_a,
+                                                        lo_b, hi_b, partes))
+                    novos_runs.append((lo_a, hi_b))
+
+                list(pool.map(_intercalar_trecho,
+                              [origem] * len(tarefas), [destino] * len(tarefas),
+                              *zip(*tarefas)))
+                origem, destino = destino, origem
+                runs = novos_runs
+
+        return buffers[origem].copy()
+    finally:
+        buffers = None
+        shm_a.close()
+        shm_b.close()
+        shm_a.unlink()
+        shm_b.unlink()
+
+# Mede o speedup do motor paralelo em relação ao serial para cada número de trabalhadores
+def medir_speedup(vetor, lista_trabalhadores, num_execucoes=5):
+    vetor = np.asarray(vetor, dtype=np.int64)
+    resultados = []
+    base = None
+
+    for trabalhadores in lista_trabalhadores:
+        tempos = []
+        for _ in range(num_execucoes):
+            inicio = time.perf_counter()
+            mergesort_paralelo(vetor, trabalhadores, limiar=0)
+            tempos.append(time.perf_counter() - inicio)
+
+        media = statistics.mean(tempos)
+        if base is None:
+            base = media
+        resultados.append({
+            'Trabalhadores': trabalhadores,
+            'Tamanho': len(vetor),
+            'Media_Tempo(s)': media,
+            'Desvio_Padrao(s)': statistics.stdev(tempos) if len(tempos) > 1 else 0,
+            'Speedup': base / media
+        })
+        print(f"{trabalhadores} trabalhador(es): {media:.4f} s (speedup {base / media:.2f}x)")
+
+    return pd.DataFrame(resultados)
+
+def main():
+    parser = argparse.ArgumentParser(description='Mede o speedup do MergeSort paralelo por número de núcleos.')
+    parser.add_argument('--tamanho', type=int, default=10_000_000,
+                        help='Número de inteiros aleatórios a ordenar')
+    parser.add_argument('--trabalhadores', type=int, nargs='+',
+                        default=[1, 2, 4, 8, 16, 32],
+                        help='Números de trabalhadores a testar (o primeiro é a referência)')
+    parser.add_argument('--execucoes', type=int, default=5,
+                        help='Execuções por número de trabalhadores')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vetor = rng.integers(0, 1_000_000, args.tamanho, dtype=np.int64)
+    trabalhadores = [t for t in args.trabalhadores if t <= (os.cpu_count() or 1)]
+
+    df = medir_speedup(vetor, trabalhadores, args.execucoes)
+    df.to_csv('speedup_paralelo_python.csv', index=False)
+    print("\nResultados salvos em speedup_paralelo_python.csv")
+
+if __name__ == "__main__":
+    main()
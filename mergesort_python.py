@@ -1,10 +1,36 @@
 import time
 import math
+import gc
+import tracemalloc
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 import statistics
 import os
+import argparse
+import json
+from collections import Counter
+from itertools import chain, islice
+import operator
+from bisect import bisect_left, bisect_right
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
+from mergesort_numpy import mergesort_numpy
+from mergesort_paralelo import mergesort_paralelo
+import mergesort_nativo
+from mergesort_nativo import mergesort_c
+from formato_binario import eh_binario, carregar_binario
+import cache_resultados
+import resultados_colunares
+from gerar_entradas import GRUPOS_ENTRADAS, arquivos_entradas, tipo_do_arquivo
+
+# Extensão opcional (contador_alocacoes.c) que conta alocações do Python
+try:
+    import contador_alocacoes
+except ImportError:
+    contador_alocacoes = None
 
 # Implementação do MergeSort em Python
 def merge(arr, inicio, meio, fim):
@@ -49,64 +75,1192 @@ def mergesort(arr, inicio, fim):
         # Mescla as metades ordenadas
         merge(arr, inicio, meio, fim)
 
-# Função para ler vetor do arquivo
+# Intercala origem[inicio:meio] e origem[meio:fim] em destino[inicio:fim]
+def merge_para(origem, destino, inicio, meio, fim):
+    i = inicio
+    j = meio
+    k = inicio
+    
+    # Em caso de empate pega da esquerda, preservando a estabilidade
+    while i < meio and j < fim:
+        if origem[i] <= origem[j]:
+            destino[k] = origem[i]
+            i += 1
+        else:
+            destino[k] = origem[j]
+            j += 1
+        k += 1
+    
+    # Copia o que sobrou de uma das metades (no máximo uma tem elementos)
+    if i < meio:
+        destino[k:fim] = origem[i:meio]
+    elif j < fim:
+        destino[k:fim] = origem[j:fim]
+
+# MergeSort iterativo (bottom-up) com um único buffer auxiliar
+def mergesort_bottom_up(arr):
+    n = len(arr)
+    if n < 2:
+        return
+    
+    # Um único buffer de tamanho n por ordenação; a cada passada os papéis
+    # de origem e destino se alternam entre arr e aux
+    aux = [None] * n
+    origem, destino = arr, aux
+    
+    largura = 1
+    while largura < n:
+        for inicio in range(0, n, 2 * largura):
+            meio = min(inicio + largura, n)
+            fim = min(inicio + 2 * largura, n)
+            merge_para(origem, destino, inicio, meio, fim)
+        origem, destino = destino, origem
+        largura *= 2
+    
+    # Se a última passada terminou no buffer, copia de volta para arr
+    if origem is not arr:
+        arr[:] = origem
+
+# --- MergeSort natural (adaptativo, no estilo TimSort) ---
+
+# Vitórias seguidas de um mesmo lado antes de entrar no modo galope
+MIN_GALOPE = 7
+
+# Calcula o tamanho mínimo de run (entre 32 e 64) para que n/minrun seja
+# uma potência de 2 ou um pouco menor, equilibrando as intercalações
+def calcular_minrun(n):
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+# Encontra o fim do run que começa em inicio; runs estritamente
+# decrescentes são invertidos in-place (estrito para manter a estabilidade)
+def encontrar_run(arr, inicio, fim):
+    j = inicio + 1
+    if j == fim:
+        return fim
+    
+    if arr[j] < arr[inicio]:
+        while j < fim and arr[j] < arr[j - 1]:
+            j += 1
+        arr[inicio:j] = arr[inicio:j][::-1]
+    else:
+        while j < fim and not (arr[j] < arr[j - 1]):
+            j += 1
+    return j
+
+# Inserção binária de arr[ordenado:fim] no trecho já ordenado arr[inicio:ordenado]
+def insercao_binaria(arr, inicio, fim, ordenado):
+    for i in range(ordenado, fim):
+        x = arr[i]
+        pos = bisect_right(arr, x, inicio, i)
+        arr[pos + 1:i + 1] = arr[pos:i]
+        arr[pos] = x
+
+# Busca exponencial: primeiro índice em a[inicio:fim] com a[indice] > x
+def galope_direita(x, a, inicio, fim):
+    if inicio >= fim or x < a[inicio]:
+        return inicio
+    ultimo = inicio
+    deslocamento = 1
+    while inicio + deslocamento < fim and not (x < a[inicio + deslocamento]):
+        ultimo = inicio + deslocamento
+        deslocamento = deslocamento * 2 + 1
+    return bisect_right(a, x, ultimo + 1, min(inicio + deslocamento, fim))
+
+# Busca exponencial: primeiro índice em a[inicio:fim] com a[indice] >= x
+def galope_esquerda(x, a, inicio, fim):
+    if inicio >= fim or not (a[inicio] < x):
+        return inicio
+    ultimo = inicio
+    deslocamento = 1
+    while inicio + deslocamento < fim and a[inicio + deslocamento] < x:
+        ultimo = inicio + deslocamento
+        deslocamento = deslocamento * 2 + 1
+    return bisect_left(a, x, ultimo + 1, min(inicio + deslocamento, fim))
+
+# Intercala os runs adjacentes arr[inicio:meio] e arr[meio:fim] com galope;
+# retorna o limiar de galope atualizado
+def merge_galope(arr, inicio, meio, fim, min_galope):
+    # Elementos do início do run esquerdo e do fim do run direito
+    # já estão na posição final
+    inicio = galope_direita(arr[meio], arr, inicio, meio)
+    if inicio == meio:
+        return min_galope
+    fim = galope_esquerda(arr[meio - 1], arr, meio, fim)
+    
+    # Copia só o que restou do run esquerdo
+    tmp = arr[inicio:meio]
+    n1 = len(tmp)
+    i = 0
+    j = meio
+    k = inicio
+    
+    while i < n1 and j < fim:
+        # Modo um a um: conta vitórias seguidas de cada lado
+        vitorias_esq = vitorias_dir = 0
+        while i < n1 and j < fim:
+            if arr[j] < tmp[i]:
+                arr[k] = arr[j]
+                j += 1
+                vitorias_dir += 1
+                vitorias_esq = 0
+            else:
+                arr[k] = tmp[i]
+                i += 1
+                vitorias_esq += 1
+                vitorias_dir = 0
+            k += 1
+            if vitorias_esq >= min_galope or vitorias_dir >= min_galope:
+                break
+        
+        # Modo galope: copia blocos inteiros enquanto um lado continuar vencendo
+        while i < n1 and j < fim:
+            fim_esq = galope_direita(arr[j], tmp, i, n1)
+            qtd_esq = fim_esq - i
+            arr[k:k + qtd_esq] = tmp[i:fim_esq]
+            k += qtd_esq
+            i = fim_esq
+            if i == n1:
+                break
+            
+            fim_dir = galope_esquerda(tmp[i], arr, j, fim)
+            qtd_dir = fim_dir - j
+            arr[k:k + qtd_dir] = arr[j:fim_dir]
+            k += qtd_dir
+            j = fim_dir
+            
+            if qtd_esq < MIN_GALOPE and qtd_dir < MIN_GALOPE:
+                # Galope deixou de compensar: penaliza e volta ao modo um a um
+                min_galope += 1
+                break
+            min_galope = max(1, min_galope - 1)
+    
+    # O que sobrou do run direito já está no lugar; copia o resto do esquerdo
+    arr[k:k + n1 - i] = tmp[i:]
+    return min_galope
+
+# MergeSort natural: aproveita runs já ordenados da entrada
+def mergesort_natural(arr):
+    n = len(arr)
+    if n < 2:
+        return
+    
+    minrun = calcular_minrun(n)
+    pilha = []  # Runs pendentes como (inicio, tamanho)
+    min_galope = MIN_GALOPE
+    
+    # Intercala os runs pilha[i] e pilha[i + 1]
+    def intercalar_em(i):
+        nonlocal min_galope
+        inicio_a, tam_a = pilha[i]
+        _, tam_b = pilha[i + 1]
+        min_galope = merge_galope(arr, inicio_a, inicio_a + tam_a,
+                                  inicio_a + tam_a + tam_b, min_galope)
+        pilha[i] = (inicio_a, tam_a + tam_b)
+        del pilha[i + 1]
+    
+    inicio = 0
+    while inicio < n:
+        fim_run = encontrar_run(arr, inicio, n)
+        
+        # Runs curtos são estendidos até minrun com inserção binária
+        if fim_run - inicio < minrun:
+            forcado = min(inicio + minrun, n)
+            insercao_binaria(arr, inicio, forcado, fim_run)
+            fim_run = forcado
+        pilha.append((inicio, fim_run - inicio))
+        inicio = fim_run
+        
+        # Mantém a pilha balanceada (invariantes do TimSort)
+        while len(pilha) > 1:
+            m = len(pilha) - 2
+            if ((m > 0 and pilha[m - 1][1] <= pilha[m][1] + pilha[m + 1][1]) or
+                    (m > 1 and pilha[m - 2][1] <= pilha[m - 1][1] + pilha[m][1])):
+                if pilha[m - 1][1] < pilha[m + 1][1]:
+                    m -= 1
+            elif pilha[m][1] > pilha[m + 1][1]:
+                break
+            intercalar_em(m)
+    
+    # Intercala os runs restantes
+    while len(pilha) > 1:
+        m = len(pilha) - 2
+        if m > 0 and pilha[m - 1][1] < pilha[m + 1][1]:
+            m -= 1
+        intercalar_em(m)
+
+# --- MergeSort híbrido (inserção binária abaixo de um limiar) ---
+
+# Perfil da máquina gerado por calibrar_hibrido.py
+ARQUIVO_PERFIL = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'perfil_mergesort.json')
+
+# Limiar usado quando não há perfil calibrado
+LIMIAR_INSERCAO_PADRAO = 32
+
+# Carrega o perfil calibrado desta máquina (vazio se não existir ou for inválido)
+def carregar_perfil(arquivo=ARQUIVO_PERFIL):
+    try:
+        with open(arquivo) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+# Salva o perfil calibrado, preservando as demais chaves já existentes
+def salvar_perfil(valores, arquivo=ARQUIVO_PERFIL):
+    perfil = carregar_perfil(arquivo)
+    perfil.update(valores)
+    with open(arquivo, 'w') as f:
+        json.dump(perfil, f, indent=2)
+
+# Subarrays com até este número de elementos são ordenados por inserção binária
+LIMIAR_INSERCAO = int(carregar_perfil().get('limiar_insercao', LIMIAR_INSERCAO_PADRAO))
+
+# MergeSort recursivo que troca para inserção binária em subarrays pequenos
+def mergesort_hibrido(arr, inicio, fim, limiar=None):
+    if limiar is None:
+        limiar = LIMIAR_INSERCAO
+    
+    if fim - inicio + 1 <= limiar:
+        insercao_binaria(arr, inicio, fim + 1, inicio + 1)
+    elif inicio < fim:
+        meio = (inicio + fim) // 2
+        mergesort_hibrido(arr, inicio, meio, limiar)
+        mergesort_hibrido(arr, meio + 1, fim, limiar)
+        merge(arr, inicio, meio, fim)
+
+# --- MergeSort in-place (intercalação por blocos com buffer de O(√n)) ---
+
+# Tamanho dos runs iniciais, ordenados por inserção binária sem memória extra
+TAMANHO_RUN_IN_PLACE = 32
+
+# Inverte arr[inicio:fim] trocando blocos das pontas; as cópias temporárias
+# nunca passam de tamanho_bloco elementos
+def inverter_trecho(arr, inicio, fim, tamanho_bloco):
+    while fim - inicio >= 2 * tamanho_bloco:
+        bloco_inicio = arr[inicio:inicio + tamanho_bloco]
+        arr[inicio:inicio + tamanho_bloco] = arr[fim - tamanho_bloco:fim][::-1]
+        arr[fim - tamanho_bloco:fim] = bloco_inicio[::-1]
+        inicio += tamanho_bloco
+        fim -= tamanho_bloco
+    arr[inicio:fim] = arr[inicio:fim][::-1]
+
+# Rotaciona arr[inicio:fim] para que arr[meio:fim] venha antes de arr[inicio:meio]
+# (três inversões); retorna a nova fronteira entre as duas partes
+def rotacionar(arr, inicio, meio, fim, tamanho_bloco):
+    inverter_trecho(arr, inicio, meio, tamanho_bloco)
+    inverter_trecho(arr, meio, fim, tamanho_bloco)
+    inverter_trecho(arr, inicio, fim, tamanho_bloco)
+    return inicio + (fim - meio)
+
+# Intercala arr[inicio:meio] e arr[meio:fim] de forma estável usando só o buffer
+# de tamanho fixo: lados que cabem no buffer são intercalados diretamente; os
+# demais são divididos por busca binária e rotação, como no inplace_merge do C++
+def merge_in_place(arr, inicio, meio, fim, buffer):
+    tamanho_buffer = len(buffer)
+    while inicio < meio < fim and arr[meio - 1] > arr[meio]:
+        n1 = meio - inicio
+        n2 = fim - meio
+        
+        if n1 <= tamanho_buffer:
+            # Lado esquerdo no buffer, intercalação da esquerda para a direita
+            buffer[:n1] = arr[inicio:meio]
+            i, j, k = 0, meio, inicio
+            while i < n1 and j < fim:
+                if buffer[i] <= arr[j]:
+                    arr[k] = buffer[i]
+                    i += 1
+                else:
+                    arr[k] = arr[j]
+                    j += 1
+                k += 1
+            arr[k:k + n1 - i] = buffer[i:n1]
+            return
+        
+        if n2 <= tamanho_buffer:
+            # Lado direito no buffer, intercalação da direita para a esquerda
+            buffer[:n2] = arr[meio:fim]
+            i, j, k = meio - 1, n2 - 1, fim - 1
+            while i >= inicio and j >= 0:
+                if arr[i] > buffer[j]:
+                    arr[k] = arr[i]
+                    i -= 1
+                else:
+                    arr[k] = buffer[j]
+                    j -= 1
+                k -= 1
+            arr[inicio:inicio + j + 1] = buffer[:j + 1]
+            return
+        
+        # Divide o lado maior ao meio e acha o ponto correspondente no outro lado
+        # (bisect_left/bisect_right mantêm os iguais na ordem original)
+        if n1 >= n2:
+            corte1 = inicio + n1 // 2
+            corte2 = bisect_left(arr, arr[corte1], meio, fim)
+        else:
+            corte2 = meio + n2 // 2
+            corte1 = bisect_right(arr, arr[corte2], inicio, meio)
+        novo_meio = rotacionar(arr, corte1, meio, corte2, tamanho_buffer)
+        
+        # Recursão na parte menor, laço na maior (profundidade O(log n))
+        if (novo_meio - inicio) < (fim - novo_meio):
+            merge_in_place(arr, inicio, corte1, novo_meio, buffer)
+            inicio, meio = novo_meio, corte2
+        else:
+            merge_in_place(arr, novo_meio, corte2, fim, buffer)
+            meio, fim = corte1, novo_meio
+
+# MergeSort estável in-place: bottom-up sobre runs ordenados por inserção binária,
+# com memória extra de O(√n) referências em vez de um vetor auxiliar de tamanho n
+def mergesort_in_place(arr, tamanho_buffer=None):
+    n = len(arr)
+    if tamanho_buffer is None:
+        tamanho_buffer = max(1, math.isqrt(n))
+    buffer = [None] * tamanho_buffer
+    
+    for inicio in range(0, n, TAMANHO_RUN_IN_PLACE):
+        fim = min(inicio + TAMANHO_RUN_IN_PLACE, n)
+        insercao_binaria(arr, inicio, fim, inicio + 1)
+    
+    largura = TAMANHO_RUN_IN_PLACE
+    while largura < n:
+        for inicio in range(0, n - largura, 2 * largura):
+            merge_in_place(arr, inicio, inicio + largura, min(inicio + 2 * largura, n), buffer)
+        largura *= 2
+
+# --- Ordenação de registros por chave ---
+
+# Intercala os pares (chave, índice) de [inicio:meio] e [meio:fim] nos buffers de destino;
+# com reverse=True a ordem é decrescente e os empates continuam na ordem original
+def merge_chaves_para(chaves, indices, chaves_dest, indices_dest, inicio, meio, fim, reverse):
+    i = inicio
+    j = meio
+    k = inicio
+    
+    if reverse:
+        while i < meio and j < fim:
+            if chaves[i] < chaves[j]:
+                chaves_dest[k] = chaves[j]
+                indices_dest[k] = indices[j]
+                j += 1
+            else:
+                chaves_dest[k] = chaves[i]
+                indices_dest[k] = indices[i]
+                i += 1
+            k += 1
+    else:
+        while i < meio and j < fim:
+            if chaves[j] < chaves[i]:
+                chaves_dest[k] = chaves[j]
+                indices_dest[k] = indices[j]
+                j += 1
+            else:
+                chaves_dest[k] = chaves[i]
+                indices_dest[k] = indices[i]
+                i += 1
+            k += 1
+    
+    if i < meio:
+        chaves_dest[k:fim] = chaves[i:meio]
+        indices_dest[k:fim] = indices[i:meio]
+    elif j < fim:
+        chaves_dest[k:fim] = chaves[j:fim]
+        indices_dest[k:fim] = indices[j:fim]
+
+# MergeSort bottom-up de chaves carregando os índices junto (listas paralelas)
+def mergesort_chaves(chaves, indices, reverse=False):
+    n = len(chaves)
+    origem = (chaves, indices)
+    destino = ([None] * n, [None] * n)
+    
+    largura = 1
+    while largura < n:
+        for inicio in range(0, n, 2 * largura):
+            meio = min(inicio + largura, n)
+            fim = min(inicio + 2 * largura, n)
+            merge_chaves_para(origem[0], origem[1], destino[0], destino[1],
+                              inicio, meio, fim, reverse)
+        origem, destino = destino, origem
+        largura *= 2
+    
+    if origem[0] is not chaves:
+        chaves[:] = origem[0]
+        indices[:] = origem[1]
+
+# Retorna a permutação estável que ordena os registros; key é calculada
+# uma única vez por registro e os registros em si nunca são movidos
+def argsort(registros, key=None, reverse=False):
+    chaves = [key(r) for r in registros] if key is not None else list(registros)
+    indices = list(range(len(chaves)))
+    mergesort_chaves(chaves, indices, reverse)
+    return indices
+
+# Versão de sorted() sobre o MergeSort: nova lista ordenada por key, estável
+def ordenar(registros, key=None, reverse=False):
+    return [registros[i] for i in argsort(registros, key, reverse)]
+
+# Pré-calcula uma chave composta por registro a partir de várias funções de chave
+# (da mais para a menos significativa); reverso indica, por chave, a ordem decrescente.
+# Chaves inteiras são empacotadas em um único int; as demais viram tuplas
+def chave_composta(registros, chaves, reverso=None):
+    if reverso is None:
+        reverso = [False] * len(chaves)
+    colunas = [[chave(r) for r in registros] for chave in chaves]
+    
+    if not all(all(type(v) is int for v in coluna) for coluna in colunas):
+        if any(reverso):
+            raise ValueError("Ordem decrescente por chave exige chaves inteiras")
+        return list(zip(*colunas))
+    
+    # Cada coluna ocupa uma faixa de bits própria, deslocada para começar em 0
+    compostas = [0] * len(registros)
+    for coluna, decrescente in zip(colunas, reverso):
+        if not coluna:
+            continue
+        minimo = min(coluna)
+        maximo = max(coluna)
+        bits = (maximo - minimo).bit_length()
+        if decrescente:
+            compostas = [(c << bits) | (maximo - v) for c, v in zip(compostas, coluna)]
+        else:
+            compostas = [(c << bits) | (v - minimo) for c, v in zip(compostas, coluna)]
+    return compostas
+
+# --- Caminho rápido para inteiros (ordenação sem comparações) ---
+
+# Counting sort é usado quando o intervalo de valores é até FATOR_CONTAGEM * n
+FATOR_CONTAGEM = 0.5
+
+# Dígito máximo do radix sort, em bits (2^11 baldes por passada)
+BITS_DIGITO_MAX = 11
+
+# Acima deste número de passadas o radix sort perde para o MergeSort
+MAX_PASSADAS_RADIX = 3
+
+# Radix só compensa quando há pelo menos este número de elementos por balde
+ELEMENTOS_POR_BALDE = 8
+
+# Entradas com menos quebras de ordem que n / FATOR_RUNS vão para o MergeSort natural
+FATOR_RUNS = 64
+
+# Divide os bits do intervalo em passadas iguais de no máximo BITS_DIGITO_MAX bits
+def planejar_radix(intervalo):
+    bits_total = intervalo.bit_length()
+    if bits_total == 0:
+        return 0, 0
+    passadas = -(-bits_total // BITS_DIGITO_MAX)
+    return passadas, -(-bits_total // passadas)
+
+# Counting sort in-place de inteiros com valores em [minimo, maximo]
+def counting_sort(arr, minimo, maximo):
+    contagem = Counter(arr)
+    pos = 0
+    for valor in range(minimo, maximo + 1):
+        qtd = contagem.get(valor)
+        if qtd:
+            arr[pos:pos + qtd] = [valor] * qtd
+            pos += qtd
+
+# Radix sort LSD in-place (estável) de inteiros com valores em [minimo, maximo];
+# os valores são deslocados por -minimo, o que também cobre negativos
+def radix_sort_lsd(arr, minimo, maximo):
+    passadas, bits_digito = planejar_radix(maximo - minimo)
+    if passadas == 0:
+        return
+    mascara = (1 << bits_digito) - 1
+    
+    chaves = [x - minimo for x in arr]
+    for deslocamento in range(0, passadas * bits_digito, bits_digito):
+        baldes = [[] for _ in range(mascara + 1)]
+        for x in chaves:
+            baldes[(x >> deslocamento) & mascara].append(x)
+        chaves = list(chain.from_iterable(baldes))
+    
+    arr[:] = [x + minimo for x in chaves]
+
+# Escolhe o motor a partir de varreduras O(n): MergeSort natural para entradas
+# quase ordenadas, counting sort para intervalos pequenos, radix LSD para
+# inteiros limitados e MergeSort natural para o resto
+def ordenar_inteiros(arr):
+    n = len(arr)
+    if n < 2:
+        return
+    if set(map(type, arr)) != {int}:
+        mergesort_natural(arr)
+        return
+    
+    # Poucas (ou quase só) quebras de ordem: runs longos, crescentes ou
+    # decrescentes, tornam o MergeSort natural quase linear
+    quebras = sum(map(operator.gt, arr, islice(arr, 1, None)))
+    if quebras < n // FATOR_RUNS or quebras > n - n // FATOR_RUNS:
+        mergesort_natural(arr)
+        return
+    
+    minimo = min(arr)
+    maximo = max(arr)
+    intervalo = maximo - minimo
+    passadas, bits_digito = planejar_radix(intervalo)
+    if intervalo <= FATOR_CONTAGEM * n:
+        counting_sort(arr, minimo, maximo)
+    elif passadas <= MAX_PASSADAS_RADIX and n >= ELEMENTOS_POR_BALDE << bits_digito:
+        radix_sort_lsd(arr, minimo, maximo)
+    else:
+        mergesort_natural(arr)
+
+# Adapta o motor NumPy para ordenar o ndarray recebido in-place
+def ordenar_numpy(arr):
+    arr[:] = mergesort_numpy(arr)
+
+# Adapta o motor paralelo (todos os núcleos) para ordenar o ndarray in-place
+def ordenar_paralelo(arr):
+    arr[:] = mergesort_paralelo(arr)
+
+# Motores de ordenação disponíveis; cada um ordena o vetor recebido in-place
+MOTORES = {
+    'recursivo': lambda arr: mergesort(arr, 0, len(arr) - 1),
+    'bottom_up': mergesort_bottom_up,
+    'natural': mergesort_natural,
+    'hibrido': lambda arr: mergesort_hibrido(arr, 0, len(arr) - 1),
+    'in_place': mergesort_in_place,
+    'radix': lambda arr: radix_sort_lsd(arr, min(arr), max(arr)) if arr else None,
+    'inteiros': ordenar_inteiros,
+    'numpy': ordenar_numpy,
+    'paralelo': ordenar_paralelo,
+}
+
+# Motor em C chamado no próprio processo, se a biblioteca tiver sido compilada
+if mergesort_nativo.disponivel():
+    MOTORES['c'] = mergesort_c
+
+# Motores que trabalham sobre numpy.ndarray em vez de listas
+MOTORES_NUMPY = {'numpy', 'paralelo', 'c'}
+
+# Função para ler vetor do arquivo; arquivos .bin são mapeados em memória
+# e retornados como numpy.memmap, sem cópia
 def ler_vetor_do_arquivo(nome_arquivo):
+    if eh_binario(nome_arquivo):
+        return carregar_binario(nome_arquivo)
     with open(nome_arquivo, 'r') as f:
         vetor = [int(linha.strip()) for linha in f]
     return vetor
 
-# Função para medir o tempo de execução
-def medir_tempo_execucao(vetor, num_execucoes=30):
-    tempos = []
+# --- Versões instrumentadas (contagem de operações) ---
+# Caminho separado dos motores normais, que continuam sem nenhum custo extra.
+# Movimentos contam toda cópia de elemento, inclusive para buffers auxiliares.
+
+# Cria o dicionário de contadores zerado
+def novos_contadores():
+    return {'comparacoes': 0, 'movimentos': 0, 'chamadas_merge': 0, 'profundidade_max': 0}
+
+# merge() com contagem de operações
+def merge_contado(arr, inicio, meio, fim, contadores):
+    contadores['chamadas_merge'] += 1
+    parte1 = arr[inicio:meio+1]
+    parte2 = arr[meio+1:fim+1]
+    contadores['movimentos'] += len(parte1) + len(parte2)
+    
+    i = j = 0
+    k = inicio
+    comparacoes = 0
+    while i < len(parte1) and j < len(parte2):
+        comparacoes += 1
+        if parte1[i] <= parte2[j]:
+            arr[k] = parte1[i]
+            i += 1
+        else:
+            arr[k] = parte2[j]
+            j += 1
+        k += 1
+    
+    # Restantes
+    arr[k:fim+1] = parte1[i:] if i < len(parte1) else parte2[j:]
+    contadores['comparacoes'] += comparacoes
+    contadores['movimentos'] += fim - inicio + 1
+
+# mergesort() com contagem de operações e de profundidade da recursão
+def mergesort_contado(arr, inicio, fim, contadores, profundidade=1):
+    if profundidade > contadores['profundidade_max']:
+        contadores['profundidade_max'] = profundidade
+    if inicio < fim:
+        meio = (inicio + fim) // 2
+        mergesort_contado(arr, inicio, meio, contadores, profundidade + 1)
+        mergesort_contado(arr, meio + 1, fim, contadores, profundidade + 1)
+        merge_contado(arr, inicio, meio, fim, contadores)
+
+# insercao_binaria() com contagem (busca binária escrita à mão para contar comparações)
+def insercao_binaria_contada(arr, inicio, fim, ordenado, contadores):
+    for i in range(ordenado, fim):
+        x = arr[i]
+        baixo, alto = inicio, i
+        while baixo < alto:
+            meio = (baixo + alto) // 2
+            contadores['comparacoes'] += 1
+            if x < arr[meio]:
+                alto = meio
+            else:
+                baixo = meio + 1
+        arr[baixo + 1:i + 1] = arr[baixo:i]
+        arr[baixo] = x
+        contadores['movimentos'] += i - baixo + 1
+
+# mergesort_hibrido() com contagem de operações
+def mergesort_hibrido_contado(arr, inicio, fim, contadores, limiar=None, profundidade=1):
+    if limiar is None:
+        limiar = LIMIAR_INSERCAO
+    if profundidade > contadores['profundidade_max']:
+        contadores['profundidade_max'] = profundidade
     
-    for _ in range(num_execucoes):
-        # Cria uma cópia do vetor para não modificar o original
-        copia = vetor.copy()
+    if fim - inicio + 1 <= limiar:
+        insercao_binaria_contada(arr, inicio, fim + 1, inicio + 1, contadores)
+    elif inicio < fim:
+        meio = (inicio + fim) // 2
+        mergesort_hibrido_contado(arr, inicio, meio, contadores, limiar, profundidade + 1)
+        mergesort_hibrido_contado(arr, meio + 1, fim, contadores, limiar, profundidade + 1)
+        merge_contado(arr, inicio, meio, fim, contadores)
+
+# mergesort_bottom_up() com contagem de operações (sem recursão: profundidade 0)
+def mergesort_bottom_up_contado(arr, contadores):
+    n = len(arr)
+    if n < 2:
+        return
+    aux = [None] * n
+    origem, destino = arr, aux
+    
+    largura = 1
+    while largura < n:
+        for inicio in range(0, n, 2 * largura):
+            meio = min(inicio + largura, n)
+            fim = min(inicio + 2 * largura, n)
+            contadores['chamadas_merge'] += 1
+            i, j, k = inicio, meio, inicio
+            while i < meio and j < fim:
+                contadores['comparacoes'] += 1
+                if origem[i] <= origem[j]:
+                    destino[k] = origem[i]
+                    i += 1
+                else:
+                    destino[k] = origem[j]
+                    j += 1
+                k += 1
+            if i < meio:
+                destino[k:fim] = origem[i:meio]
+            elif j < fim:
+                destino[k:fim] = origem[j:fim]
+            contadores['movimentos'] += fim - inicio
+        origem, destino = destino, origem
+        largura *= 2
+    
+    if origem is not arr:
+        arr[:] = origem
+        contadores['movimentos'] += n
+
+# Busca binária com contagem: primeiro índice em a[baixo:alto] com a[indice] > x
+# (como bisect_right) ou, com direita=False, com a[indice] >= x (como bisect_left)
+def busca_binaria_contada(x, a, baixo, alto, direita, contadores):
+    while baixo < alto:
+        meio = (baixo + alto) // 2
+        contadores['comparacoes'] += 1
+        if (x < a[meio]) if direita else not (a[meio] < x):
+            alto = meio
+        else:
+            baixo = meio + 1
+    return baixo
+
+# galope_direita() e galope_esquerda() com contagem de comparações
+def galope_contado(x, a, inicio, fim, direita, contadores):
+    if inicio >= fim:
+        return inicio
+    contadores['comparacoes'] += 1
+    if (x < a[inicio]) if direita else not (a[inicio] < x):
+        return inicio
+    ultimo = inicio
+    deslocamento = 1
+    while inicio + deslocamento < fim:
+        contadores['comparacoes'] += 1
+        if (x < a[inicio + deslocamento]) if direita else not (a[inicio + deslocamento] < x):
+            break
+        ultimo = inicio + deslocamento
+        deslocamento = deslocamento * 2 + 1
+    return busca_binaria_contada(x, a, ultimo + 1, min(inicio + deslocamento, fim),
+                                 direita, contadores)
+
+# encontrar_run() com contagem (a inversão de um run decrescente conta como movimentos)
+def encontrar_run_contado(arr, inicio, fim, contadores):
+    j = inicio + 1
+    if j == fim:
+        return fim
+    
+    contadores['comparacoes'] += 1
+    if arr[j] < arr[inicio]:
+        while j < fim:
+            contadores['comparacoes'] += 1
+            if not (arr[j] < arr[j - 1]):
+                break
+            j += 1
+        arr[inicio:j] = arr[inicio:j][::-1]
+        contadores['movimentos'] += j - inicio
+    else:
+        while j < fim:
+            contadores['comparacoes'] += 1
+            if arr[j] < arr[j - 1]:
+                break
+            j += 1
+    return j
+
+# merge_galope() com contagem de operações
+def merge_galope_contado(arr, inicio, meio, fim, min_galope, contadores):
+    contadores['chamadas_merge'] += 1
+    inicio = galope_contado(arr[meio], arr, inicio, meio, True, contadores)
+    if inicio == meio:
+        return min_galope
+    fim = galope_contado(arr[meio - 1], arr, meio, fim, False, contadores)
+    
+    tmp = arr[inicio:meio]
+    n1 = len(tmp)
+    contadores['movimentos'] += n1
+    i = 0
+    j = meio
+    k = inicio
+    
+    while i < n1 and j < fim:
+        vitorias_esq = vitorias_dir = 0
+        while i < n1 and j < fim:
+            contadores['comparacoes'] += 1
+            if arr[j] < tmp[i]:
+                arr[k] = arr[j]
+                j += 1
+                vitorias_dir += 1
+                vitorias_esq = 0
+            else:
+                arr[k] = tmp[i]
+                i += 1
+                vitorias_esq += 1
+                vitorias_dir = 0
+            k += 1
+            contadores['movimentos'] += 1
+            if vitorias_esq >= min_galope or vitorias_dir >= min_galope:
+                break
         
-        # Mede o tempo
-        inicio = time.time()
-        mergesort(copia, 0, len(copia) - 1)
-        fim = time.time()
+        while i < n1 and j < fim:
+            fim_esq = galope_contado(arr[j], tmp, i, n1, True, contadores)
+            qtd_esq = fim_esq - i
+            arr[k:k + qtd_esq] = tmp[i:fim_esq]
+            k += qtd_esq
+            i = fim_esq
+            contadores['movimentos'] += qtd_esq
+            if i == n1:
+                break
+            
+            fim_dir = galope_contado(tmp[i], arr, j, fim, False, contadores)
+            qtd_dir = fim_dir - j
+            arr[k:k + qtd_dir] = arr[j:fim_dir]
+            k += qtd_dir
+            j = fim_dir
+            contadores['movimentos'] += qtd_dir
+            
+            if qtd_esq < MIN_GALOPE and qtd_dir < MIN_GALOPE:
+                min_galope += 1
+                break
+            min_galope = max(1, min_galope - 1)
+    
+    arr[k:k + n1 - i] = tmp[i:]
+    contadores['movimentos'] += n1 - i
+    return min_galope
+
+# mergesort_natural() com contagem de operações (sem recursão: profundidade 0)
+def mergesort_natural_contado(arr, contadores):
+    n = len(arr)
+    if n < 2:
+        return
+    
+    minrun = calcular_minrun(n)
+    pilha = []
+    min_galope = MIN_GALOPE
+    
+    def intercalar_em(i):
+        nonlocal min_galope
+        inicio_a, tam_a = pilha[i]
+        _, tam_b = pilha[i + 1]
+        min_galope = merge_galope_contado(arr, inicio_a, inicio_a + tam_a,
+                                          inicio_a + tam_a + tam_b, min_galope, contadores)
+        pilha[i] = (inicio_a, tam_a + tam_b)
+        del pilha[i + 1]
+    
+    inicio = 0
+    while inicio < n:
+        fim_run = encontrar_run_contado(arr, inicio, n, contadores)
+        if fim_run - inicio < minrun:
+            forcado = min(inicio + minrun, n)
+            insercao_binaria_contada(arr, inicio, forcado, fim_run, contadores)
+            fim_run = forcado
+        pilha.append((inicio, fim_run - inicio))
+        inicio = fim_run
         
-        tempos.append(fim - inicio)
+        while len(pilha) > 1:
+            m = len(pilha) - 2
+            if ((m > 0 and pilha[m - 1][1] <= pilha[m][1] + pilha[m + 1][1]) or
+                    (m > 1 and pilha[m - 2][1] <= pilha[m - 1][1] + pilha[m][1])):
+                if pilha[m - 1][1] < pilha[m + 1][1]:
+                    m -= 1
+            elif pilha[m][1] > pilha[m + 1][1]:
+                break
+            intercalar_em(m)
+    
+    while len(pilha) > 1:
+        m = len(pilha) - 2
+        if m > 0 and pilha[m - 1][1] < pilha[m + 1][1]:
+            m -= 1
+        intercalar_em(m)
+
+# rotacionar() com contagem: cada inversão escreve todo o trecho, mais as cópias
+# temporárias dos blocos trocados
+def rotacionar_contado(arr, inicio, meio, fim, tamanho_bloco, contadores):
+    for a, b in ((inicio, meio), (meio, fim), (inicio, fim)):
+        contadores['movimentos'] += (b - a) + (b - a) // (2 * tamanho_bloco) * tamanho_bloco
+    return rotacionar(arr, inicio, meio, fim, tamanho_bloco)
+
+# merge_in_place() com contagem de operações; a profundidade é a da recursão
+# sobre a parte menor de cada divisão
+def merge_in_place_contado(arr, inicio, meio, fim, buffer, contadores, profundidade=1):
+    contadores['chamadas_merge'] += 1
+    if profundidade > contadores['profundidade_max']:
+        contadores['profundidade_max'] = profundidade
+    tamanho_buffer = len(buffer)
+    while inicio < meio < fim:
+        contadores['comparacoes'] += 1
+        if not (arr[meio - 1] > arr[meio]):
+            return
+        n1 = meio - inicio
+        n2 = fim - meio
+        
+        if n1 <= tamanho_buffer:
+            buffer[:n1] = arr[inicio:meio]
+            contadores['movimentos'] += n1
+            i, j, k = 0, meio, inicio
+            while i < n1 and j < fim:
+                contadores['comparacoes'] += 1
+                if buffer[i] <= arr[j]:
+                    arr[k] = buffer[i]
+                    i += 1
+                else:
+                    arr[k] = arr[j]
+                    j += 1
+                k += 1
+            arr[k:k + n1 - i] = buffer[i:n1]
+            contadores['movimentos'] += k - inicio + n1 - i
+            return
+        
+        if n2 <= tamanho_buffer:
+            buffer[:n2] = arr[meio:fim]
+            contadores['movimentos'] += n2
+            i, j, k = meio - 1, n2 - 1, fim - 1
+            while i >= inicio and j >= 0:
+                contadores['comparacoes'] += 1
+                if arr[i] > buffer[j]:
+                    arr[k] = arr[i]
+                    i -= 1
+                else:
+                    arr[k] = buffer[j]
+                    j -= 1
+                k -= 1
+            arr[inicio:inicio + j + 1] = buffer[:j + 1]
+            contadores['movimentos'] += fim - 1 - k + j + 1
+            return
+        
+        if n1 >= n2:
+            corte1 = inicio + n1 // 2
+            corte2 = busca_binaria_contada(arr[corte1], arr, meio, fim, False, contadores)
+        else:
+            corte2 = meio + n2 // 2
+            corte1 = busca_binaria_contada(arr[corte2], arr, inicio, meio, True, contadores)
+        novo_meio = rotacionar_contado(arr, corte1, meio, corte2, tamanho_buffer, contadores)
+        
+        if (novo_meio - inicio) < (fim - novo_meio):
+            merge_in_place_contado(arr, inicio, corte1, novo_meio, buffer, contadores,
+                                   profundidade + 1)
+            inicio, meio = novo_meio, corte2
+        else:
+            merge_in_place_contado(arr, novo_meio, corte2, fim, buffer, contadores,
+                                   profundidade + 1)
+            meio, fim = corte1, novo_meio
+
+# mergesort_in_place() com contagem de operações
+def mergesort_in_place_contado(arr, contadores, tamanho_buffer=None):
+    n = len(arr)
+    if tamanho_buffer is None:
+        tamanho_buffer = max(1, math.isqrt(n))
+    buffer = [None] * tamanho_buffer
+    
+    for inicio in range(0, n, TAMANHO_RUN_IN_PLACE):
+        fim = min(inicio + TAMANHO_RUN_IN_PLACE, n)
+        insercao_binaria_contada(arr, inicio, fim, inicio + 1, contadores)
+    
+    largura = TAMANHO_RUN_IN_PLACE
+    while largura < n:
+        for inicio in range(0, n - largura, 2 * largura):
+            merge_in_place_contado(arr, inicio, inicio + largura,
+                                   min(inicio + 2 * largura, n), buffer, contadores)
+        largura *= 2
+
+# Motores com versão instrumentada; recebem (arr, contadores)
+MOTORES_INSTRUMENTADOS = {
+    'recursivo': lambda arr, c: mergesort_contado(arr, 0, len(arr) - 1, c),
+    'bottom_up': mergesort_bottom_up_contado,
+    'natural': mergesort_natural_contado,
+    'hibrido': lambda arr, c: mergesort_hibrido_contado(arr, 0, len(arr) - 1, c),
+    'in_place': mergesort_in_place_contado,
+}
+
+# Conta as operações de uma ordenação com a versão instrumentada do motor
+# (None se o motor não tiver versão instrumentada)
+def contar_operacoes(vetor, motor='recursivo'):
+    if motor not in MOTORES_INSTRUMENTADOS:
+        return None
+    if isinstance(vetor, np.ndarray):
+        vetor = vetor.tolist()
+    contadores = novos_contadores()
+    MOTORES_INSTRUMENTADOS[motor](vetor.copy(), contadores)
+    return contadores
+
+# Número de reamostragens do bootstrap e nível de confiança dos intervalos
+REAMOSTRAGENS_BOOTSTRAP = 2000
+CONFIANCA = 0.95
+
+# Resume os tempos: média, desvio, mediana, percentis, mínimo e intervalo
+# de confiança da mediana por bootstrap
+def resumir_tempos(tempos, confianca=CONFIANCA, reamostragens=REAMOSTRAGENS_BOOTSTRAP):
+    amostra = np.asarray(tempos)
+    mediana = float(np.median(amostra))
+    
+    # Bootstrap com semente fixa para que o resumo seja reproduzível
+    rng = np.random.default_rng(0)
+    medianas = np.median(rng.choice(amostra, size=(reamostragens, len(amostra))), axis=1)
+    alfa = (1 - confianca) / 2
+    ic_inferior, ic_superior = np.quantile(medianas, [alfa, 1 - alfa])
+    
+    return {
+        'media': statistics.mean(tempos),
+        'desvio_padrao': statistics.stdev(tempos) if len(tempos) > 1 else 0,
+        'mediana': mediana,
+        'p5': float(np.percentile(amostra, 5)),
+        'p95': float(np.percentile(amostra, 95)),
+        'minimo': float(amostra.min()),
+        'ic_inferior': float(ic_inferior),
+        'ic_superior': float(ic_superior),
+        # Meia largura do intervalo relativa à mediana
+        'erro_relativo': float((ic_superior - ic_inferior) / 2 / mediana) if mediana > 0 else 0.0
+    }
+
+# Função para medir o tempo de execução
+# aquecimento: execuções descartadas antes da medição
+# desativar_gc: desliga o coletor de lixo durante as execuções medidas
+# erro_relativo_alvo: se definido, continua medindo (até max_execucoes) até a
+#   meia largura do intervalo de confiança da mediana ficar abaixo do alvo
+def medir_tempo_execucao(vetor, num_execucoes=30, motor='recursivo', aquecimento=0,
+                         desativar_gc=False, erro_relativo_alvo=None, max_execucoes=None):
+    ordenar = MOTORES[motor]
+    tempos = []
+    if max_execucoes is None:
+        max_execucoes = num_execucoes if erro_relativo_alvo is None else 10 * num_execucoes
+    
+    # Converte a entrada fora da medição de tempo
+    if motor in MOTORES_NUMPY:
+        vetor = np.asarray(vetor, dtype=np.int64)
+    elif isinstance(vetor, np.ndarray):
+        vetor = vetor.tolist()
+    
+    for _ in range(aquecimento):
+        ordenar(vetor.copy())
+    
+    gc_ativo = gc.isenabled()
+    try:
+        while len(tempos) < max_execucoes:
+            # Cria uma cópia do vetor para não modificar o original
+            copia = vetor.copy()
+            
+            if desativar_gc:
+                gc.collect()
+                gc.disable()
+            
+            # Mede o tempo
+            inicio = time.perf_counter_ns()
+            ordenar(copia)
+            fim = time.perf_counter_ns()
+            
+            if desativar_gc and gc_ativo:
+                gc.enable()
+            
+            tempos.append((fim - inicio) / 1e9)
+            
+            # Parada adaptativa: só depois do mínimo de execuções
+            if len(tempos) >= num_execucoes:
+                if erro_relativo_alvo is None:
+                    break
+                if resumir_tempos(tempos)['erro_relativo'] <= erro_relativo_alvo:
+                    break
+    finally:
+        if gc_ativo:
+            gc.enable()
     
     # Calcula estatísticas
-    media = statistics.mean(tempos)
-    desvio_padrao = statistics.stdev(tempos) if len(tempos) > 1 else 0
+    stats = resumir_tempos(tempos)
+    stats['tempos'] = tempos
+    return stats
+
+# Lê um campo de /proc/self/status em bytes (None fora do Linux)
+def ler_status_processo(campo):
+    try:
+        with open('/proc/self/status') as f:
+            for linha in f:
+                if linha.startswith(campo + ':'):
+                    return int(linha.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+# Zera o pico de RSS do processo (VmHWM), se o sistema permitir
+def zerar_pico_rss():
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+# Mede a memória de uma ordenação, fora das execuções cronometradas:
+# pico de memória rastreada pelo tracemalloc, número e total de bytes das
+# alocações (com a extensão contador_alocacoes) e pico de RSS do processo
+def medir_memoria(vetor, motor='recursivo'):
+    ordenar = MOTORES[motor]
+    if motor in MOTORES_NUMPY:
+        vetor = np.asarray(vetor, dtype=np.int64)
+    elif isinstance(vetor, np.ndarray):
+        vetor = vetor.tolist()
+    
+    # Execução 1: pico rastreado; a cópia é feita antes de iniciar o rastreio
+    copia = vetor.copy()
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    ordenar(copia)
+    pico = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    
+    # Execução 2: contagem de alocações e RSS, sem o custo do tracemalloc
+    alocacoes = bytes_alocados = None
+    copia = vetor.copy()
+    gc.collect()
+    pico_rss_zerado = zerar_pico_rss()
+    if contador_alocacoes is not None:
+        # Os contadores ficam instalados só durante esta execução: as
+        # cronometradas seguintes usam os alocadores originais
+        contador_alocacoes.instalar()
+        contador_alocacoes.zerar()
+        try:
+            ordenar(copia)
+            alocacoes, bytes_alocados = contador_alocacoes.ler()
+        finally:
+            contador_alocacoes.desinstalar()
+    else:
+        ordenar(copia)
+    
+    if pico_rss_zerado:
+        pico_rss = ler_status_processo('VmHWM')
+    else:
+        # Sem como zerar o pico: usa o máximo do processo inteiro
+        pico_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 if resource else None
     
     return {
-        'media': media,
-        'desvio_padrao': desvio_padrao,
-        'tempos': tempos
+        'pico_memoria': pico,
+        'alocacoes': alocacoes,
+        'bytes_alocados': bytes_alocados,
+        'pico_rss': pico_rss
     }
 
+# Fixa o processo nas CPUs indicadas (somente em sistemas com sched_setaffinity)
+def fixar_cpus(cpus):
+    if not hasattr(os, 'sched_setaffinity'):
+        print("Fixação de CPU não suportada neste sistema; ignorando.")
+        return
+    os.sched_setaffinity(0, set(cpus))
+    print(f"Processo fixado nas CPUs {sorted(cpus)}")
+
 # Função principal
 def main():
-    # Lista de arquivos de entrada para testar
-    arquivos = [
-        # Tamanhos de entrada: 10.000, 50.000 e 100.000
-        "entrada_aleatoria_10000.txt",
-        "entrada_aleatoria_50000.txt",
-        "entrada_aleatoria_100000.txt",
-        "entrada_ordenada_crescente_10000.txt",
-        "entrada_ordenada_crescente_50000.txt",
-        "entrada_ordenada_crescente_100000.txt",
-        "entrada_ordenada_decrescente_10000.txt",
-        "entrada_ordenada_decrescente_50000.txt",
-        "entrada_ordenada_decrescente_100000.txt",
-        "entrada_quase_ordenada_10000.txt",
-        "entrada_quase_ordenada_50000.txt",
-        "entrada_quase_ordenada_100000.txt",
-        "entrada_com_duplicatas_10000.txt",
-        "entrada_com_duplicatas_50000.txt",
-        "entrada_com_duplicatas_100000.txt"
-    ]
-    
-    num_execucoes = 30  # Número de execuções para média/desvio padrão
+    # Configurar argumentos de linha de comando
+    parser = argparse.ArgumentParser(description='Executa o benchmark do MergeSort em Python.')
+    parser.add_argument('--motores', nargs='+', choices=list(MOTORES), default=['recursivo'],
+                        help='Motores de ordenação a comparar nas mesmas entradas')
+    parser.add_argument('--formato', choices=['txt', 'bin'], default='txt',
+                        help='Formato dos arquivos de entrada (texto ou binário)')
+    parser.add_argument('--arquivos', nargs='+', default=None,
+                        help='Arquivos de entrada (padrão: as entradas de --grupos e --tamanhos)')
+    parser.add_argument('--grupos', nargs='+', choices=list(GRUPOS_ENTRADAS), default=['classicas'],
+                        help='Grupos de famílias de entrada de gerar_entradas.py')
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[10000, 50000, 100000],
+                        help='Tamanhos das entradas')
+    parser.add_argument('--execucoes', type=int, default=30,
+                        help='Número (mínimo, com --erro-alvo) de execuções medidas')
+    parser.add_argument('--aquecimento', type=int, default=0,
+                        help='Execuções de aquecimento descartadas')
+    parser.add_argument('--sem-gc', action='store_true',
+                        help='Desativa o coletor de lixo durante as medições')
+    parser.add_argument('--erro-alvo', type=float, default=None,
+                        help='Erro relativo alvo (ex.: 0.01) para parada adaptativa')
+    parser.add_argument('--max-execucoes', type=int, default=None,
+                        help='Limite de execuções na parada adaptativa')
+    parser.add_argument('--cpus', type=int, nargs='+', default=None,
+                        help='Fixa o processo nestas CPUs')
+    parser.add_argument('--memoria', action='store_true',
+                        help='Mede também pico de memória, alocações e pico de RSS')
+    parser.add_argument('--contadores', action='store_true',
+                        help='Conta comparações, movimentos, chamadas de merge e profundidade '
+                             '(motores com versão instrumentada)')
+    parser.add_argument('--sem-cache', action='store_true',
+                        help='Ignora o armazém de resultados e mede tudo novamente')
+    args = parser.parse_args()
+    
+    if args.memoria and contador_alocacoes is None:
+        print("Extensão contador_alocacoes não compilada; Alocacoes e Bytes_Alocados ficarão vazios.")
+    
+    if args.cpus:
+        fixar_cpus(args.cpus)
+    
+    # Lista de arquivos de entrada para testar (por padrão, as 15 entradas clássicas)
+    arquivos = arquivos_entradas(args.grupos, args.tamanhos, args.formato)
+    if args.arquivos:
+        arquivos = args.arquivos
+    
+    num_execucoes = args.execucoes  # Número de execuções para média/desvio padrão
     
     # Preparar dataframes para resultados
     resultados = []
-    tempos_individuais = []
+    # Execuções em formato longo para o armazém colunar
+    execucoes = []
+    
+    # Armazém de resultados: combinações já medidas com a mesma entrada, o mesmo
+    # código de motor, a mesma configuração e na mesma máquina não são refeitas
+    cache = cache_resultados.carregar_cache()
+    configuracao = {
+        'aquecimento': args.aquecimento,
+        'sem_gc': args.sem_gc,
+        'erro_alvo': args.erro_alvo,
+        'max_execucoes': args.max_execucoes,
+        'memoria': args.memoria,
+        'contadores': args.contadores
+    }
+    commit = resultados_colunares.commit_atual()
+    medicoes_colunares = resultados_colunares.medicoes_armazenadas()
+    # Mudanças na medição e no resumo (medir_tempo_execucao, resumir_tempos...)
+    # também invalidam os resultados armazenados
+    harness = (ler_vetor_do_arquivo, medir_tempo_execucao, medir_memoria, contar_operacoes)
+    hashes_motores = {motor: cache_resultados.hash_codigo(MOTORES[motor], *harness)
+                      for motor in args.motores}
+    if 'c' in hashes_motores:
+        # O motor em C é invalidado por mudanças no próprio código C
+        hashes_motores['c'] += cache_resultados.hash_arquivo(mergesort_nativo.ARQUIVO_FONTE)
     
     # Testa cada arquivo
     for arquivo in arquivos:
@@ -117,68 +1271,121 @@ def main():
             print(f"Arquivo {arquivo} não encontrado!")
             continue
         
+        hash_entrada = cache_resultados.hash_arquivo(arquivo)
+        chaves = {motor: cache_resultados.chave_resultado(hash_entrada, motor, hashes_motores[motor],
+                                                          num_execucoes, configuracao)
+                  for motor in args.motores}
+        pendentes = [motor for motor in args.motores if args.sem_cache or chaves[motor] not in cache]
+        
+        # Reaproveita os resultados já armazenados
+        for motor in args.motores:
+            if motor in pendentes:
+                continue
+            entrada = cache[chaves[motor]]
+            print(f"[{motor}] Resultado reaproveitado do armazém")
+            resultados.append(entrada['resultado'])
+            # Medições anteriores ao armazém colunar entram nele agora
+            if chaves[motor] not in medicoes_colunares:
+                execucoes.extend(resultados_colunares.linhas_execucoes(
+                    entrada['resultado'], entrada['tempos'], chaves[motor],
+                    maquina=entrada['maquina'], criado_em=entrada['criado_em']))
+        
+        if not pendentes:
+            continue
+        
         vetor = ler_vetor_do_arquivo(arquivo)
         
         print(f"Analisando arquivo: {arquivo}")
         print(f"Tamanho do vetor: {len(vetor)}")
         
-        # Extrai o tipo de entrada do nome do arquivo
-        tipo = ""
-        if "aleatoria" in arquivo:
-            tipo = "aleatoria"
-        elif "ordenada_crescente" in arquivo:
-            tipo = "ordenada_crescente"
-        elif "ordenada_decrescente" in arquivo:
-            tipo = "ordenada_decrescente"
-        elif "quase_ordenada" in arquivo:
-            tipo = "quase_ordenada"
-        elif "com_duplicatas" in arquivo:
-            tipo = "com_duplicatas"
-        
-        # Mede tempo de execução e calcula estatísticas
-        stats = medir_tempo_execucao(vetor, num_execucoes)
-        
-        print(f"Tempo médio de execução ({num_execucoes} execuções): {stats['media']} segundos")
-        print(f"Desvio padrão: {stats['desvio_padrao']} segundos")
-        
-        # Calcula a complexidade teórica (n log n para MergeSort)
+        # Extrai o tipo de entrada (família e parâmetros) do nome do arquivo
+        tipo = tipo_do_arquivo(arquivo)
+        
         tamanho = len(vetor)
-        complexidade_teorica = tamanho * math.log2(tamanho)
-        
-        # Normaliza a complexidade teórica para comparação com tempos medidos
-        fator_escala = stats['media'] / complexidade_teorica
-        
-        # Adiciona aos resultados
-        resultados.append({
-            'Arquivo': arquivo,
-            'Tipo': tipo,
-            'Tamanho': tamanho,
-            'Media_Tempo(s)': stats['media'],
-            'Desvio_Padrao(s)': stats['desvio_padrao'],
-            'Complexidade_Teorica': complexidade_teorica * fator_escala
-        })
-        
-        # Adiciona tempos individuais
-        tempo_individual = {
-            'Arquivo': arquivo,
-            'Tipo': tipo,
-            'Tamanho': tamanho
-        }
-        for i, tempo in enumerate(stats['tempos']):
-            tempo_individual[f'Execucao_{i+1}'] = tempo
-        
-        tempos_individuais.append(tempo_individual)
-    
-    # Cria DataFrames a partir das listas
-    df_resultados = pd.DataFrame(resultados)
-    df_tempos = pd.DataFrame(tempos_individuais)
+        
+        for motor in pendentes:
+            # Mede tempo de execução e calcula estatísticas
+            stats = medir_tempo_execucao(vetor, num_execucoes, motor, args.aquecimento,
+                                         args.sem_gc, args.erro_alvo, args.max_execucoes)
+            
+            print(f"[{motor}] Tempo médio de execução ({len(stats['tempos'])} execuções): {stats['media']} segundos")
+            print(f"[{motor}] Desvio padrão: {stats['desvio_padrao']} segundos")
+            print(f"[{motor}] Mediana: {stats['mediana']} segundos "
+                  f"(IC {CONFIANCA:.0%}: {stats['ic_inferior']} a {stats['ic_superior']})")
+            
+            if args.memoria:
+                memoria = medir_memoria(vetor, motor)
+                print(f"[{motor}] Pico de memória: {memoria['pico_memoria']} bytes")
+            
+            operacoes = contar_operacoes(vetor, motor) if args.contadores else None
+            if operacoes:
+                print(f"[{motor}] Comparações: {operacoes['comparacoes']}, movimentos: {operacoes['movimentos']}")
+            elif args.contadores:
+                print(f"[{motor}] Sem versão instrumentada: contadores não medidos")
+            
+            # Adiciona aos resultados
+            resultados.append({
+                'Arquivo': arquivo,
+                'Tipo': tipo,
+                'Motor': motor,
+                'Tamanho': tamanho,
+                'Media_Tempo(s)': stats['media'],
+                'Desvio_Padrao(s)': stats['desvio_padrao'],
+                'Execucoes': len(stats['tempos']),
+                'Mediana_Tempo(s)': stats['mediana'],
+                'P5_Tempo(s)': stats['p5'],
+                'P95_Tempo(s)': stats['p95'],
+                'Min_Tempo(s)': stats['minimo'],
+                'IC95_Inferior(s)': stats['ic_inferior'],
+                'IC95_Superior(s)': stats['ic_superior']
+            })
+            if args.memoria:
+                resultados[-1].update({
+                    'Pico_Memoria(bytes)': memoria['pico_memoria'],
+                    'Bytes_Alocados': memoria['bytes_alocados'],
+                    'Alocacoes': memoria['alocacoes'],
+                    'Pico_RSS(bytes)': memoria['pico_rss']
+                })
+            if args.contadores:
+                operacoes = operacoes or {}
+                resultados[-1].update({
+                    'Comparacoes': operacoes.get('comparacoes'),
+                    'Movimentos': operacoes.get('movimentos'),
+                    'Chamadas_Merge': operacoes.get('chamadas_merge'),
+                    'Profundidade_Max': operacoes.get('profundidade_max')
+                })
+            
+            # Adiciona os tempos individuais, uma linha por execução
+            execucoes.extend(resultados_colunares.linhas_execucoes(
+                resultados[-1], stats['tempos'], chaves[motor], commit))
+            
+            # Guarda no armazém a cada medição, para não perder trabalho se a execução parar
+            cache_resultados.registrar(cache, chaves[motor], 'python', resultados[-1], stats['tempos'])
+            cache_resultados.salvar_cache(cache)
     
-    # Salva os resultados em arquivos CSV
+    # Cria o DataFrame a partir da lista e salva o resumo em CSV
+    df_resultados = pd.DataFrame(resultados)
     df_resultados.to_csv('resultados_mergesort_python_detalhado.csv', index=False)
-    df_tempos.to_csv('tempos_individuais_mergesort_python.csv', index=False)
+    
+    # Tempos individuais: acrescentados ao armazém colunar
+    resultados_colunares.anexar_execucoes(execucoes, 'python')
     
     print("\nResultados salvos em resultados_mergesort_python_detalhado.csv")
-    print("Tempos individuais salvos em tempos_individuais_mergesort_python.csv")
+    print(f"{len(execucoes)} tempo(s) individual(is) acrescentado(s) a {resultados_colunares.DIRETORIO_RESULTADOS}/")
+    
+    # Compromisso tempo x memória: médias por motor relativas ao primeiro motor pedido
+    if args.memoria and len(args.motores) > 1 and not df_resultados.empty:
+        print("\nTempo e pico de memória relativos ao motor", args.motores[0])
+        referencia = df_resultados[df_resultados['Motor'] == args.motores[0]].set_index('Arquivo')
+        for motor in args.motores[1:]:
+            dados = df_resultados[df_resultados['Motor'] == motor].set_index('Arquivo')
+            comuns = dados.index.intersection(referencia.index)
+            if comuns.empty:
+                continue
+            tempo = (dados.loc[comuns, 'Mediana_Tempo(s)'] / referencia.loc[comuns, 'Mediana_Tempo(s)']).mean()
+            memoria = (dados.loc[comuns, 'Pico_Memoria(bytes)'] /
+                       referencia.loc[comuns, 'Pico_Memoria(bytes)']).mean()
+            print(f"  {motor}: tempo {tempo:.2f}x, pico de memória {memoria:.3f}x")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,113 @@
+import time
+import argparse
+from bisect import bisect_right
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+from intercalacao_kway import intercalar_kway
+from mergesort_python import mergesort_bottom_up, resumir_tempos, ler_vetor_do_arquivo
+
+# Tamanho das folhas da árvore de intercalação, ordenadas por inserção binária
+TAMANHO_FOLHA = 32
+
+# Ordena arr[inicio:fim] por inserção binária, de forma estável; com reverse=True a
+# ordem é decrescente e os empates continuam na ordem original (ordena o trecho
+# invertido e inverte o resultado). Com indices=True (e chaves) devolve os índices
+# ordenados em vez dos elementos
+def ordenar_folha(arr, inicio, fim, chaves=None, reverse=False, indices=False):
+    posicoes = range(fim - 1, inicio - 1, -1) if reverse else range(inicio, fim)
+    folha = []
+    if chaves is None:
+        for i in posicoes:
+            x = arr[i]
+            folha.insert(bisect_right(folha, x), x)
+    else:
+        # Com key, a folha guarda índices ordenados pela chave pré-calculada
+        obter_chave = chaves.__getitem__
+        for i in posicoes:
+            folha.insert(bisect_right(folha, chaves[i], key=obter_chave), i)
+        if not indices:
+            folha = [arr[i] for i in folha]
+    if reverse:
+        folha.reverse()
+    return folha
+
+# MergeSort preguiçoso: ordena só as folhas (O(n)) e intercala as folhas sob
+# demanda com a árvore de perdedores, O(log n) por elemento emitido. Os k
+# primeiros custam O(n + k log n); o resultado é estável. Com key, a chave de
+# cada elemento é calculada uma única vez: folhas e intercalação trabalham com
+# índices e consultam a lista de chaves pré-calculadas
+def iter_sorted(arr, key=None, reverse=False, tamanho_folha=TAMANHO_FOLHA):
+    if key is None:
+        folhas = [ordenar_folha(arr, inicio, min(inicio + tamanho_folha, len(arr)), None, reverse)
+                  for inicio in range(0, len(arr), tamanho_folha)]
+        return intercalar_kway(*folhas, reverse=reverse)
+    chaves = [key(x) for x in arr]
+    folhas = [ordenar_folha(arr, inicio, min(inicio + tamanho_folha, len(arr)), chaves, reverse,
+                            indices=True)
+              for inicio in range(0, len(arr), tamanho_folha)]
+    return map(arr.__getitem__, intercalar_kway(*folhas, key=chaves.__getitem__, reverse=reverse))
+
+# Os k menores elementos (ou os k maiores, com reverse=True), em ordem e estáveis
+def topk(arr, k, key=None, reverse=False):
+    return list(islice(iter_sorted(arr, key, reverse), k))
+
+# Mede topk para cada k em relação a ordenar o vetor inteiro
+def medir_topk(vetor, valores_k, num_execucoes=5):
+    tempos_completo = []
+    for _ in range(num_execucoes):
+        copia = vetor.copy()
+        inicio = time.perf_counter_ns()
+        mergesort_bottom_up(copia)
+        tempos_completo.append((time.perf_counter_ns() - inicio) / 1e9)
+    completo = resumir_tempos(tempos_completo)['mediana']
+
+    resultados = []
+    for k in valores_k:
+        tempos = []
+        for _ in range(num_execucoes):
+            inicio = time.perf_counter_ns()
+            topk(vetor, k)
+            tempos.append((time.perf_counter_ns() - inicio) / 1e9)
+        stats = resumir_tempos(tempos)
+        resultados.append({
+            'Tamanho': len(vetor),
+            'K': k,
+            'Mediana_Tempo(s)': stats['mediana'],
+            'P5_Tempo(s)': stats['p5'],
+            'P95_Tempo(s)': stats['p95'],
+            'Mediana_Ordenacao_Completa(s)': completo,
+            'Speedup': completo / stats['mediana']
+        })
+        print(f"k={k}: {stats['mediana']:.4f} s (ordenação completa {completo:.4f} s, "
+              f"{completo / stats['mediana']:.1f}x)")
+    return pd.DataFrame(resultados)
+
+def main():
+    parser = argparse.ArgumentParser(description='Mede o top-k preguiçoso para k de 10 até n.')
+    parser.add_argument('--arquivo', default='entrada_aleatoria_100000.txt',
+                        help='Arquivo de entrada (texto ou .bin)')
+    parser.add_argument('--execucoes', type=int, default=5,
+                        help='Execuções por valor de k (usa a mediana)')
+    args = parser.parse_args()
+
+    vetor = ler_vetor_do_arquivo(args.arquivo)
+    if isinstance(vetor, np.ndarray):
+        vetor = vetor.tolist()
+
+    # k = 10, 100, 1000, ... até n
+    valores_k = []
+    k = 10
+    while k < len(vetor):
+        valores_k.append(k)
+        k *= 10
+    valores_k.append(len(vetor))
+
+    df = medir_topk(vetor, valores_k, args.execucoes)
+    df.to_csv('topk_python.csv', index=False)
+    print("\nResultados salvos em topk_python.csv")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+import time
+import argparse
+
+import numpy as np
+
+from gerar_entradas import ler_strings
+from mergesort_numpy import mergesort_numpy
+from mergesort_python import mergesort_chaves, insercao_binaria, mergesort_bottom_up, mergesort_natural
+
+# Grupos empatados de até este tamanho são ordenados por comparação completa
+LIMIAR_COMPARACAO = 16
+
+# Bytes de cada chave de prefixo
+BYTES_PREFIXO = 8
+
+# Chaves de 8 bytes usadas por vez em cada grupo (até 32 bytes da string)
+MAX_CHAVES = 4
+
+# Converte str (UTF-8, que preserva a ordem dos code points) e objetos com
+# protocolo de buffer em bytes
+def para_bytes(valor):
+    if isinstance(valor, str):
+        return valor.encode('utf-8', 'surrogatepass')
+    return valor if isinstance(valor, bytes) else bytes(valor)
+
+# Matriz (len(dados), num_chaves) de chaves inteiras: a coluna c tem os 8 bytes
+# de cada dado a partir de profundidade + 8c (completados com zeros), lidos em
+# big-endian para que a ordem dos inteiros seja a ordem dos bytes; o bit de
+# sinal é invertido para caberem em int64 com a mesma ordem
+def chaves_prefixo(dados, profundidade=0, num_chaves=1):
+    largura = BYTES_PREFIXO * num_chaves
+    fim = profundidade + largura
+    bruto = b''.join([d[profundidade:fim].ljust(largura, b'\0') for d in dados])
+    chaves = np.frombuffer(bruto, dtype='>u8') ^ np.uint64(1 << 63)
+    return chaves.astype(np.uint64).view(np.int64).reshape(len(dados), num_chaves)
+
+# Índices de um grupo ordenados por comparação completa das strings: inserção
+# binária dos pares (dado, índice) nos grupos pequenos, MergeSort nos demais
+def ordenar_por_comparacao(grupo, trecho):
+    if len(grupo) > LIMIAR_COMPARACAO:
+        trecho = list(trecho)
+        mergesort_chaves(list(grupo), trecho)
+        return trecho
+    # Índices crescentes entre strings iguais mantêm a ordem original
+    pares = list(zip(grupo, trecho))
+    insercao_binaria(pares, 0, len(pares), 1)
+    return [i for _, i in pares]
+
+# Permutação estável que ordena strings ou bytes. Cada grupo pula o prefixo
+# comum a todas as suas strings e é ordenado pelas chaves de 8 bytes seguintes
+# (até MAX_CHAVES) com passadas LSD do MergeSort vetorizado, sem comparar
+# strings. Os empates cujas strings continuam além das chaves seguem para os
+# bytes seguintes (como um radix MSD); só os grupos pequenos ou com strings que
+# terminaram dentro das chaves usam a comparação completa
+def argsort_strings(valores):
+    dados = [para_bytes(v) for v in valores]
+    n = len(dados)
+    indices = list(range(n))
+    # Trechos [inicio, fim) de indices cujas strings têm os primeiros profundidade bytes iguais
+    pendentes = [(0, n, 0)] if n > 1 else []
+    while pendentes:
+        inicio, fim, profundidade = pendentes.pop()
+        trecho = indices[inicio:fim]
+        grupo = [dados[i] for i in trecho]
+        if fim - inicio <= LIMIAR_COMPARACAO:
+            indices[inicio:fim] = ordenar_por_comparacao(grupo, trecho)
+            continue
+
+        menor, maior = min(grupo), max(grupo)
+        if menor == maior:
+            # Strings iguais já estão na ordem original
+            continue
+        profundidade = calcular_lcp(menor, maior, profundidade)
+        restante = max(map(len, grupo)) - profundidade
+        num_chaves = min(MAX_CHAVES, -(-restante // BYTES_PREFIXO))
+
+        # Passadas estáveis da chave menos para a mais significativa
+        chaves = chaves_prefixo(grupo, profundidade, num_chaves)
+        ordem = np.arange(len(grupo))
+        for coluna in reversed(range(num_chaves)):
+            ordem = ordem[mergesort_numpy(chaves[ordem, coluna], argsort=True)]
+        chaves = chaves[ordem]
+        ordem = ordem.tolist()
+        trecho = [trecho[i] for i in ordem]
+        grupo = [grupo[i] for i in ordem]
+        indices[inicio:fim] = trecho
+
+        # Grupos de linhas de chaves empatadas
+        diferentes = np.flatnonzero(np.any(chaves[1:] != chaves[:-1], axis=1)) + 1
+        limites = [0] + diferentes.tolist() + [len(grupo)]
+        proxima = profundidade + BYTES_PREFIXO * num_chaves
+        for a, b in zip(limites, limites[1:]):
+            if b - a < 2:
+                continue
+            if b - a > LIMIAR_COMPARACAO and min(map(len, grupo[a:b])) > proxima:
+                pendentes.append((inicio + a, inicio + b, proxima))
+            else:
+                # Grupo pequeno ou com strings que terminaram dentro das chaves
+                indices[inicio + a:inicio + b] = ordenar_por_comparacao(grupo[a:b], trecho[a:b])
+    return indices
+
+# Nova lista com as strings (ou bytes) em ordem, estável
+def ordenar_strings(valores):
+    return [valores[i] for i in argsort_strings(valores)]
+
+# Maior prefixo comum de a e b, sabendo que os primeiros inicio elementos já são iguais
+def calcular_lcp(a, b, inicio=0):
+    n = min(len(a), len(b))
+    k = inicio
+    while k + BYTES_PREFIXO <= n and a[k:k + BYTES_PREFIXO] == b[k:k + BYTES_PREFIXO]:
+        k += BYTES_PREFIXO
+    while k < n and a[k] == b[k]:
+        k += 1
+    return k
+
+# Intercala duas listas ordenadas de strings (ou bytes) usando os LCPs entre
+# vizinhos (lcp_x[i] = LCP(x[i-1], x[i])). Compara só a partir do prefixo
+# que já se sabe comum e nem compara quando os LCPs com a última string
+# emitida diferem. Retorna (saida, lcp_saida, chaves_saida); a tem
+# prioridade nos empates. Com chaves (ver chaves_lcp), os empates de LCP
+# dentro dos bytes da chave são decididos pelas chaves, calculadas uma
+# única vez, e o novo LCP vem do XOR delas
+def intercalar_lcp(a, lcp_a, b, lcp_b, chaves_a=None, chaves_b=None, profundidade=0):
+    if chaves_a is not None:
+        return _intercalar_lcp_chaves(a, lcp_a, b, lcp_b, chaves_a, chaves_b, profundidade)
+    saida = []
+    lcp_saida = []
+    emitir = saida.append
+    emitir_lcp = lcp_saida.append
+    na, nb = len(a), len(b)
+    i = j = 0
+    # LCP de a[i] e de b[j] com a última string emitida
+    ha = hb = 0
+    while i < na and j < nb:
+        if ha > hb:
+            # a[i] concorda mais com a última emitida: é a menor
+            emitir(a[i])
+            emitir_lcp(ha)
+            i += 1
+            ha = lcp_a[i] if i < na else 0
+        elif hb > ha:
+            emitir(b[j])
+            emitir_lcp(hb)
+            j += 1
+            hb = lcp_b[j] if j < nb else 0
+        else:
+            # Compara a partir do prefixo comum já conhecido; o primeiro
+            # elemento costuma decidir, sem calcular o LCP inteiro
+            x, y = a[i], b[j]
+            k = ha
+            if k < len(x) and k < len(y) and x[k] == y[k]:
+                k = calcular_lcp(x, y, k + 1)
+            if k == len(x) or (k < len(y) and x[k] < y[k]):
+                emitir(x)
+                emitir_lcp(ha)
+                i += 1
+                ha = lcp_a[i] if i < na else 0
+                hb = k
+            else:
+                emitir(y)
+                emitir_lcp(hb)
+                j += 1
+                hb = lcp_b[j] if j < nb else 0
+                ha = k
+
+    if i < na:
+        saida.extend(a[i:])
+        lcp_saida.append(ha)
+        lcp_saida.extend(lcp_a[i + 1:])
+    elif j < nb:
+        saida.extend(b[j:])
+        lcp_saida.append(hb)
+        lcp_saida.extend(lcp_b[j + 1:])
+    return saida, lcp_saida, None
+
+# intercalar_lcp com as chaves dos bytes [profundidade, profundidade + BYTES_CHAVE_LCP)
+def _intercalar_lcp_chaves(a, lcp_a, b, lcp_b, chaves_a, chaves_b, profundidade):
+    saida = []
+    lcp_saida = []
+    chaves_saida = []
+    emitir = saida.append
+    emitir_lcp = lcp_saida.append
+    emitir_chave = chaves_saida.append
+    fim_chave = profundidade + BYTES_CHAVE_LCP
+    bits_chave = 8 * BYTES_CHAVE_LCP
+    na, nb = len(a), len(b)
+    i = j = 0
+    ha = hb = 0
+    while i < na and j < nb:
+        if ha > hb:
+            emitir(a[i])
+            emitir_lcp(ha)
+            emitir_chave(chaves_a[i])
+            i += 1
+            ha = lcp_a[i] if i < na else 0
+        elif hb > ha:
+            emitir(b[j])
+            emitir_lcp(hb)
+            emitir_chave(chaves_b[j])
+            j += 1
+            hb = lcp_b[j] if j < nb else 0
+        else:
+            x, y = a[i], b[j]
+            k = ha
+            if k < fim_chave:
+                ca, cb = chaves_a[i], chaves_b[j]
+                if ca != cb:
+                    # O byte mais alto do XOR marca a primeira diferença
+                    k = min(profundidade + (bits_chave - (ca ^ cb).bit_length()) // 8, len(x), len(y))
+                    primeiro_a = ca < cb
+                else:
+                    # Chaves iguais: os bytes da chave (até o fim da menor) são comuns
+                    k = min(fim_chave, len(x), len(y))
+                    if k < len(x) and k < len(y):
+                        k = calcular_lcp(x, y, k)
+                    primeiro_a = k == len(x) or (k < len(y) and x[k] < y[k])
+            else:
+                if k < len(x) and k < len(y) and x[k] == y[k]:
+                    k = calcular_lcp(x, y, k + 1)
+                primeiro_a = k == len(x) or (k < len(y) and x[k] < y[k])
+            if primeiro_a:
+                emitir(x)
+                emitir_lcp(ha)
+                emitir_chave(chaves_a[i])
+                i += 1
+                ha = lcp_a[i] if i < na else 0
+                hb = k
+            else:
+                emitir(y)
+                emitir_lcp(hb)
+                emitir_chave(chaves_b[j])
+                j += 1
+                hb = lcp_b[j] if j < nb else 0
+                ha = k
+
+    if i < na:
+        saida.extend(a[i:])
+        lcp_saida.append(ha)
+        lcp_saida.extend(lcp_a[i + 1:])
+        chaves_saida.extend(chaves_a[i:])
+    elif j < nb:
+        saida.extend(b[j:])
+        lcp_saida.append(hb)
+        lcp_saida.extend(lcp_b[j + 1:])
+        chaves_saida.extend(chaves_b[j:])
+    return saida, lcp_saida, chaves_saida
+
+# Tamanho dos runs iniciais do MergeSort LCP, ordenados por inserção binária
+TAMANHO_RUN_LCP = 32
+
+# Bytes de cada chave da intercalação LCP: MAX_CHAVES chaves de prefixo juntas
+BYTES_CHAVE_LCP = BYTES_PREFIXO * MAX_CHAVES
+
+# Chaves da intercalação LCP: (chaves, profundidade), em que a chave de cada
+# valor são as MAX_CHAVES chaves de prefixo seguintes ao prefixo comum a todos
+# os valores (de tamanho profundidade), unidas em um inteiro do Python sem
+# sinal (o XOR de duas chaves localiza o primeiro byte diferente). (None, 0)
+# quando o LCP em caracteres não corresponde ao LCP em bytes (str não ASCII)
+def chaves_lcp(valores):
+    if all(isinstance(v, bytes) for v in valores):
+        dados = valores
+    elif all(isinstance(v, str) and v.isascii() for v in valores):
+        dados = [v.encode('ascii') for v in valores]
+    else:
+        return None, 0
+    profundidade = calcular_lcp(min(dados), max(dados))
+    chaves = chaves_prefixo(dados, profundidade, MAX_CHAVES).view(np.uint64) ^ np.uint64(1 << 63)
+    bruto = chaves.astype('>u8').tobytes()
+    de_bytes = int.from_bytes
+    return [de_bytes(bruto[i:i + BYTES_CHAVE_LCP], 'big')
+            for i in range(0, len(bruto), BYTES_CHAVE_LCP)], profundidade
+
+# MergeSort com intercalação LCP (bottom-up a partir de runs ordenados por
+# inserção binária); retorna a nova lista ordenada e seus LCPs entre vizinhos.
+# As chaves de prefixo são calculadas uma vez e acompanham os runs.
+# Aceita str ou bytes, sem misturar
+def mergesort_lcp(valores):
+    if not len(valores):
+        return [], []
+    chaves, profundidade = chaves_lcp(valores)
+    runs = []
+    for inicio in range(0, len(valores), TAMANHO_RUN_LCP):
+        run = list(valores[inicio:inicio + TAMANHO_RUN_LCP])
+        chaves_run = None
+        if chaves is not None:
+            # Valores iguais têm chaves iguais: os pares mantêm a estabilidade
+            pares = list(zip(chaves[inicio:inicio + TAMANHO_RUN_LCP], run))
+            insercao_binaria(pares, 0, len(pares), 1)
+            chaves_run = [c for c, _ in pares]
+            run = [v for _, v in pares]
+        else:
+            insercao_binaria(run, 0, len(run), 1)
+        runs.append((run, [0] + [calcular_lcp(run[i - 1], run[i]) for i in range(1, len(run))],
+                     chaves_run))
+    while len(runs) > 1:
+        novos = []
+        for (a, lcp_a, chaves_a), (b, lcp_b, chaves_b) in zip(runs[::2], runs[1::2]):
+            novos.append(intercalar_lcp(a, lcp_a, b, lcp_b, chaves_a, chaves_b, profundidade))
+        if len(runs) % 2:
+            novos.append(runs[-1])
+        runs = novos
+    return runs[0][:2]
+
+# Adapta um motor in-place para devolver a nova lista ordenada
+def em_copia(motor):
+    def ordenar_copia(valores):
+        copia = list(valores)
+        motor(copia)
+        return copia
+    return ordenar_copia
+
+# Métodos comparados no benchmark de strings
+METODOS = {
+    'bottom_up (<=)': em_copia(mergesort_bottom_up),
+    'natural (<)': em_copia(mergesort_natural),
+    'prefixo de 8 bytes': ordenar_strings,
+    'mergesort LCP': lambda valores: mergesort_lcp(valores)[0],
+    'sorted (referência)': sorted,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description='Compara a ordenação de strings por prefixo e por LCP com o MergeSort genérico.')
+    parser.add_argument('arquivos', nargs='*',
+                        default=['entrada_urls_100000.txt', 'entrada_caminhos_100000.txt'],
+                        help='Arquivos de strings (python gerar_entradas.py --grupos strings)')
+    parser.add_argument('--bytes', action='store_true',
+                        help='Ordena as strings codificadas em UTF-8 (bytes)')
+    parser.add_argument('--execucoes', type=int, default=3,
+                        help='Execuções por método (usa a menor)')
+    args = parser.parse_args()
+
+    for arquivo in args.arquivos:
+        valores = ler_strings(arquivo)
+        if args.bytes:
+            valores = [para_bytes(v) for v in valores]
+        esperado = sorted(valores)
+        print(f"\n{arquivo} ({len(valores)} {'bytes' if args.bytes else 'strings'})")
+        for nome, metodo in METODOS.items():
+            tempos = []
+            for _ in range(args.execucoes):
+                inicio = time.perf_counter()
+                resultado = metodo(valores)
+                tempos.append(time.perf_counter() - inicio)
+            if resultado != esperado:
+                raise AssertionError(f"{nome} não ordenou {arquivo} corretamente")
+            print(f"  {nome}: {min(tempos):.3f} s")
+
+if __name__ == '__main__':
+    main()
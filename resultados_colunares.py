@@ -0,0 +1,201 @@
+import os
+import glob
+import time
+import argparse
+import subprocess
+
+import numpy as np
+import pandas as pd
+
+import cache_resultados
+
+# Armazém colunar dos tempos em formato longo (uma linha por execução medida),
+# particionado por linguagem e motor:
+#   resultados/linguagem=<linguagem>/motor=<motor>/parte-<ns>-<pid>.npz
+# Cada parte é gravada uma única vez (só acréscimo) e cada coluna é um array
+# separado no .npz, carregado apenas quando lido
+DIRETORIO_RESULTADOS = 'resultados'
+
+# Colunas de cada execução; cada linha leva também os metadados da medição
+# (Medicao, Commit, Maquina e Criado_Em)
+COLUNAS_EXECUCAO = ['Arquivo', 'Tipo', 'Tamanho', 'Execucao', 'Tempo(s)']
+
+# Métricas medidas uma vez por medição (--memoria e --contadores)
+COLUNAS_METRICAS = ['Pico_Memoria(bytes)', 'Bytes_Alocados', 'Alocacoes', 'Pico_RSS(bytes)',
+                    'Comparacoes', 'Movimentos', 'Chamadas_Merge', 'Profundidade_Max']
+
+# Commit atual do repositório ('' fora de um repositório git)
+def commit_atual():
+    try:
+        saida = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                               text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    except OSError:
+        return ''
+    return saida.stdout.strip() if saida.returncode == 0 else ''
+
+# Linhas longas de uma medição: resultado é a linha do CSV detalhado, tempos os
+# tempos individuais e medicao o identificador da medição (chave do armazém)
+def linhas_execucoes(resultado, tempos, medicao, commit='', maquina=None, criado_em=None):
+    metadados = {
+        'Medicao': medicao,
+        'Commit': commit,
+        'Maquina': maquina or cache_resultados.impressao_maquina(),
+        'Criado_Em': time.time() if criado_em is None else criado_em
+    }
+    metricas = {c: resultado[c] for c in COLUNAS_METRICAS
+                if resultado.get(c) is not None and not pd.isna(resultado[c])}
+    linhas = []
+    for i, tempo in enumerate(tempos):
+        linha = {
+            'Arquivo': resultado['Arquivo'],
+            'Tipo': resultado['Tipo'],
+            'Motor': resultado.get('Motor', 'recursivo'),
+            'Tamanho': resultado['Tamanho'],
+            'Execucao': i + 1,
+            'Tempo(s)': tempo
+        }
+        linha.update(metadados)
+        linha.update(metricas)
+        linhas.append(linha)
+    return linhas
+
+def diretorio_particao(linguagem, motor, diretorio=DIRETORIO_RESULTADOS):
+    return os.path.join(diretorio, f'linguagem={linguagem}', f'motor={motor}')
+
+# Acrescenta as linhas ao armazém: uma parte nova por motor, gravada em arquivo
+# temporário e renomeada, para que leitores nunca vejam uma parte incompleta
+def anexar_execucoes(linhas, linguagem, diretorio=DIRETORIO_RESULTADOS):
+    df = pd.DataFrame(linhas)
+    if df.empty:
+        return
+    for motor, dados in df.groupby('Motor'):
+        particao = diretorio_particao(linguagem, motor, diretorio)
+        os.makedirs(particao, exist_ok=True)
+        colunas = {}
+        for coluna in dados.columns.drop('Motor'):
+            valores = dados[coluna]
+            if pd.api.types.is_numeric_dtype(valores):
+                colunas[coluna] = valores.to_numpy()
+            else:
+                # Texto como array unicode de tamanho fixo (sem pickle)
+                colunas[coluna] = valores.astype(str).to_numpy(dtype=str)
+        nome = os.path.join(particao, f'parte-{time.time_ns()}-{os.getpid()}.npz')
+        temporario = nome + '.tmp'
+        with open(temporario, 'wb') as f:
+            np.savez_compressed(f, **colunas)
+        os.replace(temporario, nome)
+
+# Partes do armazém como (linguagem, motor, caminho), com filtro de partições
+def listar_partes(linguagem=None, motores=None, diretorio=DIRETORIO_RESULTADOS):
+    padrao = os.path.join(diretorio, f'linguagem={linguagem or "*"}', 'motor=*', 'parte-*.npz')
+    partes = []
+    for caminho in sorted(glob.glob(padrao)):
+        pasta_motor = os.path.dirname(caminho)
+        motor = os.path.basename(pasta_motor).split('=', 1)[1]
+        particao_linguagem = os.path.basename(os.path.dirname(pasta_motor)).split('=', 1)[1]
+        if motores is None or motor in motores:
+            partes.append((particao_linguagem, motor, caminho))
+    return partes
+
+# Lê as execuções das partições pedidas, carregando só as colunas pedidas
+# (todas, se colunas for None); colunas ausentes em uma parte ficam vazias
+def ler_execucoes(linguagem=None, motores=None, colunas=None, diretorio=DIRETORIO_RESULTADOS):
+    tabelas = []
+    for particao_linguagem, motor, caminho in listar_partes(linguagem, motores, diretorio):
+        with np.load(caminho) as parte:
+            nomes = parte.files if colunas is None else [c for c in colunas if c in parte.files]
+            tabela = pd.DataFrame({c: parte[c] for c in nomes})
+            tamanho = len(parte[parte.files[0]])
+        if tabela.empty:
+            tabela = pd.DataFrame(index=range(tamanho))
+        tabela['Linguagem'] = particao_linguagem
+        tabela['Motor'] = motor
+        tabelas.append(tabela)
+    if not tabelas:
+        return None
+    df = pd.concat(tabelas, ignore_index=True)
+    if colunas is not None:
+        df = df.reindex(columns=['Linguagem', 'Motor'] + [c for c in colunas if c not in ('Linguagem', 'Motor')])
+    return df
+
+# Resume as execuções no formato do CSV detalhado: por (Arquivo, Motor), usa a
+# medição mais recente (só desta máquina, a menos que todas_maquinas) e calcula
+# as estatísticas de tempo e a primeira ocorrência das métricas pedidas
+def carregar_resumo(linguagem, motores=None, metricas=(), todas_maquinas=False,
+                    diretorio=DIRETORIO_RESULTADOS):
+    colunas = COLUNAS_EXECUCAO + ['Medicao', 'Maquina', 'Criado_Em'] + list(metricas)
+    df = ler_execucoes(linguagem, motores, colunas, diretorio)
+    if df is None:
+        return None
+    if not todas_maquinas:
+        df = df[df['Maquina'] == cache_resultados.impressao_maquina()]
+        if df.empty:
+            return None
+
+    # Medição mais recente de cada arquivo e motor
+    recentes = df.groupby(['Arquivo', 'Motor'])['Criado_Em'].transform('max')
+    df = df[df['Criado_Em'] == recentes]
+
+    chaves = ['Arquivo', 'Tipo', 'Motor', 'Tamanho']
+    grupos = df.groupby(chaves, sort=False)
+    tempos = grupos['Tempo(s)']
+    resumo = pd.DataFrame({
+        'Media_Tempo(s)': tempos.mean(),
+        'Desvio_Padrao(s)': tempos.std().fillna(0),
+        'Execucoes': tempos.size(),
+        'Mediana_Tempo(s)': tempos.median(),
+        'P5_Tempo(s)': tempos.quantile(0.05),
+        'P95_Tempo(s)': tempos.quantile(0.95),
+        'Min_Tempo(s)': tempos.min()
+    })
+    for metrica in metricas:
+        resumo[metrica] = grupos[metrica].first()
+    return resumo.reset_index()
+
+# Identificadores das medições já presentes no armazém
+def medicoes_armazenadas(diretorio=DIRETORIO_RESULTADOS):
+    df = ler_execucoes(colunas=['Medicao'], diretorio=diretorio)
+    return set() if df is None else set(df['Medicao'])
+
+# Importa para o armazém colunar as medições do armazém JSON que ainda não estão nele
+def importar_cache(caminho_cache=cache_resultados.ARQUIVO_CACHE, diretorio=DIRETORIO_RESULTADOS):
+    cache = cache_resultados.carregar_cache(caminho_cache)
+    existentes = medicoes_armazenadas(diretorio)
+    linhas_por_linguagem = {}
+    for chave, entrada in cache.items():
+        if chave in existentes:
+            continue
+        linhas_por_linguagem.setdefault(entrada['linguagem'], []).extend(
+            linhas_execucoes(entrada['resultado'], entrada['tempos'], chave,
+                             maquina=entrada['maquina'], criado_em=entrada['criado_em']))
+
+    for linguagem, linhas in linhas_por_linguagem.items():
+        anexar_execucoes(linhas, linguagem, diretorio)
+        print(f"{linguagem}: {len(linhas)} execução(ões) importada(s) para {diretorio}/")
+    if not linhas_por_linguagem:
+        print("Nenhuma medição nova para importar")
+
+def main():
+    parser = argparse.ArgumentParser(description='Armazém colunar dos tempos de execução.')
+    subparsers = parser.add_subparsers(dest='comando', required=True)
+    importar = subparsers.add_parser('importar', help='Importa as medições de cache_resultados.json')
+    importar.add_argument('--c', action='store_true',
+                          help='Importa antes os CSVs do programa em C para o armazém JSON')
+    resumo = subparsers.add_parser('resumo', help='Mostra o resumo por arquivo e motor')
+    resumo.add_argument('linguagem', choices=['c', 'python'])
+    resumo.add_argument('--motores', nargs='+', default=None)
+    args = parser.parse_args()
+
+    if args.comando == 'importar':
+        if args.c:
+            cache_resultados.importar_resultados_c()
+        importar_cache()
+    else:
+        df = carregar_resumo(args.linguagem, args.motores)
+        if df is None:
+            print(f"Nenhum resultado de {args.linguagem} no armazém")
+        else:
+            print(df.to_string(index=False))
+
+if __name__ == '__main__':
+    main()
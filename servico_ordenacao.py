@@ -0,0 +1,412 @@
+import os
+import sys
+import stat
+import time
+import json
+import socket
+import struct
+import asyncio
+import argparse
+import statistics
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from formato_binario import CODIGOS_DTYPE, DTYPE_CODIGOS
+
+# Serviço local de ordenação em um socket Unix (asyncio). Protocolo, little-endian:
+#   quadro   = tamanho do corpo (u64) + corpo
+#   pedido   = tipo (u8, códigos de formato_binario) + flags (u8) + tamanho do nome
+#              do motor (u16) + prazo em segundos (f64, 0 = sem prazo) + nome do
+#              motor + elementos brutos
+#   resposta = status (u8) + tipo (u8) + elementos ordenados, mensagem de erro ou
+#              JSON das estatísticas
+CAMINHO_SOCKET = '/tmp/mergesort.sock'
+FORMATO_TAMANHO = '<Q'
+FORMATO_PEDIDO = '<BBHd'
+FORMATO_RESPOSTA = '<BB'
+TAMANHO_TAMANHO = struct.calcsize(FORMATO_TAMANHO)
+TAMANHO_PEDIDO = struct.calcsize(FORMATO_PEDIDO)
+TAMANHO_RESPOSTA = struct.calcsize(FORMATO_RESPOSTA)
+
+# Flag do pedido que pede as estatísticas do serviço em vez de ordenar
+FLAG_ESTATISTICAS = 1
+
+STATUS_OK = 0
+STATUS_PRAZO = 1
+STATUS_ERRO = 2
+
+MOTOR_PADRAO = 'recursivo'
+
+# Pedidos com até este número de elementos são agrupados em lotes
+LIMIAR_LOTE = 10_000
+# Um lote é enviado ao atingir este número de elementos ou após esta janela
+ELEMENTOS_LOTE = 100_000
+JANELA_LOTE = 0.002
+
+# Contrapressão: tarefas no pool ao mesmo tempo e pedidos pequenos na fila;
+# acima disso o serviço para de ler novos pedidos das conexões
+MAX_EM_ANDAMENTO = 64
+MAX_FILA_LOTE = 1024
+
+# Maior corpo de quadro aceito
+TAMANHO_MAXIMO_QUADRO = 1 << 31
+
+# Latências guardadas para os percentis das estatísticas
+JANELA_LATENCIAS = 10_000
+
+# --- Trabalhadores (processos do pool) ---
+
+# Importa o módulo dos motores uma única vez por processo trabalhador
+def _iniciar_trabalhador():
+    import mergesort_python  # noqa: F401
+
+# Ordena os elementos brutos com o motor pedido e devolve (status, bytes)
+def _ordenar(dados, codigo, motor):
+    from mergesort_python import MOTORES, MOTORES_NUMPY
+    try:
+        if motor not in MOTORES:
+            raise ValueError(f"Motor '{motor}' desconhecido")
+        vetor = np.frombuffer(dados, dtype=CODIGOS_DTYPE[codigo])
+        vetor = vetor.copy() if motor in MOTORES_NUMPY else vetor.tolist()
+        MOTORES[motor](vetor)
+        return STATUS_OK, np.asarray(vetor, dtype=CODIGOS_DTYPE[codigo]).tobytes()
+    except Exception as e:
+        return STATUS_ERRO, str(e).encode()
+
+# Ordena um lote de pedidos pequenos em uma única tarefa do pool
+def _ordenar_lote(pedidos):
+    return [_ordenar(dados, codigo, motor) for dados, codigo, motor in pedidos]
+
+# --- Protocolo ---
+
+def montar_pedido(dados, codigo, motor=MOTOR_PADRAO, prazo=0.0, flags=0):
+    nome = motor.encode()
+    corpo = struct.pack(FORMATO_PEDIDO, codigo, flags, len(nome), prazo) + nome + dados
+    return struct.pack(FORMATO_TAMANHO, len(corpo)) + corpo
+
+def montar_resposta(status, codigo, dados):
+    corpo = struct.pack(FORMATO_RESPOSTA, status, codigo) + dados
+    return struct.pack(FORMATO_TAMANHO, len(corpo)) + corpo
+
+# Lê um quadro completo de um StreamReader; None quando a conexão termina
+async def ler_quadro(leitor):
+    try:
+        cabecalho = await leitor.readexactly(TAMANHO_TAMANHO)
+    except asyncio.IncompleteReadError:
+        return None
+    (tamanho,) = struct.unpack(FORMATO_TAMANHO, cabecalho)
+    if tamanho > TAMANHO_MAXIMO_QUADRO:
+        raise ValueError(f"Quadro de {tamanho} bytes excede o limite")
+    return await leitor.readexactly(tamanho)
+
+# --- Servidor ---
+
+def novas_estatisticas():
+    return {
+        'inicio': time.monotonic(),
+        'pedidos': 0,
+        'concluidos': 0,
+        'prazos_expirados': 0,
+        'erros': 0,
+        'elementos': 0,
+        'lotes': 0,
+        'pedidos_em_lote': 0,
+        'pedidos_grandes': 0,
+        'latencias': deque(maxlen=JANELA_LATENCIAS)
+    }
+
+# Resumo das estatísticas: vazão e latência (p50/p99) dos pedidos recentes
+def resumir_estatisticas(estatisticas):
+    decorrido = time.monotonic() - estatisticas['inicio']
+    latencias = sorted(estatisticas['latencias'])
+    resumo = {chave: valor for chave, valor in estatisticas.items()
+              if chave not in ('inicio', 'latencias')}
+    resumo['segundos_ativo'] = decorrido
+    resumo['pedidos_por_segundo'] = estatisticas['concluidos'] / decorrido if decorrido else 0.0
+    resumo['elementos_por_segundo'] = estatisticas['elementos'] / decorrido if decorrido else 0.0
+    if latencias:
+        resumo['latencia_p50'] = latencias[len(latencias) // 2]
+        resumo['latencia_p99'] = latencias[min(len(latencias) - 1, int(len(latencias) * 0.99))]
+    return resumo
+
+# Indica se já há um servidor aceitando conexões no socket
+def socket_ativo(caminho_socket):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as cliente:
+        try:
+            cliente.connect(caminho_socket)
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False
+    return True
+
+# Remove o socket deixado por um servidor que terminou; recusa se outro
+# servidor ainda o usa ou se o caminho não é um socket
+def liberar_socket(caminho_socket):
+    if not os.path.exists(caminho_socket):
+        return
+    if not stat.S_ISSOCK(os.stat(caminho_socket).st_mode):
+        raise RuntimeError(f"{caminho_socket} existe e não é um socket")
+    if socket_ativo(caminho_socket):
+        raise RuntimeError(f"Já há um serviço ouvindo em {caminho_socket}")
+    os.remove(caminho_socket)
+
+async def servir(caminho_socket=CAMINHO_SOCKET, num_trabalhadores=None):
+    liberar_socket(caminho_socket)
+    loop = asyncio.get_running_loop()
+
+    # O pool fica em um dicionário para ser trocado quando um trabalhador morre
+    def criar_pool():
+        return ProcessPoolExecutor(max_workers=num_trabalhadores or os.cpu_count() or 1,
+                                   initializer=_iniciar_trabalhador)
+    trabalhadores = {'pool': criar_pool()}
+    estatisticas = novas_estatisticas()
+    fila_lote = asyncio.Queue(maxsize=MAX_FILA_LOTE)
+    vagas = asyncio.Semaphore(MAX_EM_ANDAMENTO)
+
+    # Envia uma tarefa ao pool; a vaga só é devolvida quando ela termina de fato,
+    # mesmo que quem pediu já tenha desistido pelo prazo. Se o pool quebrou
+    # (um trabalhador morreu), ele é substituído e o erro segue para quem pediu
+    async def enviar_ao_pool(funcao, *argumentos):
+        await vagas.acquire()
+        pool = trabalhadores['pool']
+        try:
+            tarefa = pool.submit(funcao, *argumentos)
+        except (BrokenProcessPool, RuntimeError):
+            vagas.release()
+            if trabalhadores['pool'] is pool:
+                print("Pool de trabalhadores quebrado; criando outro", file=sys.stderr)
+                pool.shutdown(wait=False, cancel_futures=True)
+                trabalhadores['pool'] = criar_pool()
+            raise
+        tarefa.add_done_callback(lambda _: loop.call_soon_threadsafe(vagas.release))
+        return asyncio.wrap_future(tarefa)
+
+    # Agrupa pedidos pequenos até ELEMENTOS_LOTE elementos ou JANELA_LOTE segundos
+    async def formar_lotes():
+        while True:
+            lote = [await fila_lote.get()]
+            elementos = lote[0][3]
+            limite = loop.time() + JANELA_LOTE
+            while elementos < ELEMENTOS_LOTE:
+                restante = limite - loop.time()
+                if restante <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(fila_lote.get(), restante)
+                except asyncio.TimeoutError:
+                    break
+                lote.append(item)
+                elementos += item[3]
+
+            # Pedidos cujo prazo já expirou na fila não são enviados
+            lote = [item for item in lote if not item[4].done()]
+            if not lote:
+                continue
+            estatisticas['lotes'] += 1
+            estatisticas['pedidos_em_lote'] += len(lote)
+            try:
+                futuro = await enviar_ao_pool(_ordenar_lote, [item[:3] for item in lote])
+            except Exception as e:
+                # O erro vai para cada pedido do lote; o formador de lotes continua
+                for item in lote:
+                    if not item[4].done():
+                        item[4].set_exception(e)
+                continue
+
+            def distribuir(futuro, lote=lote):
+                if futuro.cancelled() or futuro.exception():
+                    resultados = [(STATUS_ERRO, b'Falha no trabalhador')] * len(lote)
+                else:
+                    resultados = futuro.result()
+                for item, resultado in zip(lote, resultados):
+                    if not item[4].done():
+                        item[4].set_result(resultado)
+            futuro.add_done_callback(distribuir)
+
+    # Processa um pedido de ordenação e devolve o quadro de resposta
+    async def atender(corpo, recebido):
+        codigo, flags, tamanho_nome, prazo = struct.unpack_from(FORMATO_PEDIDO, corpo)
+        if flags & FLAG_ESTATISTICAS:
+            dados = json.dumps(resumir_estatisticas(estatisticas)).encode()
+            return montar_resposta(STATUS_OK, 0, dados)
+
+        estatisticas['pedidos'] += 1
+        motor = corpo[TAMANHO_PEDIDO:TAMANHO_PEDIDO + tamanho_nome].decode()
+        dados = corpo[TAMANHO_PEDIDO + tamanho_nome:]
+        if codigo not in CODIGOS_DTYPE or len(dados) % CODIGOS_DTYPE[codigo].itemsize:
+            estatisticas['erros'] += 1
+            return montar_resposta(STATUS_ERRO, codigo, b'Tipo ou tamanho dos dados invalido')
+        quantidade = len(dados) // CODIGOS_DTYPE[codigo].itemsize
+        restante = None if prazo <= 0 else prazo - (time.monotonic() - recebido)
+
+        try:
+            if quantidade <= LIMIAR_LOTE:
+                futuro = loop.create_future()
+                await asyncio.wait_for(fila_lote.put((dados, codigo, motor, quantidade, futuro)),
+                                       restante)
+            else:
+                estatisticas['pedidos_grandes'] += 1
+                futuro = await asyncio.wait_for(enviar_ao_pool(_ordenar, dados, codigo, motor),
+                                                restante)
+            if restante is not None:
+                restante = prazo - (time.monotonic() - recebido)
+            status, resultado = await asyncio.wait_for(futuro, restante)
+        except asyncio.TimeoutError:
+            estatisticas['prazos_expirados'] += 1
+            return montar_resposta(STATUS_PRAZO, codigo, b'Prazo expirado')
+
+        if status == STATUS_OK:
+            estatisticas['concluidos'] += 1
+            estatisticas['elementos'] += quantidade
+            estatisticas['latencias'].append(time.monotonic() - recebido)
+        else:
+            estatisticas['erros'] += 1
+        return montar_resposta(status, codigo, resultado)
+
+    # Cada conexão é atendida em sequência: o próximo pedido só é lido depois
+    # da resposta, o que aplica contrapressão aos clientes. Uma falha ao
+    # atender um pedido vira um quadro de erro; a conexão continua aberta
+    async def conexao(leitor, escritor):
+        try:
+            while True:
+                corpo = await ler_quadro(leitor)
+                if corpo is None:
+                    break
+                try:
+                    resposta = await atender(corpo, time.monotonic())
+                except Exception as e:
+                    estatisticas['erros'] += 1
+                    resposta = montar_resposta(STATUS_ERRO, 0, f'Erro no servidor: {e}'.encode())
+                escritor.write(resposta)
+                await escritor.drain()
+        except Exception as e:
+            print(f"Conexão encerrada: {e}", file=sys.stderr)
+        finally:
+            escritor.close()
+
+    servidor = await asyncio.start_unix_server(conexao, path=caminho_socket)
+    tarefa_lotes = asyncio.create_task(formar_lotes())
+    print(f"Serviço de ordenação ouvindo em {caminho_socket}")
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        tarefa_lotes.cancel()
+        trabalhadores['pool'].shutdown(cancel_futures=True)
+        print(json.dumps(resumir_estatisticas(estatisticas), indent=2))
+
+# --- Clientes ---
+
+# Cliente assíncrono: ordena um vetor no serviço usando uma conexão aberta
+async def ordenar_remoto(leitor, escritor, vetor, motor=MOTOR_PADRAO, prazo=0.0):
+    vetor = np.asarray(vetor)
+    if vetor.dtype not in DTYPE_CODIGOS:
+        vetor = vetor.astype(np.int64)
+    codigo = DTYPE_CODIGOS[vetor.dtype.newbyteorder('<')]
+    escritor.write(montar_pedido(vetor.astype(vetor.dtype.newbyteorder('<'), copy=False).tobytes(),
+                                 codigo, motor, prazo))
+    await escritor.drain()
+    corpo = await ler_quadro(leitor)
+    status, codigo = struct.unpack_from(FORMATO_RESPOSTA, corpo)
+    dados = corpo[TAMANHO_RESPOSTA:]
+    if status == STATUS_PRAZO:
+        raise TimeoutError(dados.decode())
+    if status != STATUS_OK:
+        raise RuntimeError(dados.decode())
+    return np.frombuffer(dados, dtype=CODIGOS_DTYPE[codigo])
+
+# Cliente síncrono simples para quem não usa asyncio
+def ordenar_no_servico(vetor, caminho_socket=CAMINHO_SOCKET, motor=MOTOR_PADRAO, prazo=0.0):
+    async def executar():
+        leitor, escritor = await asyncio.open_unix_connection(caminho_socket)
+        try:
+            return await ordenar_remoto(leitor, escritor, vetor, motor, prazo)
+        finally:
+            escritor.close()
+    return asyncio.run(executar())
+
+async def ler_estatisticas(caminho_socket=CAMINHO_SOCKET):
+    leitor, escritor = await asyncio.open_unix_connection(caminho_socket)
+    try:
+        escritor.write(montar_pedido(b'', 0, flags=FLAG_ESTATISTICAS))
+        await escritor.drain()
+        corpo = await ler_quadro(leitor)
+        return json.loads(corpo[TAMANHO_RESPOSTA:])
+    finally:
+        escritor.close()
+
+# Gerador de carga: várias conexões enviando pedidos em sequência; mede latência
+# (p50/p99) e pedidos por segundo do lado do cliente
+async def gerar_carga(caminho_socket, conexoes, pedidos_por_conexao, tamanho, motor, prazo):
+    rng = np.random.default_rng(0)
+    latencias = []
+    falhas = {'prazo': 0, 'erro': 0}
+
+    async def cliente():
+        leitor, escritor = await asyncio.open_unix_connection(caminho_socket)
+        try:
+            for _ in range(pedidos_por_conexao):
+                vetor = rng.integers(0, 1_000_000, tamanho, dtype=np.int64)
+                inicio = time.perf_counter()
+                try:
+                    await ordenar_remoto(leitor, escritor, vetor, motor, prazo)
+                    latencias.append(time.perf_counter() - inicio)
+                except TimeoutError:
+                    falhas['prazo'] += 1
+                except RuntimeError:
+                    falhas['erro'] += 1
+        finally:
+            escritor.close()
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente() for _ in range(conexoes)))
+    decorrido = time.perf_counter() - inicio
+
+    latencias.sort()
+    resultado = {
+        'pedidos': len(latencias),
+        'prazos_expirados': falhas['prazo'],
+        'erros': falhas['erro'],
+        'segundos': decorrido,
+        'pedidos_por_segundo': len(latencias) / decorrido,
+    }
+    if latencias:
+        resultado['latencia_p50'] = statistics.median(latencias)
+        resultado['latencia_p99'] = latencias[min(len(latencias) - 1, int(len(latencias) * 0.99))]
+    return resultado
+
+def main():
+    parser = argparse.ArgumentParser(description='Serviço local de ordenação (socket Unix) e gerador de carga.')
+    parser.add_argument('--socket', default=CAMINHO_SOCKET, help='Caminho do socket Unix')
+    subcomandos = parser.add_subparsers(dest='comando', required=True)
+
+    servidor = subcomandos.add_parser('servidor', help='Inicia o serviço')
+    servidor.add_argument('--trabalhadores', type=int, default=None,
+                          help='Processos no pool (padrão: número de CPUs)')
+
+    carga = subcomandos.add_parser('carga', help='Gera carga e mede latência e vazão')
+    carga.add_argument('--conexoes', type=int, default=8, help='Conexões simultâneas')
+    carga.add_argument('--pedidos', type=int, default=100, help='Pedidos por conexão')
+    carga.add_argument('--tamanho', type=int, default=1000, help='Elementos por pedido')
+    carga.add_argument('--motor', default=MOTOR_PADRAO, help='Motor de ordenação')
+    carga.add_argument('--prazo', type=float, default=0.0, help='Prazo por pedido em segundos (0 = sem prazo)')
+
+    subcomandos.add_parser('estatisticas', help='Mostra as estatísticas do serviço')
+    args = parser.parse_args()
+
+    if args.comando == 'servidor':
+        try:
+            asyncio.run(servir(args.socket, args.trabalhadores))
+        except KeyboardInterrupt:
+            pass
+    elif args.comando == 'carga':
+        resultado = asyncio.run(gerar_carga(args.socket, args.conexoes, args.pedidos,
+                                            args.tamanho, args.motor, args.prazo))
+        print(json.dumps(resultado, indent=2))
+    else:
+        print(json.dumps(asyncio.run(ler_estatisticas(args.socket)), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+import numpy as np
+import pytest
+
+from formato_binario import converter_texto, ler_pedacos_texto
+
+def test_converter_texto():
+    np.testing.assert_array_equal(converter_texto(b'3\n-1\n\n20\n'), [3, -1, 20])
+    assert len(converter_texto(b'\n\n')) == 0
+
+def test_token_invalido_gera_erro(tmp_path):
+    caminho = tmp_path / 'entrada.txt'
+    caminho.write_bytes(b'1\n2\nx\n3\n')
+    with pytest.raises(ValueError):
+        list(ler_pedacos_texto(str(caminho), 4))
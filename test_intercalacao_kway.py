@@ -0,0 +1,53 @@
+import random
+
+import numpy as np
+import pytest
+
+from formato_binario import salvar_binario
+from intercalacao_kway import intercalar_kway
+
+# Entradas ordenadas de tamanhos variados (inclusive vazias) com pares
+# (chave, origem); a origem revela a estabilidade
+def gerar_entradas(rng, tipo, k, key, reverse):
+    entradas = []
+    for e in range(k):
+        n = rng.choice([0, 1, 7, 100])
+        if tipo == 'aleatoria':
+            chaves = [rng.randrange(10 ** 6) for _ in range(n)]
+        elif tipo == 'duplicatas':
+            chaves = [rng.randrange(3) for _ in range(n)]
+        else:
+            chaves = [n - i for i in range(n)]
+        entradas.append(sorted([(c, e, i) for i, c in enumerate(chaves)], key=key, reverse=reverse))
+    return entradas
+
+@pytest.mark.parametrize('tipo', ['aleatoria', 'duplicatas', 'decrescente'])
+@pytest.mark.parametrize('reverse', [False, True])
+@pytest.mark.parametrize('k', [1, 2, 3, 8, 13])
+def test_intercalar_kway(tipo, reverse, k):
+    rng = random.Random(k)
+    chave = lambda t: t[0]
+    entradas = gerar_entradas(rng, tipo, k, chave, reverse)
+    resultado = list(intercalar_kway(*map(iter, entradas), key=chave, reverse=reverse))
+    # sorted() sobre a concatenação das entradas é estável também com reverse=True
+    assert resultado == sorted([x for entrada in entradas for x in entrada],
+                               key=chave, reverse=reverse)
+
+def test_sem_entradas():
+    assert list(intercalar_kway()) == []
+
+def test_arquivos(tmp_path):
+    rng = np.random.default_rng(0)
+    caminhos = []
+    vetores = []
+    for i, binario in enumerate([True, False, True]):
+        vetor = np.sort(rng.integers(-50, 50, 1000))
+        caminho = tmp_path / (f'run{i}.bin' if binario else f'run{i}.txt')
+        if binario:
+            salvar_binario(vetor, str(caminho))
+        else:
+            caminho.write_text('\n'.join(map(str, vetor.tolist())) + '\n')
+        caminhos.append(str(caminho))
+        vetores.append(vetor)
+    resultado = list(intercalar_kway(*caminhos, elementos_bloco=64))
+    assert resultado == np.sort(np.concatenate(vetores)).tolist()
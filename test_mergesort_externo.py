@@ -0,0 +1,47 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from formato_binario import salvar_binario, carregar_binario
+from mergesort_externo import ordenar_arquivo_externo
+
+# Orçamento pequeno para forçar vários runs e passadas de intercalação
+MEMORIA_TESTE = 512 * 1024
+
+# Entrada texto com 150 mil inteiros: valores curtos (pior caso de elementos
+# por byte de texto) ou de 64 bits
+def escrever_entrada(caminho, largos):
+    rng = np.random.default_rng(0)
+    if largos:
+        vetor = rng.integers(-2 ** 62, 2 ** 62, 150_000)
+    else:
+        vetor = rng.integers(0, 10, 150_000)
+    if caminho.suffix == '.bin':
+        salvar_binario(vetor, str(caminho))
+    else:
+        caminho.write_text('\n'.join(map(str, vetor.tolist())) + '\n')
+    return vetor
+
+@pytest.mark.parametrize('entrada, saida', [('entrada.txt', 'saida.txt'),
+                                            ('entrada.txt', 'saida.bin'),
+                                            ('entrada.bin', 'saida.bin')])
+@pytest.mark.parametrize('largos', [False, True])
+def test_pico_de_memoria_respeita_o_orcamento(tmp_path, entrada, saida, largos):
+    vetor = escrever_entrada(tmp_path / entrada, largos)
+    caminho_saida = str(tmp_path / saida)
+
+    tracemalloc.start()
+    try:
+        ordenar_arquivo_externo(str(tmp_path / entrada), caminho_saida, MEMORIA_TESTE,
+                                fan_in=8, dir_temp=str(tmp_path))
+        pico = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert pico <= MEMORIA_TESTE
+    if saida.endswith('.bin'):
+        resultado = np.array(carregar_binario(caminho_saida))
+    else:
+        resultado = np.loadtxt(caminho_saida, dtype=np.int64)
+    np.testing.assert_array_equal(resultado, np.sort(vetor))
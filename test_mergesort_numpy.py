@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from mergesort_numpy import TAMANHO_BLOCO, mergesort_numpy
+
+# Tamanhos do benchmark, com vários níveis de intercalação acima dos blocos
+TAMANHOS = [10_000, 50_000, 100_000]
+
+@pytest.mark.parametrize('n', TAMANHOS)
+def test_varios_niveis_de_intercalacao(n):
+    assert n >= 32 * TAMANHO_BLOCO
+    vetor = np.random.default_rng(n).integers(-1000, 1000, n)
+    np.testing.assert_array_equal(mergesort_numpy(vetor), np.sort(vetor))
+
+@pytest.mark.parametrize('n', TAMANHOS)
+def test_argsort_estavel(n):
+    vetor = np.random.default_rng(n).integers(0, 50, n)
+    np.testing.assert_array_equal(mergesort_numpy(vetor, argsort=True),
+                                  np.argsort(vetor, kind='stable'))
+
+def test_float_com_zeros_e_nan():
+    vetor = np.random.default_rng(0).choice([np.nan, -0.0, 0.0, 1.5, -2.0], 20_000)
+    ordem = mergesort_numpy(vetor, argsort=True)
+    np.testing.assert_array_equal(ordem, np.argsort(vetor, kind='stable'))
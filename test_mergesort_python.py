@@ -0,0 +1,212 @@
+import random
+
+import pytest
+
+import mergesort_python
+from mergesort_python import (MIN_GALOPE, merge_galope, mergesort_natural, merge_in_place,
+                              mergesort_in_place, rotacionar, counting_sort, radix_sort_lsd,
+                              ordenar_inteiros, argsort, ordenar, chave_composta, MOTORES,
+                              contar_operacoes)
+
+# Registro comparado só pela chave; a posição original revela a estabilidade
+class Registro:
+    def __init__(self, chave, posicao):
+        self.chave = chave
+        self.posicao = posicao
+
+    def __lt__(self, outro):
+        return self.chave < outro.chave
+
+    def __gt__(self, outro):
+        return self.chave > outro.chave
+
+    def __le__(self, outro):
+        return self.chave <= outro.chave
+
+    def __ge__(self, outro):
+        return self.chave >= outro.chave
+
+# Chaves aleatórias, com muitas duplicatas ou em ordem decrescente
+def gerar_chaves(rng, tipo, n):
+    if tipo == 'aleatoria':
+        return [rng.randrange(10 ** 6) for _ in range(n)]
+    if tipo == 'duplicatas':
+        return [rng.randrange(5) for _ in range(n)]
+    return [(n - i) // 3 for i in range(n)]
+
+def gerar_registros(rng, tipo, n):
+    return [Registro(c, i) for i, c in enumerate(gerar_chaves(rng, tipo, n))]
+
+# Compara com sorted() (estável) pela identidade de cada registro
+def conferir(resultado, original):
+    esperado = sorted(original, key=lambda r: r.chave)
+    assert [r.posicao for r in resultado] == [r.posicao for r in esperado]
+
+TIPOS = ['aleatoria', 'duplicatas', 'decrescente']
+TAMANHOS = [0, 1, 2, 31, 65, 1000, 5000]
+
+@pytest.mark.parametrize('tipo', TIPOS)
+def test_mergesort_natural(tipo):
+    rng = random.Random(0)
+    for n in TAMANHOS:
+        registros = gerar_registros(rng, tipo, n)
+        arr = registros.copy()
+        mergesort_natural(arr)
+        conferir(arr, registros)
+
+# Runs com trechos longos vencidos por um só lado forçam o modo galope
+@pytest.mark.parametrize('tipo', TIPOS + ['blocos'])
+def test_merge_galope(tipo):
+    rng = random.Random(1)
+    for n1, n2 in [(1, 1), (5, 300), (300, 5), (700, 900)]:
+        if tipo == 'blocos':
+            chaves = [rng.randrange(10) * 100 + rng.randrange(3) for _ in range(n1 + n2)]
+        else:
+            chaves = gerar_chaves(rng, tipo, n1 + n2)
+        esquerda = sorted(chaves[:n1])
+        direita = sorted(chaves[n1:])
+        registros = [Registro(c, i) for i, c in enumerate(esquerda + direita)]
+        arr = registros.copy()
+        min_galope = merge_galope(arr, 0, n1, n1 + n2, MIN_GALOPE)
+        assert min_galope >= 1
+        conferir(arr, registros)
+
+@pytest.mark.parametrize('tipo', TIPOS)
+@pytest.mark.parametrize('tamanho_buffer', [None, 1, 4])
+def test_mergesort_in_place(tipo, tamanho_buffer):
+    rng = random.Random(2)
+    for n in TAMANHOS:
+        registros = gerar_registros(rng, tipo, n)
+        arr = registros.copy()
+        mergesort_in_place(arr, tamanho_buffer)
+        conferir(arr, registros)
+
+# Buffers menores que os dois lados forçam a divisão por rotação
+@pytest.mark.parametrize('tipo', TIPOS)
+@pytest.mark.parametrize('tamanho_buffer', [1, 3, 64])
+def test_merge_in_place(tipo, tamanho_buffer):
+    rng = random.Random(3)
+    for n1, n2 in [(1, 1), (2, 50), (50, 2), (300, 400)]:
+        chaves = gerar_chaves(rng, tipo, n1 + n2)
+        registros = [Registro(c, i) for i, c in enumerate(sorted(chaves[:n1]) + sorted(chaves[n1:]))]
+        arr = registros.copy()
+        merge_in_place(arr, 0, n1, n1 + n2, [None] * tamanho_buffer)
+        conferir(arr, registros)
+
+@pytest.mark.parametrize('tamanho_bloco', [1, 2, 5, 100])
+def test_rotacionar(tamanho_bloco):
+    for n in range(12):
+        for meio in range(n + 1):
+            arr = list(range(n))
+            assert rotacionar(arr, 0, meio, n, tamanho_bloco) == n - meio
+            assert arr == list(range(meio, n)) + list(range(meio))
+    # Só o trecho [inicio, fim) é rotacionado
+    arr = list(range(20))
+    assert rotacionar(arr, 3, 8, 15, 2) == 10
+    assert arr == [0, 1, 2] + list(range(8, 15)) + list(range(3, 8)) + list(range(15, 20))
+
+# Registra qual motor ordenar_inteiros escolheu, sem mudar o resultado
+@pytest.fixture
+def motores_usados(monkeypatch):
+    usados = []
+    for nome in ('counting_sort', 'radix_sort_lsd', 'mergesort_natural'):
+        original = getattr(mergesort_python, nome)
+        def registrar(*args, _nome=nome, _original=original):
+            usados.append(_nome)
+            return _original(*args)
+        monkeypatch.setattr(mergesort_python, nome, registrar)
+    return usados
+
+@pytest.mark.parametrize('gerar, motor', [
+    # Intervalo pequeno (até FATOR_CONTAGEM * n), com negativos
+    (lambda rng: [rng.randint(-200, 200) for _ in range(1000)], 'counting_sort'),
+    (lambda rng: [-7, -8] * 500, 'counting_sort'),
+    # Intervalo limitado e n grande o bastante para encher os baldes
+    (lambda rng: [rng.randint(-2 ** 20, 2 ** 20) for _ in range(20000)], 'radix_sort_lsd'),
+    # Intervalo grande demais para o radix
+    (lambda rng: [rng.randint(-10 ** 12, 10 ** 12) for _ in range(1000)], 'mergesort_natural'),
+    # Quase ordenada ou decrescente: runs longos
+    (lambda rng: list(range(-500, 500)), 'mergesort_natural'),
+    (lambda rng: list(range(500, -500, -1)), 'mergesort_natural'),
+    # Tipos que não são só int
+    (lambda rng: [rng.randint(0, 9) for _ in range(999)] + [True], 'mergesort_natural'),
+    (lambda rng: [rng.random() - 0.5 for _ in range(1000)], 'mergesort_natural'),
+])
+def test_ordenar_inteiros(motores_usados, gerar, motor):
+    arr = gerar(random.Random(4))
+    esperado = sorted(arr)
+    ordenar_inteiros(arr)
+    assert arr == esperado
+    assert motores_usados[0] == motor
+
+@pytest.mark.parametrize('minimo, maximo', [(0, 0), (-5, 5), (-2 ** 40, -2 ** 39), (0, 2 ** 33)])
+def test_counting_e_radix(minimo, maximo):
+    rng = random.Random(5)
+    arr = [rng.randint(minimo, maximo) for _ in range(3000)]
+    esperado = sorted(arr)
+    if maximo - minimo <= 10:
+        copia = arr.copy()
+        counting_sort(copia, minimo, maximo)
+        assert copia == esperado
+    radix_sort_lsd(arr, min(arr), max(arr))
+    assert arr == esperado
+
+@pytest.mark.parametrize('tipo', TIPOS)
+@pytest.mark.parametrize('reverse', [False, True])
+def test_argsort(tipo, reverse):
+    rng = random.Random(6)
+    for n in TAMANHOS:
+        registros = gerar_chaves(rng, tipo, n)
+        # sorted() sobre range mantém os índices de chaves iguais em ordem crescente
+        esperado = sorted(range(n), key=registros.__getitem__, reverse=reverse)
+        assert argsort(registros, reverse=reverse) == esperado
+        pares = [(c, i) for i, c in enumerate(registros)]
+        assert ordenar(pares, key=lambda p: p[0], reverse=reverse) == [pares[i] for i in esperado]
+
+@pytest.mark.parametrize('reverso', [None, [False, True], [True, False], [True, True]])
+def test_chave_composta(reverso):
+    rng = random.Random(7)
+    registros = [(rng.randint(-3, 3), rng.randint(-10 ** 9, 10 ** 9) if rng.random() < 0.5
+                  else rng.randint(0, 2), i) for i in range(2000)]
+    chaves = chave_composta(registros, [lambda r: r[0], lambda r: r[1]], reverso)
+    sinais = [-1 if r else 1 for r in (reverso or [False, False])]
+    esperado = sorted(registros, key=lambda r: (sinais[0] * r[0], sinais[1] * r[1]))
+    assert [registros[i] for i in argsort(chaves)] == esperado
+
+def test_chave_composta_nao_inteira():
+    registros = [('b', 1.5), ('a', 2.0), ('b', 0.5)]
+    chaves = chave_composta(registros, [lambda r: r[0], lambda r: r[1]])
+    assert [registros[i] for i in argsort(chaves)] == sorted(registros)
+    with pytest.raises(ValueError):
+        chave_composta(registros, [lambda r: r[0]], [True])
+
+# Registro que conta as comparações feitas pelo motor sem instrumentação
+class RegistroContado(Registro):
+    comparacoes = 0
+
+    def __lt__(self, outro):
+        RegistroContado.comparacoes += 1
+        return self.chave < outro.chave
+
+    def __gt__(self, outro):
+        RegistroContado.comparacoes += 1
+        return self.chave > outro.chave
+
+    def __le__(self, outro):
+        RegistroContado.comparacoes += 1
+        return self.chave <= outro.chave
+
+# As versões instrumentadas fazem exatamente as comparações do motor normal
+@pytest.mark.parametrize('motor', ['natural', 'in_place'])
+@pytest.mark.parametrize('tipo', TIPOS)
+def test_contadores(motor, tipo):
+    rng = random.Random(8)
+    for n in TAMANHOS:
+        chaves = gerar_chaves(rng, tipo, n)
+        registros = [RegistroContado(c, i) for i, c in enumerate(chaves)]
+        RegistroContado.comparacoes = 0
+        MOTORES[motor](registros)
+        operacoes = contar_operacoes(chaves, motor)
+        assert operacoes['comparacoes'] == RegistroContado.comparacoes
+        if chaves != sorted(chaves):
+            assert operacoes['movimentos'] > 0
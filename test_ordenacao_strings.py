@@ -0,0 +1,30 @@
+import random
+
+import pytest
+
+from ordenacao_strings import calcular_lcp, mergesort_lcp
+
+# Listas com prefixo comum, bytes nulos (iguais ao preenchimento das chaves),
+# strings que são prefixo umas das outras e caracteres não ASCII
+def gerar_valores(rng, alfabeto, prefixo, n):
+    return [prefixo + prefixo[:0].join(rng.choice(alfabeto) for _ in range(rng.randint(0, 40)))
+            for _ in range(n)]
+
+@pytest.mark.parametrize('alfabeto, prefixo', [
+    ('ab\0', ''),
+    ('ab\0', 'https://www.'),
+    ('abé', '/home/'),
+    (b'ab\0\xff', b''),
+    (b'ab\0\xff', b'/home/usuario/'),
+])
+def test_mergesort_lcp(alfabeto, prefixo):
+    rng = random.Random(0)
+    alfabeto = [alfabeto[i:i + 1] for i in range(len(alfabeto))]
+    for n in (1, 31, 33, 500):
+        valores = gerar_valores(rng, alfabeto, prefixo, n)
+        saida, lcps = mergesort_lcp(valores)
+        esperado = sorted(valores)
+        assert saida == esperado
+        # Estável: iguais na ordem original
+        assert [id(v) for v in saida] == [id(v) for v in esperado]
+        assert lcps == [0] + [calcular_lcp(saida[i - 1], saida[i]) for i in range(1, n)]
@@ -0,0 +1,241 @@
+import os
+import math
+import glob
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from gerar_entradas import GRUPOS_ENTRADAS, SEMENTE_PADRAO, semente_arquivo
+from mergesort_python import MOTORES, MOTORES_NUMPY, medir_tempo_execucao
+
+# Faixa da varredura: tamanhos em escala logarítmica de 10^3 a 10^8
+TAMANHO_MINIMO = 10 ** 3
+TAMANHO_MAXIMO = 10 ** 8
+PONTOS_POR_DECADA = 4
+
+# Bytes por elemento no pico (vetor gerado, cópia medida e buffers do merge);
+# listas pagam também os objetos int do Python
+BYTES_PICO = {'lista': 96, 'numpy': 32}
+
+# Bytes por elemento efetivamente percorridos pela ordenação (vetor + buffer),
+# usados para localizar a entrada na hierarquia de memória
+BYTES_TRABALHO = {'lista': 48, 'numpy': 16}
+
+# Fração da memória disponível que a varredura pode usar
+FRACAO_MEMORIA = 0.5
+
+# Aumento relativo do custo por n·log2 n, entre tamanhos vizinhos, marcado como queda de vazão
+LIMIAR_QUEDA = 0.15
+
+# Tamanhos inteiros espaçados em escala logarítmica, sem repetições
+def tamanhos_log(minimo=TAMANHO_MINIMO, maximo=TAMANHO_MAXIMO, pontos_por_decada=PONTOS_POR_DECADA):
+    decadas = math.log10(maximo / minimo)
+    pontos = max(2, round(decadas * pontos_por_decada) + 1)
+    return sorted(set(int(round(t)) for t in np.geomspace(minimo, maximo, pontos)))
+
+# Memória disponível em bytes (MemAvailable no Linux), ou None se desconhecida
+def memoria_disponivel():
+    try:
+        with open('/proc/meminfo') as f:
+            for linha in f:
+                if linha.startswith('MemAvailable:'):
+                    return int(linha.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (ValueError, OSError, AttributeError):
+        return None
+
+# Tamanhos das caches de dados da CPU 0, como {'L1': bytes, 'L2': bytes, ...};
+# vazio fora do Linux
+def tamanhos_caches():
+    caches = {}
+    for indice in glob.glob('/sys/devices/system/cpu/cpu0/cache/index*'):
+        try:
+            with open(os.path.join(indice, 'type')) as f:
+                tipo = f.read().strip()
+            with open(os.path.join(indice, 'level')) as f:
+                nivel = f'L{f.read().strip()}'
+            with open(os.path.join(indice, 'size')) as f:
+                tamanho = f.read().strip()
+        except OSError:
+            continue
+        if tipo == 'Instruction':
+            continue
+        multiplicador = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}.get(tamanho[-1], 1)
+        caches[nivel] = int(tamanho.rstrip('KMG')) * multiplicador
+    return dict(sorted(caches.items(), key=lambda item: item[1]))
+
+# Primeiro nível da hierarquia em que cabem bytes_trabalho bytes
+def nivel_memoria(bytes_trabalho, caches):
+    for nivel, tamanho in caches.items():
+        if bytes_trabalho <= tamanho:
+            return nivel
+    return 'RAM'
+
+# Ajusta tempo ≈ a·n·log2 n + b·n + c por mínimos quadrados, ponderando cada
+# ponto por 1/tempo (erro relativo), para que os tamanhos grandes não dominem.
+# Usa sempre menos termos que pontos (com três tamanhos, só a e b), e os
+# coeficientes não podem ser negativos: o termo mais negativo sai do ajuste,
+# que é refeito com os demais. Retorna {'a', 'b', 'c', 'residuos'} com os
+# coeficientes em segundos e os resíduos relativos (ajuste / medido - 1) na
+# ordem dos pontos; residuos é None se o ajuste passa exatamente pelos pontos
+def ajustar_complexidade(tamanhos, tempos):
+    n = np.asarray(tamanhos, dtype=float)
+    t = np.asarray(tempos, dtype=float)
+    termos = np.column_stack([n * np.log2(n), n, np.ones_like(n)]) / t[:, None]
+    ativos = list(range(min(3, max(1, len(n) - 1))))
+    coeficientes = np.zeros(3)
+    while ativos:
+        solucao = np.linalg.lstsq(termos[:, ativos], np.ones_like(t), rcond=None)[0]
+        if np.all(solucao >= 0):
+            coeficientes[ativos] = solucao
+            break
+        del ativos[int(np.argmin(solucao))]
+    ajuste = {'a': coeficientes[0], 'b': coeficientes[1], 'c': coeficientes[2]}
+    sobredeterminado = len(ativos) < len(n)
+    ajuste['residuos'] = avaliar_ajuste(ajuste, n) / t - 1 if sobredeterminado else None
+    return ajuste
+
+# Tempo previsto pelo ajuste para os tamanhos dados
+def avaliar_ajuste(ajuste, tamanhos):
+    n = np.asarray(tamanhos, dtype=float)
+    return ajuste['a'] * n * np.log2(n) + ajuste['b'] * n + ajuste['c']
+
+# Mede cada motor em cada tipo de entrada nos tamanhos dados. Um motor deixa de
+# crescer em um tipo quando o tempo previsto para o próximo tamanho passa de
+# tempo_maximo ou quando a memória estimada não cabe em memoria_maxima
+def varrer(motores, tipos, tamanhos, num_execucoes=3, tempo_maximo=60.0,
+           memoria_maxima=None, semente=SEMENTE_PADRAO):
+    caches = tamanhos_caches()
+    resultados = []
+    for tipo, gerador in tipos:
+        # Último (tamanho, tempo) medido de cada motor ainda ativo neste tipo
+        ultimos = {motor: None for motor in motores}
+        for tamanho in tamanhos:
+            ativos = []
+            for motor in ultimos:
+                representacao = 'numpy' if motor in MOTORES_NUMPY else 'lista'
+                if memoria_maxima is not None and BYTES_PICO[representacao] * tamanho > memoria_maxima:
+                    continue
+                if ultimos[motor] is not None:
+                    tamanho_anterior, tempo_anterior = ultimos[motor]
+                    previsto = tempo_anterior * (tamanho * math.log2(tamanho)) / (
+                        tamanho_anterior * math.log2(tamanho_anterior))
+                    if previsto * num_execucoes > tempo_maximo:
+                        continue
+                ativos.append(motor)
+            if not ativos:
+                break
+
+            # Mesma semente dos arquivos de gerar_entradas.py
+            vetor = np.concatenate(list(gerador(tamanho, semente_arquivo(semente, tamanho, tipo))))
+            for motor in ativos:
+                stats = medir_tempo_execucao(vetor, num_execucoes, motor)
+                mediana = stats['mediana']
+                ultimos[motor] = (tamanho, mediana)
+                representacao = 'numpy' if motor in MOTORES_NUMPY else 'lista'
+                bytes_trabalho = BYTES_TRABALHO[representacao] * tamanho
+                resultados.append({
+                    'Motor': motor,
+                    'Tipo': tipo,
+                    'Tamanho': tamanho,
+                    'Mediana_Tempo(s)': mediana,
+                    'Ns_Por_Elemento': mediana / tamanho * 1e9,
+                    'Ns_Por_NLogN': mediana / (tamanho * math.log2(tamanho)) * 1e9,
+                    'Bytes_Trabalho': bytes_trabalho,
+                    'Nivel_Memoria': nivel_memoria(bytes_trabalho, caches)
+                })
+                print(f"[{motor}] {tipo} n={tamanho}: {mediana:.4f} s "
+                      f"({resultados[-1]['Ns_Por_Elemento']:.1f} ns/elemento, {resultados[-1]['Nivel_Memoria']})")
+            del vetor
+    return pd.DataFrame(resultados)
+
+# Ajusta o modelo para cada (motor, tipo), acrescenta a df o tempo previsto, o
+# resíduo e as quedas de vazão, e retorna a tabela de constantes ajustadas
+def ajustar_varredura(df):
+    df['Ajuste_Tempo(s)'] = np.nan
+    df['Residuo(%)'] = np.nan
+    df['Queda_Vazao'] = False
+    df['Transicao'] = ''
+    constantes = []
+    for (motor, tipo), dados in df.groupby(['Motor', 'Tipo']):
+        dados = dados.sort_values('Tamanho')
+        ajuste = ajustar_complexidade(dados['Tamanho'], dados['Mediana_Tempo(s)'])
+        df.loc[dados.index, 'Ajuste_Tempo(s)'] = avaliar_ajuste(ajuste, dados['Tamanho'])
+        if ajuste['residuos'] is not None:
+            df.loc[dados.index, 'Residuo(%)'] = ajuste['residuos'] * 100
+
+        # Queda de vazão: o custo por n·log2 n sobe mais que LIMIAR_QUEDA em
+        # relação ao tamanho anterior
+        custo = dados['Ns_Por_NLogN'].to_numpy()
+        niveis = dados['Nivel_Memoria'].to_numpy()
+        for i in range(1, len(dados)):
+            if custo[i] > custo[i - 1] * (1 + LIMIAR_QUEDA):
+                indice = dados.index[i]
+                df.loc[indice, 'Queda_Vazao'] = True
+                if niveis[i] != niveis[i - 1]:
+                    df.loc[indice, 'Transicao'] = f'{niveis[i - 1]}->{niveis[i]}'
+
+        constantes.append({
+            'Motor': motor,
+            'Tipo': tipo,
+            'Pontos': len(dados),
+            'Tamanho_Maximo': dados['Tamanho'].max(),
+            'a(ns)': ajuste['a'] * 1e9,
+            'b(ns)': ajuste['b'] * 1e9,
+            'c(ns)': ajuste['c'] * 1e9,
+            'Residuo_Max(%)': (np.abs(ajuste['residuos']).max() * 100
+                               if ajuste['residuos'] is not None else np.nan)
+        })
+    return pd.DataFrame(constantes)
+
+def main():
+    parser = argparse.ArgumentParser(description='Varredura de escala: ajusta a·n·log2 n + b·n + c por motor e tipo de entrada.')
+    parser.add_argument('--motores', nargs='+', choices=list(MOTORES), default=['recursivo'],
+                        help='Motores de ordenação a medir')
+    parser.add_argument('--grupos', nargs='+', choices=list(GRUPOS_ENTRADAS), default=['classicas'],
+                        help='Grupos de famílias de entrada de gerar_entradas.py')
+    parser.add_argument('--tamanho-minimo', type=int, default=TAMANHO_MINIMO)
+    parser.add_argument('--tamanho-maximo', type=int, default=TAMANHO_MAXIMO)
+    parser.add_argument('--pontos-por-decada', type=int, default=PONTOS_POR_DECADA)
+    parser.add_argument('--execucoes', type=int, default=3,
+                        help='Execuções por tamanho (usa a mediana)')
+    parser.add_argument('--tempo-maximo', type=float, default=60.0,
+                        help='Tempo máximo (s) de todas as execuções de um tamanho')
+    parser.add_argument('--semente', type=int, default=SEMENTE_PADRAO)
+    args = parser.parse_args()
+
+    memoria = memoria_disponivel()
+    memoria_maxima = memoria * FRACAO_MEMORIA if memoria else None
+    caches = tamanhos_caches()
+    if caches:
+        print("Caches:", ', '.join(f'{nivel} {tamanho // 1024} KiB' for nivel, tamanho in caches.items()))
+
+    tipos = [tipo for grupo in args.grupos for tipo in GRUPOS_ENTRADAS[grupo]]
+    tamanhos = tamanhos_log(args.tamanho_minimo, args.tamanho_maximo, args.pontos_por_decada)
+    df = varrer(args.motores, tipos, tamanhos, args.execucoes, args.tempo_maximo,
+                memoria_maxima, args.semente)
+    if df.empty:
+        print("Nenhum tamanho medido")
+        return
+
+    constantes = ajustar_varredura(df)
+    df.to_csv('varredura_escala_python.csv', index=False)
+    constantes.to_csv('ajuste_escala_python.csv', index=False)
+
+    print("\nAjuste tempo = a·n·log2 n + b·n + c")
+    print(constantes.to_string(index=False, float_format=lambda v: f'{v:.3f}'))
+    quedas = df[df['Queda_Vazao']]
+    if not quedas.empty:
+        print("\nQuedas de vazão (custo por n·log2 n subiu mais de "
+              f"{LIMIAR_QUEDA:.0%} em relação ao tamanho anterior):")
+        for linha in quedas.itertuples():
+            transicao = f" ({linha.Transicao})" if linha.Transicao else ''
+            print(f"  [{linha.Motor}] {linha.Tipo} n={linha.Tamanho}{transicao}")
+    print("\nResultados salvos em varredura_escala_python.csv e ajuste_escala_python.csv")
+
+if __name__ == '__main__':
+    main()